@@ -0,0 +1,74 @@
+"""Benchmark for :func:`fantraxapi.api.request_batched` tuning parameters.
+
+Sends ``--teams`` STATS + SCHEDULE_FULL roster pairs through a fake Session whose latency grows with the size of the
+response, for every combination of ``--messages``, ``--bytes`` and ``--workers``.
+
+    python benchmarks/bench_batch_planner.py --teams 30 --messages 2 4 10 60 --bytes 500000 2000000 --workers 1 4 8
+"""
+
+import argparse
+import json
+import sys
+import time
+from itertools import product
+from os.path import abspath, dirname
+from types import SimpleNamespace
+
+from requests import Response
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import api  # noqa: E402
+from fantraxapi.api import Method  # noqa: E402
+
+
+class FakeSession:
+    def __init__(self, base_latency: float, bytes_per_second: float) -> None:
+        self.base_latency = base_latency
+        self.bytes_per_second = bytes_per_second
+        self.posts = 0
+
+    def post(self, url: str, params: dict | None = None, json: dict | None = None) -> Response:
+        self.posts += 1
+        size = sum(Method(m["method"], **m["data"]).expected_bytes for m in json["msgs"])
+        time.sleep(self.base_latency + size / self.bytes_per_second)
+        response = Response()
+        response.status_code = 200
+        response._content = _payload(json["msgs"])
+        return response
+
+
+def _payload(msgs: list[dict]) -> bytes:
+    return json.dumps({"responses": [{"data": {"method": m["method"], "params": m["data"]}} for m in msgs]}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--messages", type=int, nargs="+", default=[2, 4, 10, 60])
+    parser.add_argument("--bytes", type=int, nargs="+", default=[500_000, 2_000_000, 100_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.15, help="Fixed seconds per POST.")
+    parser.add_argument("--bandwidth", type=float, default=5_000_000, help="Simulated response bytes per second.")
+    args = parser.parse_args()
+
+    methods = []
+    for team in range(args.teams):
+        methods.append(Method("getTeamRosterInfo", teamId=f"team{team}", view="STATS"))
+        methods.append(Method("getTeamRosterInfo", teamId=f"team{team}", view="SCHEDULE_FULL"))
+    methods.extend(methods[:4])
+
+    print(f"{len(methods)} Methods ({len(methods) - 4} unique)")
+    print(f"{'messages':>10} {'bytes':>12} {'workers':>8} {'posts':>6} {'seconds':>8}")
+    for max_messages, max_bytes, workers in product(args.messages, args.bytes, args.workers):
+        session = FakeSession(args.latency, args.bandwidth)
+        league = SimpleNamespace(league_id="benchmark", session=session)
+        start = time.perf_counter()
+        responses = api.request_batched(league, methods, max_messages=max_messages, max_response_bytes=max_bytes, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert [r["params"]["teamId"] for r in responses] == [m.kwargs["teamId"] for m in methods]
+        print(f"{max_messages:>10} {max_bytes:>12} {workers:>8} {session.posts:>6} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark of :func:`fantraxapi.bulk.bulk_parse` across worker counts on a synthetic season of roster and live responses.
+
+Compares parsing every response through League methods in one process with parsing them across a process pool:
+
+    python benchmarks/bench_bulk_parse.py --teams 12 --days 60 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import League  # noqa: E402
+from fantraxapi.bulk import build, bulk_parse  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, SyntheticSession  # noqa: E402
+from fantraxapi.replay import MemoryStore, ReplaySession  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=26)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--chunksize", type=int, default=8)
+    args = parser.parse_args()
+
+    generator = LeagueGenerator(teams=args.teams, roster_size=args.roster_size)
+    store = MemoryStore()
+    league = League(generator.league_id, session=SyntheticSession(generator, store=store))
+    days = sorted(league.scoring_dates)[: args.days]
+    for day in days:
+        league.live_scores(league.scoring_dates[day])
+        for team in league.teams:
+            league.team_roster(team.id, period_number=day)
+    print(f"{len(store.keys())} responses, {sum(len(store.get(k).content) for k in store.keys()) / 2**20:.1f} MiB")
+
+    replay = League(generator.league_id, session=ReplaySession(store))
+    start = time.perf_counter()
+    for day in days:
+        replay.live_scores(replay.scoring_dates[day])
+        for team in replay.teams:
+            replay.team_roster(team.id, period_number=day)
+    print(f"{'League methods':<24} {time.perf_counter() - start:>8.2f}s  (decode + parse + build in one process)")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        parsed = bulk_parse(store, leagues=league, max_workers=workers, chunksize=args.chunksize)
+        parse_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for result in parsed:
+            build(league, result)
+        build_time = time.perf_counter() - start
+        print(f"{f'bulk_parse workers={workers}':<24} {parse_time:>8.2f}s  build {build_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compares building column arrays through Roster and LivePlayer objects with :mod:`fantraxapi.columns`.
+
+Replays a synthetic season of roster and live scoring responses both ways:
+
+    python benchmarks/bench_columns.py --teams 12 --days 60
+"""
+
+import argparse
+import sys
+import time
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import League, columns  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, SyntheticSession  # noqa: E402
+from fantraxapi.replay import MemoryStore, ReplaySession  # noqa: E402
+
+
+def from_objects(league: League, days: list[int]) -> dict[str, list]:
+    output = {"player_id": [], "team_id": [], "position_id": [], "date": [], "total_fantasy_points": [], "fantasy_points_per_game": []}
+    for day in days:
+        for team in league.teams:
+            roster = league.team_roster(team.id, period_number=day)
+            for row in roster.rows:
+                output["player_id"].append(row.player.id if row.player else None)
+                output["team_id"].append(team.id)
+                output["position_id"].append(row.position.id)
+                output["date"].append(roster.period_date)
+                output["total_fantasy_points"].append(row.total_fantasy_points)
+                output["fantasy_points_per_game"].append(row.fantasy_points_per_game)
+        for team_id, players in league.live_scores(league.scoring_dates[day]).items():
+            for player in players:
+                player.points, player.points_date, player.id, team_id  # noqa: B018
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=26)
+    parser.add_argument("--days", type=int, default=60)
+    args = parser.parse_args()
+
+    generator = LeagueGenerator(teams=args.teams, roster_size=args.roster_size)
+    store = MemoryStore()
+    warm = League(generator.league_id, session=SyntheticSession(generator, store=store))
+    days = sorted(warm.scoring_dates)[: args.days]
+    columns.rosters(warm, period_numbers=days)
+    columns.live_scores(warm, [warm.scoring_dates[d] for d in days])
+
+    league = League(generator.league_id, session=ReplaySession(store))
+    start = time.perf_counter()
+    from_objects(league, days)
+    print(f"{'objects':<10} {time.perf_counter() - start:>7.2f}s")
+    start = time.perf_counter()
+    table = columns.rosters(league, period_numbers=days)
+    live = columns.live_scores(league, [league.scoring_dates[d] for d in days])
+    print(f"{'columns':<10} {time.perf_counter() - start:>7.2f}s  ({len(table)} roster rows, {len(live)} live rows)")
+
+
+if __name__ == "__main__":
+    main()
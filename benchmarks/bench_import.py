@@ -0,0 +1,62 @@
+"""Benchmark for the cold import time of fantraxapi.
+
+Runs each import statement in a fresh interpreter several times and reports the best wall time, the modules it loaded
+and whether requests was imported. ``--max-ms`` fails when ``import fantraxapi`` is slower than the limit.
+
+    python benchmarks/bench_import.py --repeat 10 --max-ms 30
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from os.path import abspath, dirname
+
+root = dirname(dirname(abspath(__file__)))
+
+statements = [
+    "import fantraxapi",
+    "from fantraxapi import NotLoggedIn",
+    "from fantraxapi import League",
+    "from fantraxapi.objs import Roster",
+    "from fantraxapi import api; api.default_session",
+]
+
+script = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({{"elapsed": elapsed, "modules": len(loaded), "requests": "requests" in loaded}}))
+"""
+
+
+def time_import(statement: str, repeat: int) -> dict:
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script.format(statement=statement)], cwd=root, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output)
+        if best is None or result["elapsed"] < best["elapsed"]:
+            best = result
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    print(f"{'statement':<50} {'time':>10} {'modules':>8} {'requests':>9}")
+    results = {}
+    for statement in statements:
+        results[statement] = result = time_import(statement, args.repeat)
+        print(f"{statement:<50} {result['elapsed'] * 1e3:>8.2f}ms {result['modules']:>8} {'yes' if result['requests'] else 'no':>9}")
+    if args.max_ms is not None and results[statements[0]]["elapsed"] * 1e3 > args.max_ms:
+        sys.exit(f"import fantraxapi took longer than {args.max_ms}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark for :func:`fantraxapi.api.loads` with and without orjson.
+
+Decodes each raw ``/fxpa/req`` response file given on the command line (or a synthetic live scoring sized payload when
+none are given) with the built-in json module and with orjson when it's installed.
+
+    python benchmarks/bench_json_decode.py responses/*.json --repeat 20
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from os.path import abspath, basename, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import api  # noqa: E402
+
+
+def synthetic_payload(players: int = 6000) -> bytes:
+    rng = random.Random(0)
+    scorers = {}
+    for i in range(players):
+        scorer_id = f"0{i:04x}"
+        scorers[scorer_id] = {
+            "scorer": {
+                "scorerId": scorer_id,
+                "name": f"Player {i}",
+                "shortName": f"P. {i}",
+                "teamName": "Team",
+                "teamShortName": "TM",
+                "posShortNames": "C",
+                "posIdsNoFlex": ["206"],
+                "posIds": ["206", "208"],
+                "icons": [],
+            },
+            "stats": [round(rng.random() * 10, 1) for _ in range(20)],
+        }
+    return json.dumps({"responses": [{"data": {"scorerMap": scorers}}]}).encode()
+
+
+def time_decode(content: bytes, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        api.loads(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    payloads = []
+    for file in args.files:
+        with open(file, "rb") as f:
+            payloads.append((basename(file), f.read()))
+    if not payloads:
+        payloads.append(("synthetic", synthetic_payload()))
+
+    decoders = [False, True] if api.orjson is not None else [False]
+    print(f"{'payload':<40} {'bytes':>10} " + " ".join(f"{'orjson' if d else 'json':>10}" for d in decoders))
+    for name, content in payloads:
+        times = []
+        for fast in decoders:
+            api.fast_json = fast
+            times.append(time_decode(content, args.repeat))
+        print(f"{name:<40} {len(content):>10} " + " ".join(f"{t * 1e3:>8.2f}ms" for t in times))
+    api.fast_json = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""End to end benchmark of every public League method over recorded or synthetic responses.
+
+Time a synthetic league built by :class:`fantraxapi.mock.LeagueGenerator`:
+
+    python benchmarks/bench_league.py run --synthetic --teams 30 --roster-size 30
+
+Or record the responses of a real league once (needs network access):
+
+    python benchmarks/bench_league.py record --league 96igs4677sgjk7ol --fixtures fixtures/96igs4677sgjk7ol
+
+Then time every League method offline (decode + object build), save a baseline and compare later runs with it:
+
+    python benchmarks/bench_league.py run --league 96igs4677sgjk7ol --fixtures fixtures/96igs4677sgjk7ol --baseline baselines.json --save-baseline
+    python benchmarks/bench_league.py run --league 96igs4677sgjk7ol --fixtures fixtures/96igs4677sgjk7ol --baseline baselines.json
+
+Each method's time is the fastest of ``--repeat`` runs. Baselines are machine specific so none are stored in the repository
+and runs are only compared when ``--baseline`` is given. A method regresses when it's slower than its baseline by more than
+``--threshold`` plus the spread between its own runs and by more than ``--min-delta`` seconds, so noise in sub-millisecond
+methods doesn't fail the run. ``run`` exits with status 1 when any method raises, like when a recorded response is missing,
+or regresses.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from os.path import abspath, dirname
+
+from requests import Session
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import FantraxException, League  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, SyntheticSession  # noqa: E402
+from fantraxapi.replay import DirectoryStore, MemoryStore, RecordingSession, ReplaySession  # noqa: E402
+
+
+def scenario(league_id: str, session: Session) -> list[tuple[str, Callable]]:
+    league = League(league_id, session=session)
+    team = league.teams[0]
+    last_period = max(league.scoring_periods)
+    last_day = max(league.scoring_dates)
+    return [
+        ("League.__init__", lambda: League(league_id, session=session)),
+        ("League.scoring_period_results", league.scoring_period_results),
+        ("League.standings", league.standings),
+        ("League.standings(period)", lambda: league.standings(scoring_period_number=last_period)),
+        ("League.pending_trades", league.pending_trades),
+        ("League.trade_block", league.trade_block),
+        ("League.transactions", league.transactions),
+        ("League.position_counts", lambda: league.position_counts(team.id)),
+        ("League.live_scores", lambda: league.live_scores(league.scoring_dates[last_day])),
+        ("League.team_roster", lambda: league.team_roster(team.id, period_number=last_day)),
+    ]
+
+
+def _call(func: Callable) -> FantraxException | None:
+    try:
+        func()
+    except FantraxException as e:
+        return e
+    return None
+
+
+def generator(args: argparse.Namespace) -> LeagueGenerator:
+    return LeagueGenerator(teams=args.teams, roster_size=args.roster_size, periods=args.periods, transactions=args.transactions, league_id=args.league)
+
+
+def record(args: argparse.Namespace) -> None:
+    # Every step runs twice so repeated calls that send different requests, like pending trades once the login is known, are recorded too.
+    session = SyntheticSession(generator(args), store=args.fixtures) if args.synthetic else RecordingSession(args.fixtures)
+    for name, func in scenario(args.league, session):
+        if error := _call(func) or _call(func):
+            print(f"Failed {name}: {error}")
+        else:
+            print(f"Recorded {name}")
+
+
+def run(args: argparse.Namespace) -> int:
+    if args.synthetic:
+        store = MemoryStore()
+        for _, func in scenario(args.league, SyntheticSession(generator(args), store=store)):
+            _call(func) or _call(func)
+    else:
+        store = MemoryStore(DirectoryStore(args.fixtures))
+    results = {}
+    spreads = {}
+    errors = {}
+    for name, func in scenario(args.league, ReplaySession(store)):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            if error := _call(func):
+                errors[name] = error
+                break
+            times.append(time.perf_counter() - start)
+        else:
+            results[name] = min(times)
+            spreads[name] = statistics.median(times) / results[name] - 1
+
+    baselines = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baselines = json.load(f).get(args.name, {})
+
+    failed = bool(errors)
+    print(f"{'method':<35} {'best':>10} {'baseline':>10} {'change':>8}")
+    for name, error in errors.items():
+        print(f"{name:<35} {'ERROR':>10} {error}")
+    for name, seconds in results.items():
+        line = f"{name:<35} {seconds * 1e3:>8.2f}ms"
+        if name in baselines:
+            change = seconds / baselines[name] - 1
+            regressed = change > args.threshold + spreads[name] and seconds - baselines[name] > args.min_delta
+            failed = failed or regressed
+            line += f" {baselines[name] * 1e3:>8.2f}ms {change:>+7.0%}{' REGRESSION' if regressed else ''}"
+        print(line)
+
+    if args.save_baseline and errors:
+        print(f"Not saving baseline {args.name}, {len(errors)} methods failed")
+    elif args.save_baseline:
+        stored = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        stored[args.name] = results
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"Saved baseline {args.name} to {args.baseline}")
+        return 0
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["record", "run"])
+    parser.add_argument("--league", default="synthetic", help="League ID the fixtures belong to.")
+    parser.add_argument("--fixtures", help="Fixture directory.")
+    parser.add_argument("--synthetic", action="store_true", help="Use a synthetic league instead of recorded responses.")
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=20)
+    parser.add_argument("--periods", type=int, default=25)
+    parser.add_argument("--transactions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--baseline", help="Baseline file to compare with or save to.")
+    parser.add_argument("--name", help="Name of the baseline set inside the baseline file, defaults to synthetic or recorded.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before failing, 0.25 is 25%%.")
+    parser.add_argument("--min-delta", type=float, default=0.001, help="Seconds a method has to be slower by before failing.")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+    if not args.synthetic and not args.fixtures:
+        parser.error("--fixtures is required unless --synthetic is used")
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline requires --baseline")
+    if args.name is None:
+        args.name = f"synthetic-{args.teams}x{args.roster_size}" if args.synthetic else "recorded"
+    if args.mode == "record":
+        record(args)
+    else:
+        sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Load test of League usage patterns against a local :class:`fantraxapi.mock.MockServer`.
+
+Starts a MockServer with ``--leagues`` synthetic leagues and drives League from ``--concurrency`` threads for
+``--duration`` seconds, then reports throughput and latency percentiles for every operation.
+
+    python benchmarks/bench_load.py --scenario rosters --leagues 4 --teams 30 --concurrency 16 --latency 0.05
+    python benchmarks/bench_load.py --scenario live --error-rate 0.02 --rate-limit 200 --burst 50
+
+Scenarios:
+    leagues: League init plus standings and scoring period results across every league.
+    rosters: Every team roster of a league in parallel.
+    live:    Live scoring polling of the latest day.
+    mixed:   All of the above.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import FantraxException, League  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, MockServer  # noqa: E402
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+class Harness:
+    def __init__(self, server: MockServer, league_ids: list[str], scenario: str) -> None:
+        self.server = server
+        self.league_ids = league_ids
+        self.scenario = scenario
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def league(self, league_id: str) -> League:
+        leagues = self.local.__dict__.setdefault("leagues", {})
+        if league_id not in leagues:
+            leagues[league_id] = League(league_id, session=self.server.session())
+        return leagues[league_id]
+
+    def operations(self, rng: random.Random) -> list[tuple[str, Callable]]:
+        league_id = rng.choice(self.league_ids)
+        ops = []
+        if self.scenario in ("leagues", "mixed"):
+            ops.append(("League.__init__", lambda: League(league_id, session=self.server.session())))
+            ops.append(("League.standings", lambda: self.league(league_id).standings()))
+            ops.append(("League.scoring_period_results", lambda: self.league(league_id).scoring_period_results()))
+        if self.scenario in ("rosters", "mixed"):
+            ops.append(("League.team_roster", lambda: self.league(league_id).team_roster(rng.choice(self.league(league_id).teams).id)))
+        if self.scenario in ("live", "mixed"):
+            ops.append(("League.live_scores", lambda: self.league(league_id).live_scores(self.league(league_id).scoring_dates[max(self.league(league_id).scoring_dates)])))
+        return ops
+
+    def worker(self, seed: int, deadline: float) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            for name, func in self.operations(rng):
+                start = time.perf_counter()
+                try:
+                    func()
+                except FantraxException:
+                    with self.lock:
+                        self.errors[name] += 1
+                    continue
+                elapsed = time.perf_counter() - start
+                with self.lock:
+                    self.latencies[name].append(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=["leagues", "rosters", "live", "mixed"], default="mixed")
+    parser.add_argument("--leagues", type=int, default=2)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run for.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds added to every response.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 500.")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before the server answers 429.")
+    parser.add_argument("--burst", type=int, default=10)
+    args = parser.parse_args()
+
+    generators = [LeagueGenerator(teams=args.teams, roster_size=args.roster_size, seed=i, league_id=f"synthetic{i}") for i in range(args.leagues)]
+    with MockServer(generators, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, rate_limit=args.rate_limit, burst=args.burst, seed=0) as server:
+        harness = Harness(server, [g.league_id for g in generators], args.scenario)
+        start = time.perf_counter()
+        deadline = start + args.duration
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            for future in [executor.submit(harness.worker, seed, deadline) for seed in range(args.concurrency)]:
+                future.result()
+        elapsed = time.perf_counter() - start
+
+    total = sum(len(v) for v in harness.latencies.values())
+    print(f"{total} operations in {elapsed:.1f}s ({total / elapsed:.1f} ops/s), {server.stats.requests} requests ({server.stats.requests / elapsed:.1f} req/s)")
+    print(f"server: {server.stats.as_dict()}")
+    print(f"{'operation':<32} {'ops':>7} {'ops/s':>8} {'errors':>7} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for name in sorted(set(harness.latencies) | set(harness.errors)):
+        values = harness.latencies[name]
+        line = f"{name:<32} {len(values):>7} {len(values) / elapsed:>8.1f} {harness.errors[name]:>7}"
+        if values:
+            stats = [statistics.mean(values), percentile(values, 50), percentile(values, 90), percentile(values, 99), max(values)]
+            line += "".join(f" {v * 1e3:>7.1f}ms" for v in stats)
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
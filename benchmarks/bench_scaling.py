@@ -0,0 +1,62 @@
+"""Parsing time and memory scaling of League methods over synthetic leagues of growing size.
+
+Each size builds a :class:`fantraxapi.mock.LeagueGenerator`, pre-generates every response and then times decode plus
+object building and measures the peak memory allocated with tracemalloc.
+
+    python benchmarks/bench_scaling.py --teams 12 20 30 --roster-sizes 20 30 --periods 25
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import League  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, SyntheticSession  # noqa: E402
+from fantraxapi.replay import MemoryStore, ReplaySession  # noqa: E402
+
+
+def workloads(league: League) -> dict:
+    team = league.teams[0]
+    last_day = max(league.scoring_dates)
+    return {
+        "scoring_period_results": league.scoring_period_results,
+        "standings": league.standings,
+        "transactions": lambda: league.transactions(count=len(league.teams) * 20),
+        "live_scores": lambda: league.live_scores(league.scoring_dates[last_day]),
+        "team_roster": lambda: league.team_roster(team.id, period_number=last_day),
+        "all_rosters": lambda: [league.team_roster(t.id, period_number=last_day) for t in league.teams],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, nargs="+", default=[12, 20, 30])
+    parser.add_argument("--roster-sizes", type=int, nargs="+", default=[20, 30])
+    parser.add_argument("--periods", type=int, default=25)
+    args = parser.parse_args()
+
+    print(f"{'teams':>5} {'roster':>6} {'workload':<24} {'seconds':>9} {'peak MiB':>9}")
+    for teams in args.teams:
+        for roster_size in args.roster_sizes:
+            generator = LeagueGenerator(teams=teams, roster_size=roster_size, periods=args.periods, transactions=teams * 20)
+            store = MemoryStore()
+            warm = League(generator.league_id, session=SyntheticSession(generator, store=store))
+            for func in workloads(warm).values():
+                func()
+            league = League(generator.league_id, session=ReplaySession(store))
+            for name, func in workloads(league).items():
+                tracemalloc.start()
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{teams:>5} {roster_size:>6} {name:<24} {elapsed:>9.4f} {peak / 2**20:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Size and speed of :mod:`fantraxapi.serialize` against plain pickle and rebuilding objects from responses.
+
+Builds objects from a synthetic league, then for each object type times serializing and loading them back:
+
+    python benchmarks/bench_serialize.py --teams 12 --roster-size 26 --repeat 20
+"""
+
+import argparse
+import pickle
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi import League, serialize  # noqa: E402
+from fantraxapi.mock import LeagueGenerator, SyntheticSession  # noqa: E402
+from fantraxapi.replay import MemoryStore, ReplaySession  # noqa: E402
+
+
+def timed(func: Callable, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--roster-size", type=int, default=26)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    generator = LeagueGenerator(teams=args.teams, roster_size=args.roster_size)
+    store = MemoryStore()
+    warm = League(generator.league_id, session=SyntheticSession(generator, store=store))
+    team = warm.teams[0]
+    day = warm.scoring_dates[max(warm.scoring_dates)]
+    for build in (lambda: warm.team_roster(team.id), warm.standings, warm.scoring_period_results, warm.transactions, lambda: warm.live_scores(day)):
+        build()
+
+    league = League(generator.league_id, session=ReplaySession(store))
+    builders = {
+        "Roster": lambda: league.team_roster(team.id),
+        "Standings": league.standings,
+        "ScoringPeriodResults": league.scoring_period_results,
+        "Transactions": league.transactions,
+        "LivePlayers": lambda: league.live_scores(day),
+    }
+    print(f"{'objects':<22} {'pickle':>9} {'compact':>9} {'dumps':>9} {'loads':>9} {'rebuild':>9}")
+    for name, build in builders.items():
+        objs = build()
+        data = serialize.dumps(objs)
+        dumps_time = timed(lambda: serialize.dumps(objs), args.repeat)
+        loads_time = timed(lambda: serialize.loads(data, league), args.repeat)
+        rebuild_time = timed(build, args.repeat)
+        print(f"{name:<22} {len(pickle.dumps(objs)) / 1024:>7.1f}KB {len(data) / 1024:>7.1f}KB {dumps_time * 1e3:>7.2f}ms {loads_time * 1e3:>7.2f}ms {rebuild_time * 1e3:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Parsing wide Fantrax ``header``/``rows`` tables with compiled plans against rebuilding a header lookup for every row.
+
+Builds a roster STATS table and a standings table with extra stat columns and times both ways of reading them:
+
+    python benchmarks/bench_tables.py --rows 40 --columns 10 50 200 --repeat 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from fantraxapi.schemas import StandingsData, standings_schema  # noqa: E402
+from fantraxapi.tables import TableSchema  # noqa: E402
+
+
+def timed(func: Callable, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def stats_table(rows: int, columns: int) -> dict:
+    rng = random.Random(columns)
+    header = [{"shortName": "Opp", "eventStr": "Mon"}] + [{"shortName": f"S{i}", "sortKey": f"STAT_{i}"} for i in range(columns)]
+    header += [{"shortName": "FPts", "sortKey": "SCORE"}, {"shortName": "FP/G", "sortKey": "FPTS_PER_GAME"}]
+    table_rows = [{"posId": "1", "cells": [{"content": ""}] + [{"content": str(rng.randint(0, 99))} for _ in range(columns + 2)]} for _ in range(rows)]
+    return {"header": {"cells": header}, "rows": table_rows}
+
+
+def standings_table(rows: int, columns: int) -> dict:
+    keys = [c.key for c in standings_schema.columns] + [f"extra{i}" for i in range(columns)]
+    table_rows = [
+        {
+            "fixedCells": [{"content": str(r + 1)}, {"teamId": f"t{r}"}],
+            "cells": [{"content": "1"} for _ in range(9)] + [{"content": "W1"}] + [{"content": "0"} for _ in range(columns)],
+        }
+        for r in range(rows)
+    ]
+    return {"header": {"cells": [{"key": k} for k in keys]}, "rows": table_rows}
+
+
+def stats_per_row(table: dict) -> dict[str, list[float]]:
+    output = {}
+    for row in table["rows"]:
+        for header, cell in zip(table["header"]["cells"], row["cells"]):
+            if header.get("eventStr"):
+                continue
+            try:
+                value = float(cell["content"].replace(",", ""))
+            except ValueError:
+                value = float("nan")
+            output.setdefault(header["shortName"], []).append(value)
+    return output
+
+
+def standings_per_row(table: dict) -> list[tuple]:
+    output = []
+    for row in table["rows"]:
+        fields = {h["key"]: c["content"] for h, c in zip(table["header"]["cells"], row["cells"])}
+        output.append(
+            (
+                int(fields["win"]) if "win" in fields else 0,
+                int(fields["loss"]) if "loss" in fields else 0,
+                int(fields["tie"]) if "tie" in fields else 0,
+                int(fields["points"]) if "points" in fields else 0,
+                float(fields["winpc"]) if "winpc" in fields and fields["winpc"] != "-" else 0.0,
+                int(fields["gamesback"]) if "gamesback" in fields else 0,
+                int(fields["wwOrder"]) if "wwOrder" in fields else 0,
+                float(fields["pointsFor"].replace(",", "")) if "pointsFor" in fields else 0.0,
+                float(fields["pointsAgainst"].replace(",", "")) if "pointsAgainst" in fields else 0.0,
+                fields.get("streak", ""),
+            )
+        )
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--columns", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'table':<22} {'per row':>9} {'plan':>9} {'speedup':>8}")
+    for columns in args.columns:
+        stats = stats_table(args.rows, columns)
+        standings = standings_table(args.rows, columns)
+        cases = {
+            f"stats x{columns}": (
+                lambda: stats_per_row(stats),
+                lambda: TableSchema.compile_all(stats["header"]["cells"], skip=lambda h: bool(h.get("eventStr"))).columns(r["cells"] for r in stats["rows"]),
+            ),
+            f"standings x{columns}": (lambda: standings_per_row(standings), lambda: StandingsData.parse(standings)),
+        }
+        for name, (per_row, plan) in cases.items():
+            per_row_time = timed(per_row, args.repeat)
+            plan_time = timed(plan, args.repeat)
+            print(f"{name:<22} {per_row_time * 1e3:>7.2f}ms {plan_time * 1e3:>7.2f}ms {per_row_time / plan_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
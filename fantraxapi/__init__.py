@@ -1,13 +1,12 @@
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING
 
 from .exceptions import FantraxException, NotLoggedIn, NotMemberOfLeague, NotTeamInLeague
-from .objs import League
-from .objs import League as FantraxAPI
 
-try:
-    __version__ = importlib.metadata.version("fantraxapi")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = ""
+if TYPE_CHECKING:
+    from .objs import League
+    from .objs import League as FantraxAPI
+
 __author__ = "Nathan Taggart"
 __credits__ = "meisnate12"
 __package_name__ = "fantraxapi"
@@ -24,3 +23,41 @@ __all__ = [
     "NotTeamInLeague",
     "League",
 ]
+
+# Attributes imported on first access so ``import fantraxapi`` doesn't import requests and every object module.
+_lazy_attributes: dict[str, tuple[str, str]] = {
+    "League": (".objs", "League"),
+    "FantraxAPI": (".objs", "League"),
+}
+
+
+def _version() -> str:
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version("fantraxapi")
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def __getattr__(name: str) -> object:
+    if name in _lazy_attributes:
+        module_name, attribute = _lazy_attributes[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+    elif name == "__version__":
+        value = _version()
+    elif name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_attributes, "__version__"})
@@ -1,20 +1,79 @@
+import json
+import logging
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING, ParamSpec
 
 from requests import Session
 
-from fantraxapi import FantraxException
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from fantraxapi import FantraxException, instrumentation, tracing
 from fantraxapi.exceptions import NotLoggedIn, NotMemberOfLeague
+from fantraxapi.instrumentation import RequestEvent
 
 if TYPE_CHECKING:
     from fantraxapi.objs import League
 
 
 Param: ParamSpec = ParamSpec("Param")
-default_session: Session = Session()
+# Created on first use by get_default_session, assign a Session here to replace it.
+default_session: Session
+_default_session_lock: threading.Lock = threading.Lock()
+logger: logging.Logger = logging.getLogger(__name__)
 
+# Deprecated, request and response JSON are logged at DEBUG on this module's logger and events are passed to instrumentation hooks.
 debug: bool = False
+fast_json: bool = True
+
+# Seconds a Session stays known to be logged in before pending transactions check the login again.
+login_check_interval: float = 300.0
+# Sessions known to be logged in and when that was last confirmed, a WARNING_NOT_LOGGED_IN response removes its Session.
+_logged_in: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+batch_max_messages: int = 10
+batch_max_response_bytes: int = 2_000_000
+batch_max_workers: int = 4
+
+# Rough response sizes used by plan_batches, keyed by "method:view" or just "method".
+expected_response_bytes: dict[str, int] = {
+    "getFantasyLeagueInfo": 150_000,
+    "getRefObject": 15_000,
+    "getLiveScoringStats": 400_000,
+    "getTeamRosterInfo:STATS": 90_000,
+    "getTeamRosterInfo:SCHEDULE_FULL": 160_000,
+    "getTeamRosterInfo:GAMES_PER_POS": 60_000,
+    "getStandings": 60_000,
+    "getTradeBlocks": 40_000,
+    "getPendingTransactions": 20_000,
+    "getTransactionDetailsHistory": 150_000,
+}
+default_response_bytes: int = 50_000
+
+
+def get_default_session() -> Session:
+    """Returns the Session used by requests without one, creating it the first time it's needed."""
+    session = globals().get("default_session")
+    if session is None:
+        with _default_session_lock:
+            session = globals().get("default_session")
+            if session is None:
+                session = globals()["default_session"] = Session()
+    return session
+
+
+def __getattr__(name: str) -> object:
+    if name == "default_session":
+        return get_default_session()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Method:
@@ -23,15 +82,49 @@ class Method:
         self.kwargs: dict = kwargs
         self.response: dict | None = None
 
-    def msg_block(self, league_id: str) -> dict[str, str]:
-        output_data = {"leagueId": league_id}
+    def _params(self) -> dict[str, str]:
+        params = {}
         for key, value in self.kwargs.items():
             if value is not None:
                 if isinstance(value, date):
-                    output_data[key] = value.strftime("%Y-%m-%d")
+                    params[key] = value.strftime("%Y-%m-%d")
                 else:
-                    output_data[key] = str(value)
-        return {"method": self.name, "data": output_data}
+                    params[key] = str(value)
+        return params
+
+    @property
+    def key(self) -> tuple:
+        """Hashable identity of this Method, two Methods with the same key return the same response."""
+        return self.name, tuple(sorted(self._params().items()))
+
+    @property
+    def expected_bytes(self) -> int:
+        """Expected response size of this Method taken from ``expected_response_bytes``."""
+        if "view" in self.kwargs and f"{self.name}:{self.kwargs['view']}" in expected_response_bytes:
+            return expected_response_bytes[f"{self.name}:{self.kwargs['view']}"]
+        return expected_response_bytes.get(self.name, default_response_bytes)
+
+    def msg_block(self, league_id: str) -> dict[str, str]:
+        return {"method": self.name, "data": {"leagueId": league_id, **self._params()}}
+
+    def __repr__(self) -> str:
+        return f"Method({self.name}, {self._params()})"
+
+
+def decoder_name() -> str:
+    """Name of the JSON decoder :func:`loads` is currently using."""
+    return "orjson" if fast_json and orjson is not None else "json"
+
+
+def loads(content: bytes | str) -> dict:
+    """Decodes a raw JSON response using orjson when it's installed and ``fast_json`` is True, otherwise the built-in json module.
+
+    Raises:
+        JSONDecodeError: When the content is not valid JSON.
+    """
+    if fast_json and orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def request(league: "League", methods: list[Method] | Method) -> dict:
@@ -41,28 +134,52 @@ def request(league: "League", methods: list[Method] | Method) -> dict:
 def _request(league_id: str, methods: list[Method] | Method, session: Session | None = None) -> list[dict] | dict:
     if not isinstance(methods, list):
         methods = [methods]
+    with tracing.span("api._request", league_id=league_id, methods=",".join(m.name for m in methods)):
+        return _post(league_id, methods, session)
+
+
+def _post(league_id: str, methods: list[Method], session: Session | None) -> list[dict] | dict:
     json_data = {"msgs": [m.msg_block(league_id) for m in methods]}
     if session is None:
-        session = default_session
+        session = get_default_session()
     if debug:
-        print(f"{'_' * 100} Request JSON  {'_' * 100}")
-        print(json_data)
-    response = session.post("https://www.fantrax.com/fxpa/req", params={"leagueId": league_id}, json=json_data)
+        warnings.warn("api.debug is deprecated, enable DEBUG on the fantraxapi.api logger or use instrumentation.add_hook instead", DeprecationWarning, stacklevel=2)
+    logger.debug("Request JSON: %s", json_data)
+    event = RequestEvent(league_id, [m.name for m in methods])
+    start = time.perf_counter()
+    try:
+        response = session.post("https://www.fantrax.com/fxpa/req", params={"leagueId": league_id}, json=json_data)
+    except Exception as e:
+        event.network_time = time.perf_counter() - start
+        event.error = type(e).__name__
+        instrumentation.emit(event)
+        raise
+    event.network_time = time.perf_counter() - start
+    event.status_code = response.status_code
+    event.response_bytes = len(response.content)
+    if body := getattr(response.request, "body", None):
+        event.request_bytes = len(body)
+    event.decoder = decoder_name()
+    start = time.perf_counter()
     try:
-        response_json = response.json()
+        response_json = loads(response.content)
     except JSONDecodeError as e:
+        event.decode_time = time.perf_counter() - start
+        event.error = type(e).__name__
+        instrumentation.emit(event)
         raise FantraxException(f"Invalid JSON Response to {methods}: {e}\nData: {json_data}")
-    if debug:
-        print(f"{'-' * 100} Response JSON {'-' * 100}")
-        print("-" * 100)
-        print(response_json)
-        print("^" * 215)
+    event.decode_time = time.perf_counter() - start
+    if "pageError" in response_json and "code" in response_json["pageError"]:
+        event.error = response_json["pageError"]["code"]
+    instrumentation.emit(event)
+    logger.debug("Response JSON: %s", response_json)
     if response.status_code >= 400:
         raise FantraxException(f"({response.status_code} [{response.reason}]) {response_json}")
     if "pageError" in response_json:
         if "code" in response_json["pageError"]:
             match response_json["pageError"]["code"]:
                 case "WARNING_NOT_LOGGED_IN":
+                    _logged_in.pop(session, None)
                     raise NotLoggedIn("Not Logged in")
                 case "NOT_MEMBER_OF_LEAGUE":
                     raise NotMemberOfLeague("Not Member of League")
@@ -71,9 +188,92 @@ def _request(league_id: str, methods: list[Method] | Method, session: Session |
                 case _:
                     raise FantraxException(f"{response_json}")
 
+    for response_data in response_json["responses"]:
+        if response_data.get("pageError", {}).get("code") == "WARNING_NOT_LOGGED_IN":
+            _logged_in.pop(session, None)
+            raise NotLoggedIn("Not Logged in")
     return response_json["responses"][0]["data"] if len(methods) == 1 else [r["data"] for r in response_json["responses"]]
 
 
+def plan_batches(methods: list[Method], max_messages: int | None = None, max_response_bytes: int | None = None) -> list[list[Method]]:
+    """Groups Methods into POSTs of at most ``max_messages`` Methods and ``max_response_bytes`` expected response bytes.
+
+    Methods are placed largest first into the first batch they fit in. A Method larger than ``max_response_bytes`` gets a batch to itself.
+
+    Args:
+        methods (list[Method]): Methods to group.
+        max_messages (int | None): Max Methods per POST, defaults to ``batch_max_messages``.
+        max_response_bytes (int | None): Max expected response bytes per POST, defaults to ``batch_max_response_bytes``.
+
+    Returns:
+        list[list[Method]]: List of batches.
+    """
+    max_messages = batch_max_messages if max_messages is None else max_messages
+    max_response_bytes = batch_max_response_bytes if max_response_bytes is None else max_response_bytes
+    batches = []
+    sizes = []
+    for method in sorted(methods, key=lambda m: m.expected_bytes, reverse=True):
+        size = method.expected_bytes
+        for i, batch in enumerate(batches):
+            if len(batch) < max_messages and sizes[i] + size <= max_response_bytes:
+                batch.append(method)
+                sizes[i] += size
+                break
+        else:
+            batches.append([method])
+            sizes.append(size)
+    return batches
+
+
+def request_batched(
+    league: "League",
+    methods: list[Method],
+    max_messages: int | None = None,
+    max_response_bytes: int | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Sends any number of Methods as concurrent POSTs planned by :func:`plan_batches`.
+
+    Duplicate Methods are only sent once and share the same response.
+
+    Args:
+        league (League): League to send the Methods for.
+        methods (list[Method]): Methods to send.
+        max_messages (int | None): Max Methods per POST, defaults to ``batch_max_messages``.
+        max_response_bytes (int | None): Max expected response bytes per POST, defaults to ``batch_max_response_bytes``.
+        max_workers (int | None): Max POSTs in flight at once, defaults to ``batch_max_workers``.
+
+    Returns:
+        list[dict]: Responses in the same order as ``methods``.
+    """
+    if not methods:
+        return []
+    unique = {}
+    for method in methods:
+        unique.setdefault(method.key, method)
+    batches = plan_batches(list(unique.values()), max_messages=max_messages, max_response_bytes=max_response_bytes)
+
+    def _send(batch: list[Method]) -> None:
+        response = request(league, batch)
+        for method, data in zip(batch, response if len(batch) > 1 else [response]):
+            method.response = data
+
+    max_workers = batch_max_workers if max_workers is None else max_workers
+    if len(batches) == 1 or max_workers < 2:
+        for batch in batches:
+            _send(batch)
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            for future in [executor.submit(_send, b) for b in batches]:
+                future.result()
+
+    responses = []
+    for method in methods:
+        method.response = unique[method.key].response
+        responses.append(method.response)
+    return responses
+
+
 def get_init_info(league: "League") -> dict:
     return request(
         league,
@@ -87,8 +287,24 @@ def get_init_info(league: "League") -> dict:
     )
 
 
+def logged_in(session: Session | None) -> bool:
+    """Returns True when a Method that needs a login succeeded with the Session in the last ``login_check_interval`` seconds.
+
+    Args:
+        session (Session | None): Session to check, None checks ``default_session``.
+    """
+    confirmed = _logged_in.get(get_default_session() if session is None else session)
+    return confirmed is not None and time.monotonic() - confirmed < login_check_interval
+
+
 def get_pending_transactions(league: "League") -> dict:
-    return request(league, Method("getPendingTransactions"))
+    # getPendingTransactions may not be rejected by itself when logged out, so getTradeBlocks checks the login in the
+    # same POST unless the Session was confirmed logged in recently.
+    if logged_in(league.session):
+        return request(league, Method("getPendingTransactions"))
+    response = request(league, [Method("getTradeBlocks"), Method("getPendingTransactions")])
+    _logged_in[league.session] = time.monotonic()
+    return response[1]
 
 
 def get_standings(league: "League", views: list[str] | str | None = None, **kwargs: Param.kwargs) -> dict:
@@ -107,7 +323,9 @@ def get_standings(league: "League", views: list[str] | str | None = None, **kwar
 
 
 def get_trade_blocks(league: "League") -> dict:
-    return request(league, Method("getTradeBlocks"))["tradeBlocks"]
+    response = request(league, Method("getTradeBlocks"))["tradeBlocks"]
+    _logged_in[league.session] = time.monotonic()
+    return response
 
 
 def get_team_roster_position_counts(league: "League", team_id: str, scoring_period_number: int | None = None) -> dict:
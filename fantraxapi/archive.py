@@ -0,0 +1,210 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.replay import RecordedResponse, ResponseStore
+
+# Segment record: meta length, content length, then the meta JSON and the raw response body.
+_record = struct.Struct("<II")
+# Index entry: segment number, record offset, record length, fetched at, key length, league ID length, then both strings.
+_entry = struct.Struct("<IQIdHH")
+
+
+class ArchiveEntry(NamedTuple):
+    """Index entry of a single archived response."""
+
+    key: str
+    league_id: str
+    fetched_at: float
+    segment: int
+    offset: int
+    length: int
+
+    @property
+    def methods(self) -> list[str]:
+        return self.key.rsplit("-", 1)[0].split("-")
+
+
+class Archive(ResponseStore):
+    """Append-only archive of raw ``/fxpa/req`` responses kept in segment files and read through memory maps.
+
+    Every response is appended to the current ``segment-NNNNN.dat`` file and an entry keyed by the replay request key,
+    League ID and fetch time is appended to ``index.bin``. Only the index is read into memory, responses are sliced
+    out of memory mapped segments when requested so any response can be read or streamed without loading the archive.
+
+    Archives are ResponseStores so they can be recorded to with :class:`fantraxapi.replay.RecordingSession` and
+    replayed with :class:`fantraxapi.replay.ReplaySession`, which are served the latest response of each request.
+
+    Args:
+        path (str): Archive directory.
+        segment_size (int): Bytes after which a new segment file is started.
+
+    Attributes:
+        entries (list[ArchiveEntry]): Every index entry in the order they were archived.
+
+    """
+
+    def __init__(self, path: str, segment_size: int = 64 * 1024 * 1024) -> None:
+        self.path: str = path
+        self.segment_size: int = segment_size
+        self.entries: list[ArchiveEntry] = []
+        self._latest: dict[str, ArchiveEntry] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._lock: threading.Lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._load_index()
+        self._segment: int = max((e.segment for e in self.entries), default=0)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, f"segment-{segment:05d}.dat")
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.path, "index.bin")
+
+    def _load_index(self) -> None:
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, "rb") as f:
+            data = f.read()
+        sizes = {}
+        position = 0
+        while position + _entry.size <= len(data):
+            segment, offset, length, fetched_at, key_length, league_length = _entry.unpack_from(data, position)
+            position += _entry.size
+            if position + key_length + league_length > len(data):
+                break
+            key = data[position : position + key_length].decode()
+            league_id = data[position + key_length : position + key_length + league_length].decode()
+            position += key_length + league_length
+            if segment not in sizes:
+                sizes[segment] = os.path.getsize(self._segment_path(segment)) if os.path.exists(self._segment_path(segment)) else 0
+            if offset + length > sizes[segment]:
+                continue
+            self._add_entry(ArchiveEntry(key, league_id, fetched_at, segment, offset, length))
+
+    def _add_entry(self, entry: ArchiveEntry) -> None:
+        self.entries.append(entry)
+        latest = self._latest.get(entry.key)
+        if latest is None or entry.fetched_at >= latest.fetched_at:
+            self._latest[entry.key] = entry
+
+    def _map(self, segment: int, end: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            if mapped is not None:
+                mapped.close()
+            with open(self._segment_path(segment), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def read(self, entry: ArchiveEntry) -> RecordedResponse:
+        """Returns the RecordedResponse of an index entry.
+
+        Args:
+            entry (ArchiveEntry): Index entry to read.
+
+        Raises:
+            FantraxException: When the record is corrupt.
+        """
+        with self._lock:
+            mapped = self._map(entry.segment, entry.offset + entry.length)
+            meta_length, content_length = _record.unpack_from(mapped, entry.offset)
+            start = entry.offset + _record.size
+            if _record.size + meta_length + content_length != entry.length:
+                raise FantraxException(f"Corrupt archive record {entry}")
+            meta = json.loads(mapped[start : start + meta_length])
+            content = mapped[start + meta_length : start + meta_length + content_length]
+        return RecordedResponse(entry.league_id, meta["request"], meta["status_code"], meta["reason"], content)
+
+    def append(self, key: str, recorded: RecordedResponse, fetched_at: float | None = None) -> ArchiveEntry:
+        """Appends a response to the archive and returns its index entry.
+
+        Args:
+            key (str): Replay request key.
+            recorded (RecordedResponse): Response to archive.
+            fetched_at (float | None): Unix timestamp the response was fetched at, defaults to now.
+        """
+        meta = json.dumps({"request": recorded.request, "status_code": recorded.status_code, "reason": recorded.reason}, separators=(",", ":")).encode()
+        record = _record.pack(len(meta), len(recorded.content)) + meta + recorded.content
+        key_bytes, league_bytes = key.encode(), recorded.league_id.encode()
+        with self._lock:
+            path = self._segment_path(self._segment)
+            if os.path.exists(path) and os.path.getsize(path) and os.path.getsize(path) + len(record) > self.segment_size:
+                self._segment += 1
+                path = self._segment_path(self._segment)
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(record)
+            entry = ArchiveEntry(key, recorded.league_id, time.time() if fetched_at is None else fetched_at, self._segment, offset, len(record))
+            with open(self._index_path, "ab") as f:
+                f.write(_entry.pack(entry.segment, entry.offset, entry.length, entry.fetched_at, len(key_bytes), len(league_bytes)) + key_bytes + league_bytes)
+            self._add_entry(entry)
+        return entry
+
+    def find(self, league_id: str | None = None, method: str | None = None, since: float | None = None, until: float | None = None) -> list[ArchiveEntry]:
+        """Returns the index entries matching every given filter in the order they were archived.
+
+        Args:
+            league_id (str | None): Only entries of this League.
+            method (str | None): Only entries whose request contains this Method.
+            since (float | None): Only entries fetched at or after this Unix timestamp.
+            until (float | None): Only entries fetched before this Unix timestamp.
+        """
+        return [
+            e
+            for e in self.entries
+            if (league_id is None or e.league_id == league_id)
+            and (method is None or method in e.methods)
+            and (since is None or e.fetched_at >= since)
+            and (until is None or e.fetched_at < until)
+        ]
+
+    def stream(self, entries: list[ArchiveEntry] | None = None) -> Iterator[tuple[ArchiveEntry, RecordedResponse]]:
+        """Yields index entries with their RecordedResponse in segment order, reading one response at a time.
+
+        Args:
+            entries (list[ArchiveEntry] | None): Entries to read, defaults to every entry.
+        """
+        for entry in sorted(self.entries if entries is None else entries, key=lambda e: (e.segment, e.offset)):
+            yield entry, self.read(entry)
+
+    def history(self, key: str) -> list[ArchiveEntry]:
+        """Returns every index entry of a request key oldest first.
+
+        Args:
+            key (str): Replay request key.
+        """
+        return sorted((e for e in self.entries if e.key == key), key=lambda e: e.fetched_at)
+
+    def get(self, key: str) -> RecordedResponse | None:
+        entry = self._latest.get(key)
+        return None if entry is None else self.read(entry)
+
+    def put(self, key: str, recorded: RecordedResponse) -> None:
+        self.append(key, recorded)
+
+    def keys(self) -> list[str]:
+        return sorted(self._latest)
+
+    def close(self) -> None:
+        with self._lock:
+            for mapped in self._maps.values():
+                mapped.close()
+            self._maps.clear()
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
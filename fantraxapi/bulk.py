@@ -0,0 +1,191 @@
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import NamedTuple
+
+from fantraxapi import api
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.objs import League, LivePlayer, Roster, Transaction
+from fantraxapi.replay import RecordedResponse, ResponseStore, request_key
+from fantraxapi.schemas import GameData, LiveScoresData, RosterData, StandingsData, TransactionRowData
+
+
+class SeasonData(NamedTuple):
+    """League dates workers need to parse Games without a League."""
+
+    start: date
+    end: date
+    scoring_dates: dict[int, date]
+
+    @classmethod
+    def from_league(cls, league: League) -> "SeasonData":
+        return cls(league.start_date.date(), league.end_date.date(), dict(league.scoring_dates))
+
+
+class ParsedResponse(NamedTuple):
+    """Picklable result of parsing one recorded ``/fxpa/req`` response.
+
+    Attributes:
+        key (str): Replay request key.
+        league_id (str): Fantrax League ID.
+        kind (str | None): ``roster``, ``live_scores``, ``standings`` or ``transactions``, None when the request isn't supported.
+        params (dict): Data of the first Method in the request, like ``teamId`` or ``date``.
+        data (RosterData | LiveScoresData | StandingsData | tuple[TransactionRowData, ...] | None): Parsed data.
+        error (str | None): Error message when the response couldn't be parsed.
+
+    """
+
+    key: str
+    league_id: str
+    kind: str | None
+    params: dict
+    data: RosterData | LiveScoresData | StandingsData | tuple[TransactionRowData, ...] | None
+    error: str | None
+
+
+_seasons: dict[str, SeasonData] = {}
+
+
+def _init_worker(seasons: dict[str, SeasonData]) -> None:
+    _seasons.update(seasons)
+
+
+def _kind(msgs: list[dict]) -> str | None:
+    methods = [(m["method"], m["data"].get("view")) for m in msgs]
+    if methods == [("getTeamRosterInfo", "STATS"), ("getTeamRosterInfo", "SCHEDULE_FULL")]:
+        return "roster"
+    if len(msgs) != 1:
+        return None
+    match methods[0]:
+        case ("getLiveScoringStats", _) if msgs[0]["data"].get("date"):
+            return "live_scores"
+        case ("getStandings", None | "STANDINGS"):
+            return "standings"
+        case ("getTransactionDetailsHistory", _):
+            return "transactions"
+    return None
+
+
+def _parse_games(roster: RosterData, season: SeasonData) -> RosterData:
+    label = season.scoring_dates[roster.period_number].strftime("%a %m/%d") if roster.period_number in season.scoring_dates else None
+    rows = []
+    for row in roster.rows:
+        if row.scorer is None:
+            rows.append(row)
+            continue
+        team = row.scorer.team_short_name
+        today = GameData.parse(row.game_today, label, team, season.start, season.end) if row.game_today and label else row.game_today
+        future = {k: GameData.parse(v, k, team, season.start, season.end) for k, v in row.future_games.items()}
+        rows.append(row._replace(game_today=today, future_games=future))
+    return roster._replace(rows=rows)
+
+
+def parse_recorded(key: str, recorded: RecordedResponse, season: SeasonData | None = None) -> ParsedResponse:
+    """Parses a recorded response into picklable data, this is the function every worker process runs.
+
+    Args:
+        key (str): Replay request key.
+        recorded (RecordedResponse): Recorded response to parse.
+        season (SeasonData | None): Season of the League used to parse roster Games, Games are left unparsed when None.
+    """
+    msgs = recorded.request.get("msgs", [])
+    kind = _kind(msgs)
+    params = msgs[0]["data"] if msgs else {}
+    if kind is None:
+        return ParsedResponse(key, recorded.league_id, None, params, None, None)
+    try:
+        response = api.loads(recorded.content)
+        if "pageError" in response:
+            raise FantraxException(f"{response['pageError']}")
+        data = [r["data"] for r in response["responses"]]
+        match kind:
+            case "roster":
+                parsed = RosterData.parse(data[0], data[1])
+                if season is not None:
+                    parsed = _parse_games(parsed, season)
+            case "live_scores":
+                parsed = LiveScoresData.parse(data[0])
+            case "standings":
+                parsed = StandingsData.parse(data[0]["tableList"][0])
+            case _:
+                parsed = tuple(TransactionRowData.parse(row) for row in data[0]["table"]["rows"])
+    except (FantraxException, ValueError, KeyError, IndexError, TypeError) as e:
+        return ParsedResponse(key, recorded.league_id, kind, params, None, f"{type(e).__name__}: {e}")
+    return ParsedResponse(key, recorded.league_id, kind, params, parsed, None)
+
+
+def _parse_item(item: tuple[str, RecordedResponse]) -> ParsedResponse:
+    return parse_recorded(item[0], item[1], _seasons.get(item[1].league_id))
+
+
+def bulk_parse(
+    responses: ResponseStore | Iterable[RecordedResponse],
+    leagues: list[League] | League | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 8,
+) -> list[ParsedResponse]:
+    """Parses many recorded responses across a process pool and returns a ParsedResponse for each in the same order.
+
+    Workers only return schema data, never objects holding a League, so results are cheap to send back and can be
+    turned into objects with :func:`build` or stored directly. Roster games are parsed in the workers too for every
+    League passed in ``leagues``.
+
+    Args:
+        responses (ResponseStore | Iterable[RecordedResponse]): Store or recorded responses to parse.
+        leagues (list[League] | League | None): Leagues the responses belong to.
+        max_workers (int | None): Number of worker processes, defaults to the number of CPUs, 1 parses in this process.
+        chunksize (int): Number of responses sent to a worker at a time.
+    """
+    if isinstance(responses, ResponseStore):
+        store = responses
+        items = [(key, store.get(key)) for key in store.keys()]
+    else:
+        items = [(request_key(r.request), r) for r in responses]
+    if leagues is None:
+        leagues = []
+    elif not isinstance(leagues, list):
+        leagues = [leagues]
+    seasons = {league.league_id: SeasonData.from_league(league) for league in leagues}
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(items) <= chunksize:
+        return [parse_recorded(key, recorded, seasons.get(recorded.league_id)) for key, recorded in items]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(seasons,)) as executor:
+        return list(executor.map(_parse_item, items, chunksize=chunksize))
+
+
+def build(league: League, parsed: ParsedResponse) -> Roster | dict[str, list[LivePlayer]] | list[Transaction] | StandingsData | None:
+    """Builds objects from a ParsedResponse of a League.
+
+    Args:
+        league (League): League the response belongs to.
+        parsed (ParsedResponse): Parsed response.
+
+    Returns:
+        Roster | dict[str, list[LivePlayer]] | list[Transaction] | StandingsData | None: A Roster, Team IDs to LivePlayers
+        like :meth:`League.live_scores`, a list of Transactions, StandingsData or None when nothing was parsed.
+
+    """
+    if parsed.data is None:
+        return None
+    match parsed.kind:
+        case "roster":
+            roster = Roster(league, parsed.params["teamId"], parsed.data)
+            league._index_roster(roster)
+            return roster
+        case "live_scores":
+            scoring_date = date.fromisoformat(parsed.params["date"])
+            scorers = parsed.data.scorers
+            return {team_id: [LivePlayer(league, scorers[s], team_id, pts, scoring_date) for s, pts in points] for team_id, points in parsed.data.points.items()}
+        case "transactions":
+            transactions = []
+            rows = []
+            for row in parsed.data:
+                if rows and row.tx_set_id != rows[0].tx_set_id:
+                    transactions.append(Transaction(league, rows))
+                    rows = []
+                rows.append(row)
+            if rows:
+                transactions.append(Transaction(league, rows))
+            return transactions
+    return parsed.data
@@ -0,0 +1,234 @@
+from array import array
+from collections.abc import Iterable
+from datetime import date
+from typing import TYPE_CHECKING
+
+from fantraxapi import api
+from fantraxapi.bulk import ParsedResponse
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.objs import League
+from fantraxapi.schemas import LiveScoresData, RosterData, StandingsData
+
+if TYPE_CHECKING:
+    import pyarrow
+
+Column = list | array
+
+
+class ColumnTable:
+    """Named columns of equal length, numeric columns are ``array`` objects and everything else is a list.
+
+    Args:
+        columns (dict[str, list | array]): Column names to their values.
+
+    Raises:
+        FantraxException: When the columns have different lengths.
+    """
+
+    def __init__(self, columns: dict[str, Column]) -> None:
+        lengths = {len(c) for c in columns.values()}
+        if len(lengths) > 1:
+            raise FantraxException(f"Columns have different lengths: { {k: len(c) for k, c in columns.items()} }")
+        self.columns: dict[str, Column] = columns
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({len(self)} rows: {', '.join(self.names)})"
+
+    def rows(self) -> list[tuple]:
+        """Returns the table as a list of row tuples in column order."""
+        return list(zip(*self.columns.values()))
+
+    @classmethod
+    def concat(cls, tables: Iterable["ColumnTable"]) -> "ColumnTable":
+        """Returns a single ColumnTable of every table's rows, every table needs the same columns.
+
+        Args:
+            tables (Iterable[ColumnTable]): Tables to concatenate.
+        """
+        columns = {}
+        for table in tables:
+            if not columns:
+                columns = {k: array(c.typecode) if isinstance(c, array) else [] for k, c in table.columns.items()}
+            elif table.names != list(columns):
+                raise FantraxException(f"Can't concatenate columns {table.names} to {list(columns)}")
+            for name, values in table.columns.items():
+                columns[name].extend(values)
+        return cls(columns)
+
+    def to_numpy(self) -> dict:
+        """Returns a Dictionary of column names to NumPy arrays, requires the ``numpy`` package.
+
+        Numeric columns are wrapped without copying, other columns become object arrays.
+        """
+        import numpy
+
+        return {k: numpy.frombuffer(c, dtype=c.typecode) if isinstance(c, array) else numpy.array(c, dtype=object) for k, c in self.columns.items()}
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Returns the table as a ``pyarrow.Table``, requires the ``pyarrow`` package."""
+        import pyarrow
+
+        return pyarrow.table({k: pyarrow.array(c.tolist() if isinstance(c, array) else c) for k, c in self.columns.items()})
+
+    def write_parquet(self, path: str) -> None:
+        """Writes the table to a Parquet file, requires the ``pyarrow`` package.
+
+        Args:
+            path (str): Parquet file path.
+        """
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(self.to_arrow(), path)
+
+
+def _float(value: float | None) -> float:
+    return float("nan") if value is None else value
+
+
+def roster_table(data: RosterData, team_id: str, period_date: date) -> ColumnTable:
+    """Returns one row per roster slot of a parsed roster.
+
+    Columns: ``player_id``, ``team_id``, ``position_id``, ``status_id``, ``date``, ``total_fantasy_points``,
+    ``fantasy_points_per_game``, ``game_today`` and ``future_games``. Missing points are NaN and empty slots have a
+    None ``player_id``.
+
+    Args:
+        data (RosterData): Parsed ``getTeamRosterInfo`` STATS and SCHEDULE_FULL responses.
+        team_id (str): Team ID of the roster.
+        period_date (date): Date of the roster's Daily Period.
+    """
+    rows = data.rows
+    return ColumnTable(
+        {
+            "player_id": [r.scorer.id if r.scorer else None for r in rows],
+            "team_id": [team_id] * len(rows),
+            "position_id": [r.pos_id for r in rows],
+            "status_id": [r.status_id for r in rows],
+            "date": [period_date] * len(rows),
+            "total_fantasy_points": array("d", [_float(r.total_fantasy_points) for r in rows]),
+            "fantasy_points_per_game": array("d", [_float(r.fantasy_points_per_game) for r in rows]),
+            "game_today": array("b", [r.game_today is not None for r in rows]),
+            "future_games": array("i", [len(r.future_games) for r in rows]),
+        }
+    )
+
+
+def live_scores_table(data: LiveScoresData, scoring_date: date) -> ColumnTable:
+    """Returns one row per Player of parsed live scores with the columns ``player_id``, ``team_id``, ``date`` and ``points``.
+
+    Args:
+        data (LiveScoresData): Parsed ``getLiveScoringStats`` response.
+        scoring_date (date): Date of the live scores.
+    """
+    player_ids, team_ids, points = [], [], array("d")
+    for team_id, team_points in data.points.items():
+        for player_id, pts in team_points:
+            player_ids.append(player_id)
+            team_ids.append(team_id)
+            points.append(pts)
+    return ColumnTable({"player_id": player_ids, "team_id": team_ids, "date": [scoring_date] * len(player_ids), "points": points})
+
+
+def standings_table(data: StandingsData, scoring_period_number: int | None = None) -> ColumnTable:
+    """Returns one row per Team of parsed standings.
+
+    Columns: ``scoring_period_number`` (0 for the season), ``team_id``, ``rank``, ``win``, ``loss``, ``tie``,
+    ``points``, ``win_percentage``, ``games_back``, ``points_for`` and ``points_against``.
+
+    Args:
+        data (StandingsData): Parsed ``getStandings`` table.
+        scoring_period_number (int | None): Period Number of the standings, None for the season.
+    """
+    records = data.records
+    return ColumnTable(
+        {
+            "scoring_period_number": array("i", [scoring_period_number or 0] * len(records)),
+            "team_id": [r.team_id for r in records],
+            "rank": array("i", [r.rank for r in records]),
+            "win": array("i", [r.win for r in records]),
+            "loss": array("i", [r.loss for r in records]),
+            "tie": array("i", [r.tie for r in records]),
+            "points": array("i", [r.points for r in records]),
+            "win_percentage": array("d", [r.win_percentage for r in records]),
+            "games_back": array("i", [r.games_back for r in records]),
+            "points_for": array("d", [r.points_for for r in records]),
+            "points_against": array("d", [r.points_against for r in records]),
+        }
+    )
+
+
+def rosters(league: League, period_numbers: Iterable[int] | None = None, team_ids: Iterable[str] | None = None) -> ColumnTable:
+    """Fetches Team rosters and returns them as one ColumnTable without building any Roster objects.
+
+    Args:
+        league (League): League to fetch from.
+        period_numbers (Iterable[int] | None): Daily Period Numbers, defaults to the latest period.
+        team_ids (Iterable[str] | None): Team IDs, defaults to every Team.
+    """
+    team_ids = [t.id for t in league.teams] if team_ids is None else list(team_ids)
+    tables = []
+    for period_number in [None] if period_numbers is None else period_numbers:
+        for team_id in team_ids:
+            stats, schedule = api.get_team_roster_info(league, team_id, period_number=period_number)
+            data = RosterData.parse(stats, schedule)
+            tables.append(roster_table(data, team_id, league.scoring_dates[data.period_number]))
+    return ColumnTable.concat(tables)
+
+
+def live_scores(league: League, scoring_dates: Iterable[date]) -> ColumnTable:
+    """Fetches live scores and returns them as one ColumnTable without building any LivePlayer objects.
+
+    Args:
+        league (League): League to fetch from.
+        scoring_dates (Iterable[date]): Dates of the live scores.
+    """
+    return ColumnTable.concat(live_scores_table(LiveScoresData.parse(api.get_live_scoring_stats(league, scoring_date=d)), d) for d in scoring_dates)
+
+
+def standings(league: League, scoring_period_number: int | None = None, only_period: bool = False) -> ColumnTable:
+    """Fetches standings and returns them as a ColumnTable without building any Record objects.
+
+    Args:
+        league (League): League to fetch from.
+        scoring_period_number (int | None): Period Number, defaults to the latest standings.
+        only_period (bool): Only that specific period's standings, defaults to False.
+    """
+    kwargs = {}
+    if scoring_period_number is not None:
+        kwargs["period"] = scoring_period_number
+        kwargs["timeframeType"] = "BY_PERIOD"
+        kwargs["timeStartType"] = "PERIOD_ONLY" if only_period else "FROM_SEASON_START"
+    response = api.get_standings(league, **kwargs)
+    return standings_table(StandingsData.parse(response["tableList"][0]), scoring_period_number)
+
+
+def from_parsed(league: League, results: Iterable[ParsedResponse]) -> dict[str, ColumnTable]:
+    """Returns a Dictionary of ``roster``, ``live_scores`` and ``standings`` to one ColumnTable of every matching result of
+    :func:`fantraxapi.bulk.bulk_parse`, results of other kinds or with errors are skipped.
+
+    Args:
+        league (League): League the results belong to.
+        results (Iterable[ParsedResponse]): Parsed responses.
+    """
+    tables = {"roster": [], "live_scores": [], "standings": []}
+    for result in results:
+        if result.data is None or result.kind not in tables:
+            continue
+        match result.kind:
+            case "roster":
+                tables["roster"].append(roster_table(result.data, result.params["teamId"], league.scoring_dates[result.data.period_number]))
+            case "live_scores":
+                tables["live_scores"].append(live_scores_table(result.data, date.fromisoformat(result.params["date"])))
+            case "standings":
+                tables["standings"].append(standings_table(result.data, int(result.params["period"]) if result.params.get("period") else None))
+    return {kind: ColumnTable.concat(t) for kind, t in tables.items() if t}
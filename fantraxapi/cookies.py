@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import ParamSpec, TypeVar
+
+from requests import Session
+from requests.cookies import RequestsCookieJar
+
+from fantraxapi.exceptions import FantraxException, NotLoggedIn
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+Param = ParamSpec("Param")
+T = TypeVar("T")
+
+
+@contextmanager
+def _locked(path: str, exclusive: bool) -> Iterator[None]:
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _cookie_dicts(cookies: list[dict] | RequestsCookieJar) -> list[dict]:
+    if isinstance(cookies, RequestsCookieJar):
+        return [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path, "expiry": c.expires} for c in cookies]
+    return [{k: c.get(k) for k in ("name", "value", "domain", "path", "expiry")} for c in cookies]
+
+
+class CookieStore:
+    """JSON file of logged-in Fantrax cookies shared by every process using the same path.
+
+    Reads take a shared file lock and writes an exclusive one and replace the file atomically. When the stored cookies
+    are missing, expired or rejected with :class:`NotLoggedIn`, only one process runs ``login`` while the others wait
+    and then use the cookies it saved.
+
+    Args:
+        path (str): Cookie file path, a ``.lock`` file is created next to it.
+        login (Callable[[], list[dict] | RequestsCookieJar] | None): Logs in and returns the cookies, like Selenium's ``driver.get_cookies()``.
+        max_age (float | None): Seconds saved cookies are trusted for, None only checks each cookie's own expiry.
+
+    """
+
+    def __init__(self, path: str, login: Callable[[], list[dict] | RequestsCookieJar] | None = None, max_age: float | None = None) -> None:
+        self.path: str = path
+        self.lock_path: str = f"{path}.lock"
+        self.login: Callable[[], list[dict] | RequestsCookieJar] | None = login
+        self.max_age: float | None = max_age
+        self._applied: float | None = None
+
+    def _read(self) -> dict | None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        now = time.time()
+        if self.max_age is not None and now - data.get("saved", 0) > self.max_age:
+            return None
+        cookies = [c for c in data.get("cookies", []) if not c.get("expiry") or c["expiry"] > now]
+        return {"saved": data.get("saved", 0), "cookies": cookies} if cookies else None
+
+    def load(self) -> list[dict]:
+        """Returns the saved cookies that haven't expired."""
+        with _locked(self.lock_path, exclusive=False):
+            data = self._read()
+        return data["cookies"] if data else []
+
+    def save(self, cookies: list[dict] | RequestsCookieJar) -> None:
+        """Saves cookies for every process using this path.
+
+        Args:
+            cookies (list[dict] | RequestsCookieJar): Cookies as dictionaries with ``name`` and ``value`` or a cookie jar.
+        """
+        with _locked(self.lock_path, exclusive=True):
+            self._write(_cookie_dicts(cookies))
+
+    def _write(self, cookies: list[dict]) -> float:
+        saved = time.time()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".cookies-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"saved": saved, "cookies": cookies}, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return saved
+
+    def clear(self) -> None:
+        """Deletes the saved cookies."""
+        with _locked(self.lock_path, exclusive=True):
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def apply(self, session: Session, refresh: bool = False) -> bool:
+        """Puts the saved cookies on a Session, logging in first when there are none.
+
+        Args:
+            session (Session): Session to authenticate.
+            refresh (bool): The cookies on the Session were rejected, log in again unless another process already has.
+
+        Returns:
+            bool: True when cookies were put on the Session.
+
+        Raises:
+            FantraxException: When a login is needed and there's no ``login`` function.
+        """
+        with _locked(self.lock_path, exclusive=False):
+            data = self._read()
+        if data is None or (refresh and data["saved"] == self._applied):
+            with _locked(self.lock_path, exclusive=True):
+                data = self._read()
+                if data is None or (refresh and data["saved"] == self._applied):
+                    if self.login is None:
+                        raise FantraxException(f"No valid cookies in {self.path} and no login function to get new ones")
+                    cookies = _cookie_dicts(self.login())
+                    data = {"saved": self._write(cookies), "cookies": cookies}
+        for cookie in data["cookies"]:
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain") or "", path=cookie.get("path") or "/")
+        self._applied = data["saved"]
+        return bool(data["cookies"])
+
+    def call(self, session: Session, func: Callable[Param, T], *args: Param.args, **kwargs: Param.kwargs) -> T:
+        """Runs a function with a Session authenticated from the store, refreshing the cookies and running it again
+        once when it raises :class:`NotLoggedIn`.
+
+        Args:
+            session (Session): Session the function sends requests with.
+            func (Callable): Function to run, like ``league.pending_trades``.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+        """
+        if self._applied is None:
+            self.apply(session)
+        try:
+            return func(*args, **kwargs)
+        except NotLoggedIn:
+            self.apply(session, refresh=True)
+            return func(*args, **kwargs)
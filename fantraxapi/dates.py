@@ -0,0 +1,105 @@
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from .exceptions import DateNotInSeason
+
+
+@lru_cache(maxsize=8192)
+def parse(value: str, fmt: str) -> datetime:
+    """Returns ``datetime.strptime(value, fmt)`` memoized, Fantrax repeats the same date strings across every row and call.
+
+    Args:
+        value (str): Date string.
+        fmt (str): ``strptime`` format.
+    """
+    return datetime.strptime(value, fmt)
+
+
+def parse_date(value: str, fmt: str) -> date:
+    """Returns the date of :func:`parse`.
+
+    Args:
+        value (str): Date string.
+        fmt (str): ``strptime`` format.
+    """
+    return parse(value, fmt).date()
+
+
+class SeasonCalendar:
+    """Resolves dates Fantrax shows without a year, like ``Mon 10/14``, to the year they fall on in a season.
+
+    Every day of the season is mapped from its month and day once, so resolving is a dictionary lookup instead of
+    parsing the string with both the start and end year.
+
+    Args:
+        start (date): First day of the season.
+        end (date): Last day of the season.
+
+    """
+
+    def __init__(self, start: date, end: date) -> None:
+        self.start: date = start
+        self.end: date = end
+        self._days: dict[tuple[int, int], date] = {}
+        self._labels: dict[str, date] = {}
+        day = start
+        while day <= end:
+            self._days.setdefault((day.month, day.day), day)
+            day += timedelta(days=1)
+
+    def resolve(self, month: int, day: int, value: str | None = None) -> date:
+        """Returns the date in the season with this month and day.
+
+        Args:
+            month (int): Month.
+            day (int): Day of the month.
+            value (str | None): String the date came from, used in the error.
+
+        Raises:
+            DateNotInSeason: When no day of the season has this month and day.
+        """
+        try:
+            return self._days[(month, day)]
+        except KeyError:
+            raise DateNotInSeason(value or f"{month:02d}/{day:02d}") from None
+
+    def day(self, label: str) -> date:
+        """Returns the date of a roster column label like ``Mon 10/14``.
+
+        Args:
+            label (str): Label ending in ``month/day``.
+
+        Raises:
+            DateNotInSeason: When the label isn't a day of the season.
+        """
+        if label not in self._labels:
+            try:
+                month, day = label.rsplit(" ", 1)[-1].split("/")
+                self._labels[label] = self.resolve(int(month), int(day), label)
+            except ValueError:
+                raise DateNotInSeason(label) from None
+        return self._labels[label]
+
+    def datetime(self, value: str, fmt: str) -> datetime:
+        """Returns a datetime parsed from a string without a year placed in the season.
+
+        Args:
+            value (str): Datetime string without a year, like ``Oct 14, 8:30 PM``.
+            fmt (str): ``strptime`` format of the string.
+
+        Raises:
+            DateNotInSeason: When the date isn't a day of the season.
+        """
+        parsed = parse(f"{value} 2000", f"{fmt} %Y")
+        return parsed.replace(year=self.resolve(parsed.month, parsed.day, value).year)
+
+
+@lru_cache(maxsize=64)
+def season(start: date, end: date) -> SeasonCalendar:
+    """Returns the shared SeasonCalendar of a season.
+
+    Args:
+        start (date): First day of the season.
+        end (date): Last day of the season.
+    """
+    return SeasonCalendar(start, end)
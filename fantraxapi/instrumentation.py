@@ -0,0 +1,145 @@
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from fantraxapi import tracing
+
+if TYPE_CHECKING:
+    from fantraxapi.objs import League
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_request_ids: Iterator[int] = itertools.count(1)
+# Holds the ID of the last RequestEvent emitted by each thread so the BuildEvent that follows it can link to it.
+_local: threading.local = threading.local()
+
+
+class RequestEvent:
+    """Emitted after every POST to ``/fxpa/req``.
+
+    Attributes:
+        request_id (int): ID of the POST, unique within the process.
+        league_id (str): Fantrax League ID.
+        methods (list[str]): Names of the Methods in the POST.
+        batch_size (int): Number of Methods in the POST.
+        request_bytes (int): Size of the request body.
+        response_bytes (int): Size of the raw response body.
+        status_code (int | None): HTTP Status Code or None when the POST failed.
+        network_time (float): Seconds spent sending the POST and reading the response.
+        decode_time (float): Seconds spent decoding the response JSON.
+        decoder (str): Name of the JSON decoder used.
+        error (str | None): Name of the exception raised by the request if any.
+
+    """
+
+    __slots__ = ("request_id", "league_id", "methods", "batch_size", "request_bytes", "response_bytes", "status_code", "network_time", "decode_time", "decoder", "error")
+
+    def __init__(self, league_id: str, methods: list[str], request_bytes: int = 0) -> None:
+        self.request_id: int = next(_request_ids)
+        self.league_id: str = league_id
+        self.methods: list[str] = methods
+        self.batch_size: int = len(methods)
+        self.request_bytes: int = request_bytes
+        self.response_bytes: int = 0
+        self.status_code: int | None = None
+        self.network_time: float = 0.0
+        self.decode_time: float = 0.0
+        self.decoder: str = ""
+        self.error: str | None = None
+
+    def as_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __str__(self) -> str:
+        return (
+            f"[{self.league_id}] #{self.request_id} {','.join(self.methods)} ({self.status_code}{f' {self.error}' if self.error else ''}): "
+            f"{self.request_bytes}B -> {self.response_bytes}B, network {self.network_time * 1e3:.1f}ms, decode {self.decode_time * 1e3:.1f}ms ({self.decoder})"
+        )
+
+
+class BuildEvent:
+    """Emitted after a League method finishes building objects from a response.
+
+    Attributes:
+        league_id (str): Fantrax League ID.
+        name (str): Name of the object type built.
+        count (int): Number of objects built.
+        build_time (float): Seconds spent building the objects.
+        request_id (int | None): ``request_id`` of the RequestEvent whose response the objects were built from.
+        methods (list[str]): Names of the Methods in that request.
+
+    """
+
+    __slots__ = ("league_id", "name", "count", "build_time", "request_id", "methods")
+
+    def __init__(self, league_id: str, name: str, request: RequestEvent | None = None) -> None:
+        self.league_id: str = league_id
+        self.name: str = name
+        self.count: int = 0
+        self.build_time: float = 0.0
+        self.request_id: int | None = None if request is None else request.request_id
+        self.methods: list[str] = [] if request is None else request.methods
+
+    def as_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __str__(self) -> str:
+        return f"[{self.league_id}] built {self.count} {self.name} in {self.build_time * 1e3:.1f}ms{f' from #{self.request_id}' if self.request_id else ''}"
+
+
+Hook = Callable[[RequestEvent | BuildEvent], None]
+hooks: list[Hook] = []
+
+
+def add_hook(hook: Hook) -> None:
+    """Registers a callable that's passed every RequestEvent and BuildEvent.
+
+    Args:
+        hook (Callable[[RequestEvent | BuildEvent], None]): Hook to register.
+    """
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Unregisters a hook added with :func:`add_hook`.
+
+    Args:
+        hook (Callable[[RequestEvent | BuildEvent], None]): Hook to unregister.
+    """
+    if hook in hooks:
+        hooks.remove(hook)
+
+
+def last_request() -> RequestEvent | None:
+    """Returns the last RequestEvent emitted by the current thread."""
+    return getattr(_local, "request", None)
+
+
+def emit(event: RequestEvent | BuildEvent) -> None:
+    if isinstance(event, RequestEvent):
+        _local.request = event
+    for hook in tuple(hooks):
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Instrumentation hook %r failed", hook)
+    logger.debug("%s", event)
+
+
+@contextmanager
+def build(league: "League", name: str) -> Iterator[BuildEvent]:
+    """Times building objects inside a ``build {name}`` span and emits a BuildEvent, set ``count`` on the yielded event to the number of objects built.
+
+    The BuildEvent is linked to the last RequestEvent of the current thread, the request League methods build their objects from.
+    """
+    event = BuildEvent(league.league_id, name, request=last_request())
+    with tracing.span(f"build {name}"):
+        start = time.perf_counter()
+        yield event
+        event.build_time = time.perf_counter() - start
+    emit(event)
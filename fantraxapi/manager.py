@@ -0,0 +1,254 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from typing import ParamSpec, TypeVar
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.objs import League, LivePlayer, Standings, Transaction
+
+Param = ParamSpec("Param")
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request sent through a ThrottledSession.
+
+    Args:
+        rate (float): Requests per second.
+        burst (int): Requests allowed at once before callers have to wait.
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise FantraxException("rate must be greater than 0")
+        self.rate: float = rate
+        self.burst: int = max(burst, 1)
+        self._tokens: float = float(self.burst)
+        self._refilled: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Takes one token, sleeping until it's available, and returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled) * self.rate)
+            self._refilled = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_time:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class ThrottledSession(Session):
+    """Session that takes a RateLimiter token before every request and sends it through another Session.
+
+    Cookies and headers are the wrapped Session's, so logging in once logs in every League using it.
+
+    Args:
+        session (Session): Session that sends the requests.
+        limiter (RateLimiter | None): Rate budget, None sends requests without waiting.
+
+    """
+
+    def __init__(self, session: Session, limiter: RateLimiter | None = None) -> None:
+        super().__init__()
+        self.session: Session = session
+        self.limiter: RateLimiter | None = limiter
+        self.cookies = session.cookies
+        self.headers = session.headers
+
+    def request(self, method: str, url: str, *args: Param.args, **kwargs: Param.kwargs) -> Response:
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self.session.request(method, url, *args, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+        super().close()
+
+
+class LeagueManager:
+    """Runs many Leagues over one shared connection pool and rate budget.
+
+    Leagues are bootstrapped concurrently and every fan-out runs its tasks on one thread pool. Tasks are handed out
+    round-robin between Leagues with at most ``max_per_league`` running for the same League at once, so a League
+    with many tasks can't hold every worker while the other Leagues wait. An error in a task, like a connection error,
+    is returned as a FantraxException for that task instead of stopping the other Leagues.
+
+    Args:
+        league_ids (Iterable[str] | None): Fantrax League IDs to bootstrap.
+        session (Session | None): Session to share, defaults to a new Session with a connection pool of ``max_workers``.
+        max_workers (int): Max tasks running at once across every League.
+        max_per_league (int): Max tasks running at once for one League.
+        rate (float | None): Max requests per second across every League, None turns the rate budget off.
+        burst (int): Requests allowed at once above ``rate``.
+
+    Attributes:
+        leagues (dict[str, League]): League IDs to their bootstrapped League.
+        session (ThrottledSession): Session every League sends requests through.
+
+    """
+
+    def __init__(
+        self,
+        league_ids: Iterable[str] | None = None,
+        session: Session | None = None,
+        max_workers: int = 8,
+        max_per_league: int = 2,
+        rate: float | None = None,
+        burst: int = 1,
+    ) -> None:
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session: ThrottledSession = ThrottledSession(session, RateLimiter(rate, burst=burst) if rate else None)
+        self.max_workers: int = max_workers
+        self.max_per_league: int = max(max_per_league, 1)
+        self.leagues: dict[str, League] = {}
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="LeagueManager")
+        if league_ids:
+            self.add(league_ids)
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self.session.close()
+
+    def __enter__(self) -> "LeagueManager":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __getitem__(self, league_id: str) -> League:
+        return self.leagues[league_id]
+
+    def __len__(self) -> int:
+        return len(self.leagues)
+
+    def add(self, league_ids: Iterable[str] | str) -> dict[str, FantraxException]:
+        """Bootstraps Leagues concurrently and adds them to ``leagues``.
+
+        Args:
+            league_ids (Iterable[str] | str): Fantrax League IDs.
+
+        Returns:
+            dict[str, FantraxException]: League IDs that failed to load and their errors.
+        """
+        if isinstance(league_ids, str):
+            league_ids = [league_ids]
+        tasks = {league_id: [(None, lambda league_id=league_id: League(league_id, session=self.session))] for league_id in league_ids if league_id not in self.leagues}
+        errors = {}
+        for league_id, results in self._run(tasks).items():
+            result = results[None]
+            if isinstance(result, FantraxException):
+                errors[league_id] = result
+            else:
+                self.leagues[league_id] = result
+        return errors
+
+    def _run(self, tasks: dict[str, list[tuple[Hashable, Callable[[], T]]]]) -> dict[str, dict[Hashable, T | FantraxException]]:
+        pending = {league_id: deque(items) for league_id, items in tasks.items() if items}
+        results = {league_id: {} for league_id in tasks}
+        running = dict.fromkeys(pending, 0)
+        rotation = deque(pending)
+        futures: dict[Future, tuple[str, Hashable]] = {}
+
+        def _call(func: Callable[[], T]) -> T | FantraxException:
+            try:
+                return func()
+            except FantraxException as e:
+                return e
+            except Exception as e:
+                error = FantraxException(f"{type(e).__name__}: {e}")
+                error.__cause__ = e
+                return error
+
+        while rotation or futures:
+            skipped = 0
+            while rotation and len(futures) < self.max_workers and skipped < len(rotation):
+                league_id = rotation.popleft()
+                if running[league_id] >= self.max_per_league:
+                    rotation.append(league_id)
+                    skipped += 1
+                    continue
+                key, func = pending[league_id].popleft()
+                futures[self._executor.submit(_call, func)] = (league_id, key)
+                running[league_id] += 1
+                skipped = 0
+                if pending[league_id]:
+                    rotation.append(league_id)
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                league_id, key = futures.pop(future)
+                running[league_id] -= 1
+                results[league_id][key] = future.result()
+        return results
+
+    def map(self, func: Callable[[League], T], league_ids: Iterable[str] | None = None) -> dict[str, T | FantraxException]:
+        """Runs a function once for every League.
+
+        Args:
+            func (Callable[[League], T]): Function to run with each League.
+            league_ids (Iterable[str] | None): League IDs to run for, defaults to every League.
+
+        Returns:
+            dict[str, T | FantraxException]: League IDs to the function's result or the error it raised as a FantraxException.
+        """
+        leagues = self._select(league_ids)
+        results = self._run({league.league_id: [(None, lambda league=league: func(league))] for league in leagues})
+        return {league_id: result[None] for league_id, result in results.items()}
+
+    def map_each(
+        self, func: Callable[[League, Hashable], T], items: Iterable[Hashable], league_ids: Iterable[str] | None = None
+    ) -> dict[str, dict[Hashable, T | FantraxException]]:
+        """Runs a function for every item with every League.
+
+        Args:
+            func (Callable[[League, Hashable], T]): Function to run with each League and item.
+            items (Iterable[Hashable]): Items like dates or Period Numbers.
+            league_ids (Iterable[str] | None): League IDs to run for, defaults to every League.
+
+        Returns:
+            dict[str, dict[Hashable, T | FantraxException]]: League IDs to each item's result or the error it raised as a FantraxException.
+        """
+        items = list(items)
+        leagues = self._select(league_ids)
+        return self._run({league.league_id: [(item, lambda league=league, item=item: func(league, item)) for item in items] for league in leagues})
+
+    def _select(self, league_ids: Iterable[str] | None) -> list[League]:
+        return list(self.leagues.values()) if league_ids is None else [self.leagues[league_id] for league_id in league_ids]
+
+    def standings(self, scoring_period_number: int | None = None, only_period: bool = False) -> dict[str, Standings | FantraxException]:
+        """Returns every League's :meth:`League.standings`.
+
+        Args:
+            scoring_period_number (int | None): Period Number, defaults to the latest period.
+            only_period (bool): Only that specific period's Standings, defaults to False.
+        """
+        return self.map(lambda league: league.standings(scoring_period_number=scoring_period_number, only_period=only_period))
+
+    def live_scores(self, scoring_dates: date | Iterable[date]) -> dict[str, dict[date, dict[str, list[LivePlayer]] | FantraxException]]:
+        """Returns every League's :meth:`League.live_scores` for each date.
+
+        Args:
+            scoring_dates (date | Iterable[date]): Dates of the Live Scoring.
+        """
+        return self.map_each(lambda league, scoring_date: league.live_scores(scoring_date), [scoring_dates] if isinstance(scoring_dates, date) else scoring_dates)
+
+    def transactions(self, count: int = 100) -> dict[str, list[Transaction] | FantraxException]:
+        """Returns every League's :meth:`League.transactions`.
+
+        Args:
+            count (int): Number of Transactions to return from each League.
+        """
+        return self.map(lambda league: league.transactions(count=count))
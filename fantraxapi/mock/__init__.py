@@ -0,0 +1,4 @@
+from .generator import LeagueGenerator, SyntheticSession
+from .server import MockServer, MockServerSession
+
+__all__ = ["LeagueGenerator", "MockServer", "MockServerSession", "SyntheticSession"]
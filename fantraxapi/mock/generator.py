@@ -0,0 +1,558 @@
+import json
+import random
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from typing import ParamSpec
+
+from requests import Response, Session
+
+from fantraxapi.replay import DirectoryStore, RecordedResponse, ResponseStore, request_key
+
+Param = ParamSpec("Param")
+
+positions = {
+    "206": ("Center", "C"),
+    "207": ("Wing", "W"),
+    "209": ("Defense", "D"),
+    "208": ("Skater", "Skt"),
+    "210": ("Goalie", "G"),
+}
+flex_position = "208"
+lineup = ["206", "206", "207", "207", "207", "207", "209", "209", "209", "209", "208", "210"]
+reserve_cycle = ["206", "207", "209", "207", "210"]
+
+status = {
+    "1": ("ACTIVE", "Active", "Act", "Active Roster"),
+    "2": ("RESERVE", "Reserve", "Res", "Reserve Roster"),
+    "3": ("INJURED_RESERVE", "Inj Res", "IR", "Injured Reserve"),
+    "4": ("FREE_AGENT", "Free Agent", "FA", "Free Agent"),
+    "9": ("WAIVERS", "Waivers", "WW", "On Waivers"),
+}
+
+stat_columns = ["GP", "G", "A", "PTS", "+/-", "PIM", "SOG", "HIT", "BLK", "PPP"]
+standings_columns = ["win", "loss", "tie", "points", "winpc", "gamesback", "wwOrder", "pointsFor", "pointsAgainst", "streak"]
+
+pro_teams = "ANA BOS BUF CAR CBJ CGY CHI COL DAL DET EDM FLA LAK MIN MTL NJD NSH NYI NYR OTT PHI PIT SEA SJS STL TBL TOR UTA VAN VGK WPG WSH".split()
+first_names = ["Jack", "Nathan", "Élie", "Tim", "Juuse", "Mikko", "Sebastián", "Zdeno", "Patrik", "Kirill", "Adam", "Noah", "Jesper", "Filip", "Rasmus", "Oskar"]
+last_names = ["Hughes", "Stützle", "Jääskeläinen", "Laine", "Nylander", "Dubé", "Kaprizov", "Fox", "Dahlin", "Hronek", "Forsberg", "Pelletier", "Žemgus", "Zibanejad"]
+team_words = ["Pirate", "Horde", "Yahoos", "Wookies", "Dancers", "Boys", "Devils", "Teasers", "Chaos", "Élan", "Mooses", "Sharks", "Kings", "Crows", "Bruins", "Ghosts"]
+
+
+class Player:
+    def __init__(self, number: int, primary: str, pro_team: str, rng: random.Random) -> None:
+        self.id: str = f"0{number:04x}"
+        self.name: str = f"{first_names[number % len(first_names)]} {last_names[(number * 5 + number // len(first_names)) % len(last_names)]} {number}"
+        self.primary: str = primary
+        self.pro_team: str = pro_team
+        self.skill: float = rng.uniform(0.5, 1.5)
+        self.injured: bool = rng.random() < 0.05
+
+    def scorer(self) -> dict:
+        pos_ids = [self.primary] if self.primary == "210" else [self.primary, flex_position]
+        return {
+            "scorerId": self.id,
+            "name": self.name,
+            "shortName": f"{self.name[0]}. {self.name.split(' ', 1)[1]}",
+            "teamName": f"{self.pro_team} Pro Team",
+            "teamShortName": self.pro_team,
+            "posShortNames": positions[self.primary][1],
+            "posIdsNoFlex": [self.primary],
+            "posIds": pos_ids,
+            "icons": [{"typeId": "1"}] if self.injured else [],
+        }
+
+
+class LeagueGenerator:
+    """Generates structurally valid ``/fxpa/req`` responses for a synthetic league.
+
+    Everything is derived from ``seed`` so the same parameters always produce the same responses.
+
+    Args:
+        teams (int): Number of fantasy teams.
+        roster_size (int): Number of players on each roster.
+        periods (int): Number of scoring periods, the last ``playoff_rounds`` are playoffs.
+        days_per_period (int): Number of daily periods in each scoring period.
+        transactions (int): Number of transactions in the transaction history.
+        playoff_rounds (int): Number of playoff rounds.
+        start (date): First day of the season.
+        seed (int): Random seed.
+        league_id (str): League ID of the synthetic league.
+        logged_in (bool): Answer private Methods like a logged-in Session would.
+    """
+
+    def __init__(
+        self,
+        teams: int = 12,
+        roster_size: int = 20,
+        periods: int = 25,
+        days_per_period: int = 7,
+        transactions: int = 200,
+        playoff_rounds: int = 3,
+        start: date = date(2024, 10, 7),
+        seed: int = 0,
+        league_id: str = "synthetic",
+        logged_in: bool = True,
+    ) -> None:
+        self.league_id: str = league_id
+        self.team_count: int = teams
+        self.roster_size: int = roster_size
+        self.period_count: int = periods
+        self.days_per_period: int = days_per_period
+        self.transaction_count: int = transactions
+        self.playoff_rounds: int = min(playoff_rounds, max(periods - 1, 0))
+        self.regular_periods: int = periods - self.playoff_rounds
+        self.start: date = start
+        self.seed: int = seed
+        self.logged_in: bool = logged_in
+        self.days: list[date] = [start + timedelta(days=i) for i in range(periods * days_per_period)]
+        self.end: date = self.days[-1]
+        self._points: dict[str, list[float]] = {}
+
+        rng = random.Random(seed)
+        self.teams: list[dict] = []
+        for i in range(teams):
+            words = rng.sample(team_words, 2)
+            self.teams.append({"id": f"team{i:03d}{seed:x}", "name": f"{words[0]} {words[1]} {i}", "shortName": f"T{i}", "logoUrl128": f"https://example.com/{i}.png"})
+        self.team_lookup: dict[str, dict] = {t["id"]: t for t in self.teams}
+
+        slots = lineup[:roster_size] + [reserve_cycle[i % len(reserve_cycle)] for i in range(max(roster_size - len(lineup), 0))]
+        self.slots: list[str] = slots
+        self.players: dict[str, Player] = {}
+        self.rosters: dict[str, list[Player]] = {}
+        number = 0
+        for team in self.teams:
+            roster = []
+            for slot in slots:
+                primary = rng.choice(["206", "207", "209"]) if slot == flex_position else slot
+                player = Player(number, primary, rng.choice(pro_teams), rng)
+                self.players[player.id] = player
+                roster.append(player)
+                number += 1
+            self.rosters[team["id"]] = roster
+        self.free_agents: list[Player] = []
+        for _ in range(max(teams * 5, 10)):
+            player = Player(number, rng.choice(["206", "207", "209", "210"]), rng.choice(pro_teams), rng)
+            self.players[player.id] = player
+            self.free_agents.append(player)
+            number += 1
+
+    # Season structure
+
+    def period_days(self, period: int) -> list[date]:
+        return self.days[(period - 1) * self.days_per_period : period * self.days_per_period]
+
+    def day_number(self, day: date) -> int:
+        return (day - self.start).days + 1
+
+    def period_of_day(self, day_number: int) -> int:
+        return (day_number - 1) // self.days_per_period + 1
+
+    @cached_property
+    def pairings(self) -> dict[int, list[tuple[str, str]]]:
+        ids = [t["id"] for t in self.teams]
+        if len(ids) % 2:
+            ids.append("")
+        output = {}
+        for period in range(1, self.regular_periods + 1):
+            shift = (period - 1) % max(len(ids) - 1, 1)
+            rotated = [ids[0]] + ids[1:][shift:] + ids[1:][:shift]
+            half = len(rotated) // 2
+            output[period] = [(a, b) for a, b in zip(rotated[:half], reversed(rotated[half:])) if a and b]
+        return output
+
+    def period_score(self, period: int, team_id: str) -> float:
+        return round(random.Random(f"{self.seed}:{period}:{team_id}").uniform(300, 800), 1)
+
+    def standings_rows(self, through: int | None = None, only: int | None = None) -> list[tuple[str, dict]]:
+        records = {t["id"]: {"win": 0, "loss": 0, "tie": 0, "pf": 0.0, "pa": 0.0, "streak": ""} for t in self.teams}
+        periods = [only] if only else range(1, min(through or self.regular_periods, self.regular_periods) + 1)
+        for period in periods:
+            for away, home in self.pairings.get(period, []):
+                away_score, home_score = self.period_score(period, away), self.period_score(period, home)
+                for team, us, them in ((away, away_score, home_score), (home, home_score, away_score)):
+                    record = records[team]
+                    record["pf"] += us
+                    record["pa"] += them
+                    key = "win" if us > them else "loss" if us < them else "tie"
+                    record[key] += 1
+                    record["streak"] = f"{key[0].upper()}1"
+        return sorted(records.items(), key=lambda r: (-r[1]["win"], -r[1]["pf"]))
+
+    # Players
+
+    def daily_points(self, player: Player) -> list[float]:
+        if player.id not in self._points:
+            rng = random.Random(f"{self.seed}:{player.id}")
+            self._points[player.id] = [round(rng.uniform(0, 6) * player.skill, 1) if rng.random() < 0.5 else 0.0 for _ in self.days]
+        return self._points[player.id]
+
+    def season_points(self, player: Player, day_number: int) -> float:
+        return round(sum(self.daily_points(player)[:day_number]), 1)
+
+    def games_played(self, player: Player, day_number: int) -> int:
+        return sum(1 for p in self.daily_points(player)[:day_number] if p > 0)
+
+    def roster_on(self, team_id: str, day_number: int) -> list[Player]:
+        """Team roster on a day, one reserve player swaps into the lineup each day."""
+        roster = list(self.rosters[team_id])
+        rng = random.Random(f"{self.seed}:{team_id}:{day_number}")
+        reserves = range(min(len(lineup), len(roster)), len(roster))
+        if reserves:
+            reserve = rng.choice(reserves)
+            primary = roster[reserve].primary
+            active = next((i for i in range(min(len(lineup), len(roster))) if self.slots[i] in (primary, flex_position) and roster[i].primary == primary), None)
+            if active is not None:
+                roster[active], roster[reserve] = roster[reserve], roster[active]
+        return roster
+
+    def game_cell(self, player: Player, day: date) -> dict:
+        if self.daily_points(player)[self.day_number(day) - 1] <= 0:
+            return {"content": ""}
+        opponent = pro_teams[(pro_teams.index(player.pro_team) + self.day_number(day)) % len(pro_teams)]
+        away = self.day_number(day) % 2 == 0
+        return {"content": f"{'@' if away else ''}{opponent}<br/>{day.strftime('%a')} 7:00PM", "eventId": f"g{self.day_number(day):03d}{min(player.pro_team, opponent)}"}
+
+    # Responses
+
+    def respond(self, method: str, data: dict) -> dict:
+        """Returns the ``data`` of a single Method response.
+
+        Args:
+            method (str): Method name.
+            data (dict): Method data sent in the request.
+        """
+        match method:
+            case "getFantasyLeagueInfo":
+                return self.league_info()
+            case "getRefObject":
+                return {"allObjs": {k: {"id": k, "code": c, "name": n, "shortName": s, "description": d} for k, (c, n, s, d) in status.items()}}
+            case "getLiveScoringStats":
+                return self.live_scoring(data.get("date"))
+            case "getTeamRosterInfo":
+                match data.get("view"):
+                    case "GAMES_PER_POS":
+                        return self.games_per_position(data.get("teamId"), data.get("scoringPeriod"))
+                    case "SCHEDULE_FULL":
+                        return self.roster_schedule(data.get("teamId"), data.get("period"))
+                    case _:
+                        return self.roster_stats(data.get("teamId"), data.get("period"))
+            case "getStandings":
+                return self.standings(data)
+            case "getTransactionDetailsHistory":
+                return self.transaction_history(int(data.get("maxResultsPerPage", 100)))
+            case "getTradeBlocks":
+                return {"tradeBlocks": self.trade_blocks()}
+            case "getPendingTransactions":
+                trades = self.pending_trades()
+                return {"tradeInfoList": trades} if trades else {}
+        raise KeyError(method)
+
+    def response(self, json_data: dict) -> dict:
+        """Returns the full ``/fxpa/req`` response body for a request body including ``pageError`` responses.
+
+        Args:
+            json_data (dict): Request body sent to ``/fxpa/req``.
+        """
+        responses = []
+        for msg in json_data["msgs"]:
+            if msg["method"] in ("getTradeBlocks", "getPendingTransactions") and not self.logged_in:
+                return {"pageError": {"code": "WARNING_NOT_LOGGED_IN", "title": "Not logged in"}, "responses": []}
+            if msg["data"].get("leagueId", self.league_id) != self.league_id:
+                return {"pageError": {"code": "UNEXPECTED_ERROR", "title": f"League {msg['data']['leagueId']} not found"}, "responses": []}
+            try:
+                responses.append({"data": self.respond(msg["method"], msg["data"])})
+            except KeyError:
+                return {"pageError": {"code": "UNEXPECTED_ERROR", "title": f"Unknown method {msg['method']}"}, "responses": []}
+        return {"responses": responses}
+
+    def _timestamp(self, value: datetime) -> int:
+        return int(value.timestamp() * 1e3)
+
+    def league_info(self) -> dict:
+        return {
+            "fantasySettings": {
+                "leagueName": f"Synthetic League {self.team_count}",
+                "subtitle": f"{self.start.year}-{str(self.start.year + 1)[2:]} NHL",
+                "season": {
+                    "startDate": self._timestamp(datetime.combine(self.start, datetime.min.time())),
+                    "endDate": self._timestamp(datetime.combine(self.end, datetime.max.time())),
+                },
+            },
+            "positionMap": {k: {"id": k, "name": n, "shortName": s} for k, (n, s) in positions.items()},
+        }
+
+    def scoring_period_list(self) -> list[dict]:
+        output = []
+        for period in range(1, self.period_count + 1):
+            days = self.period_days(period)
+            output.append({"name": f"({days[0].strftime('%b %d/%y')} - {days[-1].strftime('%b %d/%y')})", "value": period})
+        output.append({"name": "Full Season", "value": 0})
+        return output
+
+    def period_list(self) -> list[str]:
+        return [f"{self.day_number(d)} ({d.strftime('%a %b')} {d.day})" for d in self.days]
+
+    def _resolve_day(self, period: str | int | None) -> int:
+        return int(period) if period else len(self.days)
+
+    def roster_stats(self, team_id: str | None, period: str | int | None) -> dict:
+        team_id = team_id or self.teams[0]["id"]
+        day_number = self._resolve_day(period)
+        day = self.days[day_number - 1]
+        roster = self.roster_on(team_id, day_number)
+        header = [{"shortName": "Opp", "name": "Today", "eventStr": day.strftime("%a")}]
+        header += [{"shortName": s, "name": s, "sortKey": s} for s in stat_columns]
+        header += [{"shortName": "FPts", "name": "Fantasy Points", "sortKey": "SCORE"}, {"shortName": "FP/G", "name": "Fantasy Points per Game", "sortKey": "FPTS_PER_GAME"}]
+        skaters, goalies = [], []
+        active = min(len(lineup), len(roster))
+        for i, player in enumerate(roster):
+            score = self.season_points(player, day_number)
+            gp = self.games_played(player, day_number)
+            goals = int(score // 9)
+            assists = int(score // 6)
+            values = [gp, goals, assists, goals + assists, int(score % 7) - 3, int(score % 11), int(score // 2), int(score // 3), int(score // 4), int(score // 15)]
+            cells = [self.game_cell(player, day)] + [{"content": str(v)} for v in values]
+            cells += [{"content": f"{score:.1f}"}, {"content": f"{score / gp if gp else 0:.2f}"}]
+            status_id = "1" if i < active else ("3" if player.injured else "2")
+            row = {"posId": self.slots[i] if i < active else player.primary, "statusId": status_id, "scorer": player.scorer(), "cells": cells}
+            (goalies if player.primary == "210" else skaters).append(row)
+        skaters.append({"posId": "209", "statusId": "1", "cells": [{"content": ""} for _ in header]})
+        tables = [{"header": {"cells": header}, "rows": skaters}, {"header": {"cells": header}, "rows": goalies}]
+        totals = {"1": 0, "2": 0, "3": 0}
+        for rows in (skaters, goalies):
+            for row in rows:
+                if "scorer" in row:
+                    totals[row["statusId"]] += 1
+        return {
+            "displayedSelections": {"displayedPeriod": str(day_number), "teamId": team_id},
+            "displayedLists": {"periodList": self.period_list()},
+            "miscData": {
+                "statusTotals": [
+                    {"name": "Active", "total": str(totals["1"]), "max": str(len(lineup))},
+                    {"name": "Reserve", "total": str(totals["2"]), "max": str(max(self.roster_size, len(lineup)))},
+                    {"name": "Inj Res", "total": str(totals["3"]), "max": "3"},
+                ]
+            },
+            "tables": tables,
+            "fantasyTeams": self.teams,
+        }
+
+    def roster_schedule(self, team_id: str | None, period: str | int | None) -> dict:
+        team_id = team_id or self.teams[0]["id"]
+        day_number = self._resolve_day(period)
+        stats = self.roster_stats(team_id, period)
+        future = [d for d in self.days[day_number : day_number + 7]]
+        header = [{"shortName": d.strftime("%a %m/%d").replace(" 0", " "), "name": d.strftime("%a"), "eventStr": d.strftime("%a")} for d in future]
+        tables = []
+        for table in stats["tables"]:
+            rows = []
+            for row in table["rows"]:
+                if "scorer" in row:
+                    player = self.players[row["scorer"]["scorerId"]]
+                    rows.append({"posId": row["posId"], "cells": [self.game_cell(player, d) for d in future]})
+                else:
+                    rows.append({"posId": row["posId"], "cells": [{"content": ""} for _ in future]})
+            tables.append({"header": {"cells": header}, "rows": rows})
+        return {"displayedSelections": stats["displayedSelections"], "tables": tables, "fantasyTeams": self.teams}
+
+    def games_per_position(self, team_id: str | None, scoring_period: str | int | None) -> dict:
+        period = int(scoring_period) if scoring_period else self.period_count
+        rng = random.Random(f"{self.seed}:{team_id}:{period}:gp")
+        table = []
+        for pos_id, (name, short) in positions.items():
+            if pos_id == flex_position:
+                continue
+            table.append({"pos": name, "posShort": short, "gp": str(rng.randint(0, 20)), "min": "-", "max": 82 if pos_id != "210" else 7})
+        return {
+            "displayedLists": {"scoringPeriodList": self.scoring_period_list()},
+            "gamePlayedPerPosData": {"tableData": table},
+            "fantasyTeams": self.teams,
+        }
+
+    def live_scoring(self, scoring_date: str | None) -> dict:
+        output = {"dates": [{"object1": d.strftime("%Y-%m-%d")} for d in self.days]}
+        if not scoring_date:
+            return output
+        day = date.fromisoformat(scoring_date)
+        day_number = self.day_number(day)
+        period = self.period_of_day(day_number)
+        pairs = self.pairings.get(period) or self.playoff_pairs(period - self.regular_periods)
+        scorer_map = {}
+        all_stats = {}
+        for team in self.teams:
+            roster = self.roster_on(team["id"], day_number)[: len(lineup)]
+            scorer_map[team["id"]] = {"ACTIVE": [{"scorer": p.scorer()} for p in roster]}
+            stats_map = {p.id: {"object1": self.daily_points(p)[day_number - 1]} for p in roster}
+            stats_map["_total"] = {"object1": round(sum(v["object1"] for v in stats_map.values()), 1)}
+            all_stats[team["id"]] = {"ACTIVE": {"statsMap": stats_map}}
+        output.update({"scorerMap": {"1": scorer_map}, "matchups": [f"{a}_{h}" for a, h in pairs], "statsPerTeam": {"allTeamsStats": all_stats}})
+        return output
+
+    def _matchup_row(self, period: int, away: str, home: str) -> dict:
+        return {
+            "cells": [
+                {"teamId": away, "content": self.team_lookup[away]["name"]},
+                {"content": f"{self.period_score(period, away):,.1f}"},
+                {"teamId": home, "content": self.team_lookup[home]["name"]},
+                {"content": f"{self.period_score(period, home):,.1f}"},
+            ]
+        }
+
+    def _period_caption(self, period: int) -> str:
+        days = self.period_days(period)
+        return f"({days[0].strftime('%a %b %d, %Y')} - {days[-1].strftime('%a %b %d, %Y')})"
+
+    def playoff_pairs(self, playoff_round: int) -> list[tuple[str, str]]:
+        seeds = [team_id for team_id, _ in self.standings_rows()]
+        size = min(2 ** (self.playoff_rounds - playoff_round + 1), len(seeds) - len(seeds) % 2)
+        return [(seeds[i], seeds[size - 1 - i]) for i in range(size // 2)]
+
+    def _standings_table(self, rows: list[tuple[str, dict]]) -> dict:
+        leader = rows[0][1]["win"] if rows else 0
+        table_rows = []
+        for rank, (team_id, r) in enumerate(rows, 1):
+            played = r["win"] + r["loss"] + r["tie"]
+            values = [
+                r["win"],
+                r["loss"],
+                r["tie"],
+                r["win"] * 2 + r["tie"],
+                f"{r['win'] / played:.3f}" if played else "-",
+                leader - r["win"],
+                rank,
+                f"{r['pf']:,.1f}",
+                f"{r['pa']:,.1f}",
+                r["streak"],
+            ]
+            table_rows.append(
+                {"fixedCells": [{"content": str(rank)}, {"teamId": team_id, "content": self.team_lookup[team_id]["name"]}], "cells": [{"content": str(v)} for v in values]}
+            )
+        return {"caption": "Standings", "header": {"cells": [{"key": k, "shortName": k} for k in standings_columns]}, "rows": table_rows}
+
+    def standings(self, data: dict) -> dict:
+        brackets = [{"id": ".1", "name": "3rd Place"}, {"id": ".2", "name": "Toilet Bowl"}] if self.playoff_rounds else []
+        tabs = [{"id": "STANDINGS", "name": "Standings"}, {"id": "SCHEDULE", "name": "Schedule"}, {"id": "PLAYOFFS", "name": "Playoffs"}] + brackets
+        output = {"displayedLists": {"tabs": tabs}, "displayedSelections": {"view": data.get("view") or "STANDINGS"}, "fantasyTeamInfo": self.team_lookup}
+        view = data.get("view")
+        if view == "SCHEDULE":
+            output["tableList"] = [
+                {"caption": f"Scoring Period {period}", "subCaption": self._period_caption(period), "rows": [self._matchup_row(period, a, h) for a, h in pairs]}
+                for period, pairs in self.pairings.items()
+            ]
+        elif view == "PLAYOFFS":
+            output["tableList"] = [self._standings_table(self.standings_rows())]
+            for playoff_round in range(1, self.playoff_rounds + 1):
+                period = self.regular_periods + playoff_round
+                rows = [self._matchup_row(period, a, h) for a, h in self.playoff_pairs(playoff_round)]
+                output["tableList"].append({"caption": f"Playoffs - Round {playoff_round}", "subCaption": self._period_caption(period), "rows": rows})
+        elif view and view.startswith("."):
+            period = self.period_count
+            seeds = [team_id for team_id, _ in self.standings_rows()]
+            offset = 2 if view == ".1" else len(seeds) - 2
+            rows = [self._matchup_row(period, seeds[offset], seeds[offset + 1])] if len(seeds) >= 4 else []
+            output["tableList"] = [self._standings_table(self.standings_rows()), {"caption": f"Round {self.playoff_rounds}", "rows": rows}]
+        else:
+            period = int(data["period"]) if data.get("period") else None
+            only = period if data.get("timeStartType") == "PERIOD_ONLY" else None
+            output["tableList"] = [self._standings_table(self.standings_rows(through=period, only=only))]
+        return output
+
+    @cached_property
+    def _transaction_rows(self) -> list[dict]:
+        rng = random.Random(f"{self.seed}:transactions")
+        rows = []
+        count = 0
+        moment = datetime.combine(self.end, datetime.min.time()).replace(hour=23)
+        step = (self.end - self.start) / max(self.transaction_count, 1)
+        while count < self.transaction_count:
+            team = rng.choice(self.teams)
+            tx_id = f"tx{count:06d}"
+            moment -= step
+            cells = [{"teamId": team["id"], "content": team["name"]}, {"content": moment.strftime("%a %b %d, %Y, %I:%M%p")}]
+            added = rng.choice(self.free_agents)
+            kind = rng.choice(["CLAIM", "CLAIM", "DROP"])
+            if kind == "CLAIM":
+                rows.append({"txSetId": tx_id, "transactionCode": "CLAIM", "claimType": rng.choice(["FA", "WW"]), "scorer": added.scorer(), "cells": cells})
+                count += 1
+                if count < self.transaction_count:
+                    dropped = rng.choice(self.rosters[team["id"]])
+                    rows.append({"txSetId": tx_id, "transactionCode": "DROP", "scorer": dropped.scorer(), "cells": cells})
+                    count += 1
+            else:
+                rows.append({"txSetId": tx_id, "transactionCode": "DROP", "scorer": rng.choice(self.rosters[team["id"]]).scorer(), "cells": cells})
+                count += 1
+        return rows
+
+    def transaction_history(self, per_page: int) -> dict:
+        return {"table": {"rows": self._transaction_rows[:per_page]}}
+
+    def trade_blocks(self) -> list[dict]:
+        blocks = []
+        for i, team in enumerate(self.teams):
+            if i % 3 == 2:
+                blocks.append({"teamId": team["id"]})
+                continue
+            roster = self.rosters[team["id"]]
+            offered = {}
+            for player in roster[i % 3 :: 5]:
+                offered.setdefault(player.primary, []).append(player.scorer())
+            block = {
+                "teamId": team["id"],
+                "lastUpdated": {"date": self._timestamp(datetime.combine(self.start, datetime.min.time()) + timedelta(days=i))},
+                "comment": {"body": f"Block {i}"},
+                "scorersOffered": {"scorers": offered},
+                "positionsWanted": {"positions": ["209"]},
+                "statsWanted": {"stats": [{"shortName": "HIT"}]},
+            }
+            blocks.append(block)
+        return blocks
+
+    def pending_trades(self) -> list[dict]:
+        trades = []
+        when = datetime.combine(self.start + (self.end - self.start) / 2, datetime.min.time()).replace(hour=3)
+        info = f"{when.strftime('%b')} {when.day}, {when.strftime('%I:%M %p')} EDT"
+        for i in range(0, min(len(self.teams), 6) - 1, 2):
+            a, b = self.teams[i]["id"], self.teams[i + 1]["id"]
+            trades.append(
+                {
+                    "txSetId": f"trade{i}",
+                    "creatorTeamId": a,
+                    "usefulInfo": [{"name": "Proposed", "value": info}, {"name": "Accepted", "value": info}, {"name": "To be executed", "value": info}],
+                    "moves": [
+                        {"draftPick": {"year": self.start.year + 1, "round": i + 1, "origOwnerTeam": {"id": a}}, "from": {"teamId": a}, "to": {"teamId": b}},
+                        {"scorer": self.rosters[b][0].scorer(), "scorePerGame": 2.5, "score": 50.0, "from": {"teamId": b}, "to": {"teamId": a}},
+                    ],
+                }
+            )
+        return trades
+
+
+class SyntheticSession(Session):
+    """Session that answers ``/fxpa/req`` requests from a LeagueGenerator without touching the network.
+
+    Args:
+        generator (LeagueGenerator): Generator to answer requests with.
+        store (str | ResponseStore | None): Also save every generated response to this fixture directory or store.
+    """
+
+    def __init__(self, generator: LeagueGenerator, store: str | ResponseStore | None = None) -> None:
+        super().__init__()
+        self.generator: LeagueGenerator = generator
+        self.store: ResponseStore | None = DirectoryStore(store) if isinstance(store, str) else store
+
+    def post(self, url: str, data: dict | None = None, json: dict | None = None, **kwargs: Param.kwargs) -> Response:
+        content = dumps(self.generator.response(json))
+        if self.store is not None:
+            self.store.put(request_key(json), RecordedResponse(self.generator.league_id, json, 200, "OK", content))
+        response = Response()
+        response.url = url
+        response.status_code = 200
+        response.reason = "OK"
+        response.encoding = "utf-8"
+        response._content = content
+        return response
+
+
+def dumps(data: dict) -> bytes:
+    """Encodes a response body the same compact way Fantrax does."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
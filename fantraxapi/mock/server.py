@@ -0,0 +1,233 @@
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ParamSpec
+from urllib.parse import parse_qs, urlsplit
+
+from requests import Response, Session
+
+from fantraxapi.mock.generator import LeagueGenerator, dumps
+from fantraxapi.replay import ResponseStore, request_key
+
+Param = ParamSpec("Param")
+logger: logging.Logger = logging.getLogger(__name__)
+
+fantrax_url = "https://www.fantrax.com"
+
+
+class ServerStats:
+    """Counters kept by a MockServer.
+
+    Attributes:
+        requests (int): Number of ``/fxpa/req`` requests received.
+        messages (int): Number of Methods across all requests.
+        errors (int): Number of injected error responses.
+        throttled (int): Number of requests rejected with a 429.
+        missing (int): Number of requests with no recorded response.
+
+    """
+
+    __slots__ = ("requests", "messages", "errors", "throttled", "missing")
+
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.messages: int = 0
+        self.errors: int = 0
+        self.throttled: int = 0
+        self.missing: int = 0
+
+    def as_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+class MockServer:
+    """Local HTTP stand-in for ``https://www.fantrax.com/fxpa/req`` that answers the ``msgs`` batch format.
+
+    Requests are answered by the LeagueGenerator for the request's ``leagueId`` or from a store of recorded responses.
+
+    Args:
+        generators (list[LeagueGenerator] | LeagueGenerator | None): Generators to answer requests with.
+        store (ResponseStore | None): Recorded responses to answer requests with when no generator matches the league.
+        host (str): Interface to bind to.
+        port (int): Port to bind to, 0 picks a free port.
+        latency (float): Seconds added to every response.
+        jitter (float): Up to this many extra random seconds added to every response.
+        per_message_latency (float): Seconds added for every Method in a request.
+        error_rate (float): Fraction of requests answered with an error.
+        error_status (int): HTTP Status Code of injected errors, 200 sends an ``UNEXPECTED_ERROR`` pageError instead.
+        rate_limit (float | None): Requests per second allowed before answering 429, None turns throttling off.
+        burst (int): Requests allowed above ``rate_limit`` in a burst.
+        seed (int | None): Random seed for jitter and error injection.
+        cache (bool): Keep every generated response so repeated requests don't pay the generation cost again.
+
+    Attributes:
+        stats (ServerStats): Request counters.
+
+    """
+
+    def __init__(
+        self,
+        generators: list[LeagueGenerator] | LeagueGenerator | None = None,
+        store: ResponseStore | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        per_message_latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limit: float | None = None,
+        burst: int = 1,
+        seed: int | None = None,
+        cache: bool = True,
+    ) -> None:
+        if isinstance(generators, LeagueGenerator):
+            generators = [generators]
+        self.generators: dict[str, LeagueGenerator] = {g.league_id: g for g in generators or []}
+        self.store: ResponseStore | None = store
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.per_message_latency: float = per_message_latency
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.rate_limit: float | None = rate_limit
+        self.burst: int = burst
+        self.cache: dict[tuple[str, str], bytes] | None = {} if cache else None
+        self.stats: ServerStats = ServerStats()
+        self._random: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = float(burst)
+        self._refilled: float = time.monotonic()
+        self._httpd: ThreadingHTTPServer = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        """Starts serving on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="MockServer", daemon=True)
+            self._thread.start()
+            logger.debug("MockServer listening on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def session(self) -> "MockServerSession":
+        """Returns a Session that sends Fantrax requests to this server instead."""
+        return MockServerSession(self.url)
+
+    def _throttled(self) -> bool:
+        if self.rate_limit is None:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._refilled) * self.rate_limit)
+            self._refilled = now
+            if self._tokens < 1:
+                return True
+            self._tokens -= 1
+            return False
+
+    def handle(self, league_id: str, json_data: dict) -> tuple[int, dict | bytes]:
+        """Returns the HTTP Status Code and body for a ``/fxpa/req`` request.
+
+        Args:
+            league_id (str): ``leagueId`` query parameter.
+            json_data (dict): Request body.
+        """
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.messages += len(json_data.get("msgs", []))
+            delay = self.latency + self.per_message_latency * len(json_data.get("msgs", [])) + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+        if self._throttled():
+            with self._lock:
+                self.stats.throttled += 1
+            return 429, {"pageError": {"code": "TOO_MANY_REQUESTS", "title": "Too Many Requests"}}
+        if delay:
+            time.sleep(delay)
+        if failed:
+            with self._lock:
+                self.stats.errors += 1
+            return self.error_status, {"pageError": {"code": "UNEXPECTED_ERROR", "title": "Injected error"}}
+        if "msgs" not in json_data:
+            return 400, {"pageError": {"code": "UNEXPECTED_ERROR", "title": "Request has no msgs"}}
+        if league_id in self.generators:
+            if self.cache is None:
+                return 200, self.generators[league_id].response(json_data)
+            key = (league_id, request_key(json_data))
+            if key not in self.cache:
+                self.cache[key] = dumps(self.generators[league_id].response(json_data))
+            return 200, self.cache[key]
+        if self.store is not None and (recorded := self.store.get(request_key(json_data))) is not None:
+            return recorded.status_code, recorded.content
+        with self._lock:
+            self.stats.missing += 1
+        return 200, {"pageError": {"code": "UNEXPECTED_ERROR", "title": f"No data for league {league_id}"}}
+
+
+def _handler(server: MockServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            url = urlsplit(self.path)
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if url.path != "/fxpa/req":
+                return self._send(404, {"pageError": {"code": "UNEXPECTED_ERROR", "title": f"Unknown path {url.path}"}})
+            try:
+                json_data = json.loads(body) if body else {}
+            except ValueError:
+                return self._send(400, {"pageError": {"code": "UNEXPECTED_ERROR", "title": "Invalid JSON"}})
+            league_id = parse_qs(url.query).get("leagueId", [""])[0]
+            self._send(*server.handle(league_id, json_data))
+
+        def _send(self, status_code: int, body: dict | bytes) -> None:
+            content = body if isinstance(body, bytes) else dumps(body)
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format: str, *args: object) -> None:
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    return Handler
+
+
+class MockServerSession(Session):
+    """Session that sends requests meant for ``https://www.fantrax.com`` to a MockServer.
+
+    Args:
+        url (str): Base URL of the MockServer.
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url: str = url.rstrip("/")
+
+    def request(self, method: str, url: str, *args: Param.args, **kwargs: Param.kwargs) -> Response:
+        if url.startswith(fantrax_url):
+            url = f"{self.url}{url.removeprefix(fantrax_url)}"
+        return super().request(method, url, *args, **kwargs)
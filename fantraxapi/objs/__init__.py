@@ -1,15 +1,19 @@
-from .game import Game
-from .league import League
-from .player import LivePlayer, Player
-from .position import Position, PositionCount
-from .roster import Roster, RosterRow
-from .scoring_period import Matchup, ScoringPeriod, ScoringPeriodResult
-from .standings import Record, Standings
-from .status import Status
-from .team import Team
-from .trade import Trade, TradeDraftPick, TradePlayer
-from .trade_block import TradeBlock
-from .transaction import Transaction, TransactionPlayer
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .league import League
+    from .player import LivePlayer, Player
+    from .position import Position, PositionCount
+    from .roster import Roster, RosterRow
+    from .scoring_period import Matchup, ScoringPeriod, ScoringPeriodResult
+    from .standings import Record, Standings
+    from .status import Status
+    from .team import Team
+    from .trade import Trade, TradeDraftPick, TradePlayer
+    from .trade_block import TradeBlock
+    from .transaction import Transaction, TransactionPlayer
 
 __all__ = [
     "TradeDraftPick",
@@ -34,3 +38,40 @@ __all__ = [
     "Transaction",
     "TransactionPlayer",
 ]
+
+# Classes imported on first access from the module they're defined in.
+_lazy_attributes: dict[str, str] = {
+    "Game": ".game",
+    "League": ".league",
+    "LivePlayer": ".player",
+    "Player": ".player",
+    "Position": ".position",
+    "PositionCount": ".position",
+    "Roster": ".roster",
+    "RosterRow": ".roster",
+    "Matchup": ".scoring_period",
+    "ScoringPeriod": ".scoring_period",
+    "ScoringPeriodResult": ".scoring_period",
+    "Record": ".standings",
+    "Standings": ".standings",
+    "Status": ".status",
+    "Team": ".team",
+    "Trade": ".trade",
+    "TradeDraftPick": ".trade",
+    "TradePlayer": ".trade",
+    "TradeBlock": ".trade_block",
+    "Transaction": ".transaction",
+    "TransactionPlayer": ".transaction",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _lazy_attributes:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_lazy_attributes[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_attributes})
@@ -1,7 +1,7 @@
-from datetime import date, datetime, time
+from datetime import date, time
 from typing import TYPE_CHECKING, Self
 
-from ..exceptions import DateNotInSeason
+from ..schemas import GameData
 from .base import FantraxBaseObject
 from .player import Player
 
@@ -24,38 +24,17 @@ class Game(FantraxBaseObject):
 
     """
 
-    def __init__(self, league: "League", player: Player, game_date: str, data: dict) -> None:
+    def __init__(self, league: "League", player: Player, game_date: str, data: dict | GameData) -> None:
         super().__init__(league, data)
-        self.id: str = self._data["eventId"]
+        if not isinstance(data, GameData):
+            data = GameData.parse(data, game_date, player.team_short_name, self.league.start_date.date(), self.league.end_date.date())
+        self.id: str = data.id
         self.player: Player = player
-        start = datetime.strptime(f"{game_date} {self.league.start_date.year}", "%a %m/%d %Y").date()
-        end = datetime.strptime(f"{game_date} {self.league.end_date.year}", "%a %m/%d %Y").date()
-        league_start = self.league.start_date.date()
-        league_end = self.league.end_date.date()
-        if league_end >= start >= league_start:
-            self.date: date = start
-        elif league_end >= end >= league_start:
-            self.date: date = end
-        else:
-            raise DateNotInSeason(game_date)
-
-        self.time: time | None = None
-        parts = data["content"].removesuffix(" F").split("\u003cbr/\u003e")
-        if ":" in parts[1]:
-            self.opponent: str = parts[0]
-            if self.opponent.startswith("@"):
-                self.opponent = self.opponent[1:]
-                home = self.player.team_short_name
-            else:
-                home = self.opponent
-
-            self.time = datetime.strptime(parts[1].split(" ")[1], "%I:%M%p").time()
-        else:
-            home = "".join(i for i in parts[0] if not i.isdigit() and i not in [" ", "@"])
-            away = "".join(i for i in parts[1] if not i.isdigit() and i not in [" ", "@"])
-            self.opponent = away if home == self.player.team_short_name else home
-        self.home: bool = home == self.player.team_short_name
-        self.away: bool = home != self.player.team_short_name
+        self.date: date = data.date
+        self.opponent: str = data.opponent
+        self.time: time | None = data.time
+        self.home: bool = data.home
+        self.away: bool = not data.home
 
     def __eq__(self, other: Self) -> bool:
         return self.id == other.id
@@ -1,13 +1,16 @@
 import re
+import threading
 from datetime import date, datetime
 from typing import ParamSpec
 
 from requests import Session
 
-from fantraxapi import NotLoggedIn, NotTeamInLeague, api
+from fantraxapi import NotLoggedIn, NotTeamInLeague, api, instrumentation, tracing
 
 from ..exceptions import DateNotInSeason, PeriodNotInSeason
-from .player import LivePlayer
+from ..schemas import LiveScoresData, TransactionRowData
+from ..search import SearchIndex
+from .player import LivePlayer, Player
 from .position import Position, PositionCount
 from .roster import Roster
 from .scoring_period import ScoringPeriod, ScoringPeriodResult
@@ -21,6 +24,10 @@ from .transaction import Transaction
 Param = ParamSpec("Param")
 
 
+def _reuse(current: Position | Status | ScoringPeriod | None, data: dict) -> Position | Status | ScoringPeriod | None:
+    return current if current is not None and current._data == data else None
+
+
 class League:
     """League Class to represent a Fantrax League.
 
@@ -43,6 +50,12 @@ class League:
         scoring_dates (dict[int, date]): Dictionary of daily period numbers to dates that have scoring in this season.
         teams (list[Team]): List of Teams in the League.
         team_lookup (dict[str, Team]): Dictionary of Team IDs to Teams.
+
+    One League can be shared between threads. Refreshes build new dictionaries and lists and assign them under a lock,
+    so each attribute is always a complete dictionary or list. The attributes are assigned one at a time though, so
+    while a refresh runs a reader can see one attribute from the new refresh and another from the previous one, and a
+    Team whose data changed is updated in place. Unchanged Teams, Positions, Statuses and ScoringPeriods keep their
+    identity across refreshes.
     """
 
     def __init__(self, league_id: str, session: Session | None = None) -> None:
@@ -56,56 +69,106 @@ class League:
         self.positions: dict[str, Position] = {}
         self.status: dict[str, Status] = {}
         self.scoring_periods: dict[int, ScoringPeriod] = {}
-        self._scoring_periods_lookup: dict[str, ScoringPeriod] | None = None
+        self._scoring_periods_lookup: tuple[dict[int, ScoringPeriod] | None, dict[str, ScoringPeriod]] = (None, {})
         self.scoring_dates: dict[int, date] = {}
-        self._teams: list[Team] | None = None
+        self.teams: list[Team] = []
         self._team_lookup: dict[str, Team] | None = None
+        self._team_data: dict[str, dict] = {}
+        self._team_index: SearchIndex = SearchIndex()
+        self._players: SearchIndex = SearchIndex()
+        self._lock: threading.RLock = threading.RLock()
         self.reset_info()
 
+    @tracing.traced
     def reset_info(self) -> None:
         responses = api.get_init_info(self)
-        self.name = responses[0]["fantasySettings"]["leagueName"]
-        self.year = responses[0]["fantasySettings"]["subtitle"]
-        self.start_date = datetime.fromtimestamp(responses[0]["fantasySettings"]["season"]["startDate"] / 1e3)
-        self.end_date = datetime.fromtimestamp(responses[0]["fantasySettings"]["season"]["endDate"] / 1e3)
-        self.positions = {k: Position(self, v) for k, v in responses[0]["positionMap"].items()}
-        self.status = {k: Status(self, v) for k, v in responses[1]["allObjs"].items() if "name" in v}
+        with instrumentation.build(self, "League") as event:
+            self._reset_info(responses)
+            event.count = 1
+
+    def _reset_info(self, responses: list[dict]) -> None:
+        settings = responses[0]["fantasySettings"]
         period_to_day_list = {}
         for s in responses[4]["displayedLists"]["periodList"]:
             period, s = s.split(" ", maxsplit=1)
             period_to_day_list[s[5:-1]] = int(period)
-        self.scoring_dates = {}
+        scoring_dates = {}
         for day in responses[2]["dates"]:
-            scoring_date = datetime.strptime(day["object1"], "%Y-%m-%d").date()
+            scoring_date = date.fromisoformat(day["object1"])
             key = scoring_date.strftime("%b %d")
             if "0" in key and not key.endswith("0"):
                 key = key.replace("0", "")
-            self.scoring_dates[period_to_day_list[key]] = scoring_date
-        self.scoring_periods = {p["value"]: ScoringPeriod(self, p) for p in responses[3]["displayedLists"]["scoringPeriodList"] if p["name"] != "Full Season"}
-        self._scoring_periods_lookup = None
-        self._update_teams(responses[3]["fantasyTeams"])
+            scoring_dates[period_to_day_list[key]] = scoring_date
+        with self._lock:
+            positions = {k: _reuse(self.positions.get(k), v) or Position(self, v) for k, v in responses[0]["positionMap"].items()}
+            status = {k: _reuse(self.status.get(k), v) or Status(self, v) for k, v in responses[1]["allObjs"].items() if "name" in v}
+            scoring_periods = {}
+            for p in responses[3]["displayedLists"]["scoringPeriodList"]:
+                if p["name"] != "Full Season":
+                    scoring_periods[p["value"]] = _reuse(self.scoring_periods.get(p["value"]), p) or ScoringPeriod(self, p)
+            self.name = settings["leagueName"]
+            self.year = settings["subtitle"]
+            self.start_date = datetime.fromtimestamp(settings["season"]["startDate"] / 1e3)
+            self.end_date = datetime.fromtimestamp(settings["season"]["endDate"] / 1e3)
+            self.positions = positions
+            self.status = status
+            self.scoring_dates = scoring_dates
+            self.scoring_periods = scoring_periods
+            self._update_teams(responses[3]["fantasyTeams"])
 
     def _update_teams(self, team_data: dict | list) -> None:
         if isinstance(team_data, list):
             team_data = {data["id"]: data for data in team_data}
-        self.teams = [Team(self, team_id, data) for team_id, data in team_data.items()]
-        self._team_lookup = None
+        if team_data == self._team_data:
+            return
+        with self._lock:
+            if team_data == self._team_data:
+                return
+            lookup = {t.id: t for t in self.teams}
+            teams = []
+            for team_id, data in team_data.items():
+                team = lookup.get(team_id)
+                if team is None:
+                    team = Team(self, team_id, data)
+                elif team._data != data:
+                    team._update(data)
+                teams.append(team)
+            index = SearchIndex()
+            for team in teams:
+                index.add(team.id, team.name, team)
+            self.teams = teams
+            self._team_lookup = {t.id: t for t in teams}
+            self._team_index = index
+            self._team_data = team_data
+
+    def _index_roster(self, roster: Roster) -> None:
+        for row in roster.rows:
+            if row.player:
+                self._players.add(row.player.id, row.player.name, row.player)
 
     @property
     def team_lookup(self) -> dict[str, Team]:
-        if self._team_lookup is None:
-            self._team_lookup = {t.id: t for t in self.teams}
-        return self._team_lookup
+        lookup = self._team_lookup
+        if lookup is None:
+            lookup = {t.id: t for t in self.teams}
+            self._team_lookup = lookup
+        return lookup
 
     @property
     def scoring_periods_lookup(self) -> dict[str, ScoringPeriod]:
-        if self._scoring_periods_lookup is None:
-            self._scoring_periods_lookup = {v.range: v for k, v in self.scoring_periods.items()}
-        return self._scoring_periods_lookup
+        scoring_periods = self.scoring_periods
+        source, lookup = self._scoring_periods_lookup
+        if source is not scoring_periods:
+            lookup = {v.range: v for k, v in scoring_periods.items()}
+            self._scoring_periods_lookup = (scoring_periods, lookup)
+        return lookup
 
     def team(self, team_identifier: str) -> Team:
         """Return a Team object for the given Team ID or where the Team name contains the given value.
 
+        Names are compared ignoring case and accents, an exact name wins over a name starting with the value, which wins
+        over a name only containing it.
+
         Args:
             team_identifier (str): Team identifier.
 
@@ -118,10 +181,28 @@ class League:
         """
         if team_identifier in self.team_lookup:
             return self.team_lookup[team_identifier]
-        if t := next((t for t in self.teams if team_identifier.lower() in t.name.lower()), None):
-            return t
+        if teams := self._team_index.search(team_identifier, limit=1):
+            return teams[0]
         raise NotTeamInLeague(f"Team Identifier: {team_identifier} not found in League: {self.name}")
 
+    def find_player(self, name: str, limit: int | None = None) -> list[Player]:
+        """Returns Players whose name matches the given value out of every Player on a Roster built for this League by
+        :meth:`team_roster`, :func:`fantraxapi.bulk.build` or :func:`fantraxapi.serialize.loads`, no request is made.
+
+        Names are compared ignoring case and accents, exact names come first, then names or last names starting with the
+        value, then names containing it.
+
+        Args:
+            name (str): Player name or part of a name.
+            limit (int | None): Maximum number of Players to return.
+
+        Returns:
+            list[Player]: The latest Player object seen for each matching Player.
+
+        """
+        return self._players.search(name, limit=limit)
+
+    @tracing.traced
     def scoring_period_results(self, season: bool = True, playoffs: bool = True) -> dict[int, ScoringPeriodResult]:
         """Returns Season ScoringPeriodResult objects for the league.
 
@@ -137,34 +218,40 @@ class League:
         response = api.get_standings(self, view="SCHEDULE")
 
         if season:
-            for scoring_period_data in response["tableList"]:
-                scoring_period = ScoringPeriodResult(self, scoring_period_data)
-                periods[scoring_period.period.number] = scoring_period
+            with instrumentation.build(self, "ScoringPeriodResult") as event:
+                for scoring_period_data in response["tableList"]:
+                    scoring_period = ScoringPeriodResult(self, scoring_period_data)
+                    periods[scoring_period.period.number] = scoring_period
+                event.count = len(periods)
 
         if playoffs:
             playoff_responses = api.get_standings(self, views=["PLAYOFFS"] + [tab["id"] for tab in response["displayedLists"]["tabs"] if tab["id"].startswith(".")])
 
-            other_data = {}
-            for bracket_response in playoff_responses[1:]:
-                other_id = bracket_response["displayedSelections"]["view"]
-                name = next((tab["name"] for tab in bracket_response["displayedLists"]["tabs"] if tab["id"] == other_id), None)
-                for obj in bracket_response["tableList"]:
+            with instrumentation.build(self, "Playoff ScoringPeriodResult") as event:
+                other_data = {}
+                with tracing.span("parse brackets", brackets=len(playoff_responses) - 1):
+                    for bracket_response in playoff_responses[1:]:
+                        other_id = bracket_response["displayedSelections"]["view"]
+                        name = next((tab["name"] for tab in bracket_response["displayedLists"]["tabs"] if tab["id"] == other_id), None)
+                        for obj in bracket_response["tableList"]:
+                            if obj["caption"] == "Standings":
+                                continue
+                            playoff_number = int(re.search(r"(\d+)$", obj["caption"]).group())
+                            if playoff_number not in other_data:
+                                other_data[playoff_number] = []
+                            other_data[playoff_number].append((name, obj))
+
+                for obj in reversed(playoff_responses[0]["tableList"]):
                     if obj["caption"] == "Standings":
                         continue
                     playoff_number = int(re.search(r"(\d+)$", obj["caption"]).group())
-                    if playoff_number not in other_data:
-                        other_data[playoff_number] = []
-                    other_data[playoff_number].append((name, obj))
-
-            for obj in reversed(playoff_responses[0]["tableList"]):
-                if obj["caption"] == "Standings":
-                    continue
-                playoff_number = int(re.search(r"(\d+)$", obj["caption"]).group())
-                scoring_period = ScoringPeriodResult(self, obj, other_data=other_data[playoff_number] if playoff_number in other_data else None)
-                periods[scoring_period.period.number] = scoring_period
+                    scoring_period = ScoringPeriodResult(self, obj, other_data=other_data[playoff_number] if playoff_number in other_data else None)
+                    periods[scoring_period.period.number] = scoring_period
+                    event.count += 1
 
         return periods
 
+    @tracing.traced
     def standings(self, scoring_period_number: int | None = None, only_period: bool = False) -> Standings:
         """Returns Standings object that represents either the standings after a period or the latest period's standings when scoring_period_number is None.
 
@@ -182,8 +269,12 @@ class League:
             kwargs["timeframeType"] = "BY_PERIOD"
             kwargs["timeStartType"] = "PERIOD_ONLY" if only_period else "FROM_SEASON_START"
         response = api.get_standings(self, **kwargs)
-        return Standings(self, response["tableList"][0], scoring_period_number=scoring_period_number)
+        with instrumentation.build(self, "Standings") as event:
+            standings = Standings(self, response["tableList"][0], scoring_period_number=scoring_period_number, only_period=scoring_period_number is not None and only_period)
+            event.count = 1
+        return standings
 
+    @tracing.traced
     def pending_trades(self) -> list[Trade]:
         """Returns a list of Trade objects that represent pending trades.
 
@@ -193,15 +284,21 @@ class League:
         Raises:
             NotLoggedIn: When there is no logged-in User in the Session object.
         """
-        if not self.logged_in:
-            self.trade_block()
-        response = api.get_pending_transactions(self)
+        try:
+            response = api.get_pending_transactions(self)
+            self.logged_in = True
+        except NotLoggedIn:
+            self.logged_in = False
+            raise
         trades = []
-        if "tradeInfoList" in response:
-            for trade in response["tradeInfoList"]:
-                trades.append(Trade(self, trade))
+        with instrumentation.build(self, "Trade") as event:
+            if "tradeInfoList" in response:
+                for trade in response["tradeInfoList"]:
+                    trades.append(Trade(self, trade))
+            event.count = len(trades)
         return trades
 
+    @tracing.traced
     def trade_block(self) -> list[TradeBlock]:
         """Returns a list of TradeBlock objects that represent each Trade Block.
 
@@ -212,13 +309,17 @@ class League:
             NotLoggedIn: When there is no logged-in User in the Session object.
         """
         try:
-            response = [TradeBlock(self, block) for block in api.get_trade_blocks(self) if len(block) > 2]
+            response = api.get_trade_blocks(self)
             self.logged_in = True
-            return response
         except NotLoggedIn:
             self.logged_in = False
             raise
+        with instrumentation.build(self, "TradeBlock") as event:
+            trade_blocks = [TradeBlock(self, block) for block in response if len(block) > 2]
+            event.count = len(trade_blocks)
+        return trade_blocks
 
+    @tracing.traced
     def transactions(self, count: int = 100) -> list[Transaction]:
         """Returns a list of Transaction objects that represent the latest transactions.
 
@@ -231,16 +332,20 @@ class League:
         """
         response = api.get_transaction_history(self, per_page_results=count)
         transactions = []
-        transaction_data = []
-        for row in response["table"]["rows"]:
-            if transaction_data and row["txSetId"] != transaction_data[0]["txSetId"]:
+        with instrumentation.build(self, "Transaction") as event:
+            transaction_data = []
+            for row in response["table"]["rows"]:
+                row = TransactionRowData.parse(row)
+                if transaction_data and row.tx_set_id != transaction_data[0].tx_set_id:
+                    transactions.append(Transaction(self, transaction_data))
+                    transaction_data = []
+                transaction_data.append(row)
+            if transaction_data:
                 transactions.append(Transaction(self, transaction_data))
-                transaction_data = []
-            transaction_data.append(row)
-        if transaction_data:
-            transactions.append(Transaction(self, transaction_data))
+            event.count = len(transactions)
         return transactions
 
+    @tracing.traced
     def position_counts(self, team_id: str, scoring_period_number: int | None = None) -> dict[str, PositionCount]:
         """Returns a Dictionary of PositionCount objects that represents the positions used for a given Team ID for a specific period or the latest period's standings when scoring_period_number is None.
 
@@ -258,8 +363,12 @@ class League:
         if scoring_period_number is not None and scoring_period_number not in self.scoring_periods:
             raise PeriodNotInSeason(scoring_period_number)
         response = api.get_team_roster_position_counts(self, team_id, scoring_period_number=scoring_period_number)
-        return {p["posShort"]: PositionCount(self, p) for p in response["gamePlayedPerPosData"]["tableData"]}
+        with instrumentation.build(self, "PositionCount") as event:
+            counts = {p["posShort"]: PositionCount(self, p) for p in response["gamePlayedPerPosData"]["tableData"]}
+            event.count = len(counts)
+        return counts
 
+    @tracing.traced
     def live_scores(self, scoring_date: date) -> dict[str, list[LivePlayer]]:
         """Returns a Dictionary of Team IDs to a list of LivePlayer objects with scores for that day.
 
@@ -276,30 +385,15 @@ class League:
         if scoring_date not in self.scoring_dates.values():
             raise DateNotInSeason(scoring_date)
         response = api.get_live_scoring_stats(self, scoring_date=scoring_date)
-        scorer_map = {}
-        for _, data in response["scorerMap"].items():
-            for _, data2 in data.items():
-                for _, data3 in data2.items():
-                    for player in data3:
-                        if player["scorer"]["scorerId"] not in scorer_map:
-                            scorer_map[player["scorer"]["scorerId"]] = player["scorer"]
-        active_teams = []
-        for matchup in response["matchups"]:
-            team1, team2 = matchup.split("_")
-            active_teams.append(team1)
-            active_teams.append(team2)
-        final_scores = {}
-        for team_id, data in response["statsPerTeam"]["allTeamsStats"].items():
-            if team_id not in active_teams:
-                continue
-            if team_id not in final_scores:
-                final_scores[team_id] = []
-            for scorer_id, pts in data["ACTIVE"]["statsMap"].items():
-                if not scorer_id.startswith("_"):
-                    player_data = scorer_map[scorer_id]
-                    final_scores[team_id].append(LivePlayer(self, player_data, team_id, pts["object1"], scoring_date))
+        with instrumentation.build(self, "LivePlayer") as event:
+            live_scores = LiveScoresData.parse(response)
+            final_scores = {}
+            for team_id, points in live_scores.points.items():
+                final_scores[team_id] = [LivePlayer(self, live_scores.scorers[scorer_id], team_id, pts, scoring_date) for scorer_id, pts in points]
+                event.count += len(points)
         return final_scores
 
+    @tracing.traced
     def team_roster(self, team_id: str, period_number: int | None = None) -> Roster:
         """Returns a Roster object that represents the given Team ID's roster for a specific period or the latest period's standings when number is None.
 
@@ -316,4 +410,9 @@ class League:
         """
         if period_number is not None and period_number not in self.scoring_dates:
             raise PeriodNotInSeason(period_number)
-        return Roster(self, team_id, api.get_team_roster_info(self, team_id, period_number=period_number))
+        response = api.get_team_roster_info(self, team_id, period_number=period_number)
+        with instrumentation.build(self, "Roster") as event:
+            roster = Roster(self, team_id, response)
+            event.count = 1
+        self._index_roster(roster)
+        return roster
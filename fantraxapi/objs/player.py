@@ -1,6 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
+from ..schemas import ScorerData
 from .base import FantraxBaseObject
 from .position import Position
 
@@ -29,31 +30,21 @@ class Player(FantraxBaseObject):
         injured (bool): Player either Day-to-Day, Out, or on Injured Reserve.
     """
 
-    def __init__(self, league: "League", data: dict) -> None:
+    def __init__(self, league: "League", data: dict | ScorerData) -> None:
         super().__init__(league, data)
-        self.id: str = self._data["scorerId"]
-        self.name: str = self._data["name"]
-        self.short_name: str = self._data["shortName"]
-        self.team_name: str = self._data["teamName"]
-        self.team_short_name: str = self._data["teamShortName"] if "teamShortName" in self._data else self.team_name
-        self.pos_short_name: str = self._data["posShortNames"]
-        self.positions: list[Position] = [self.league.positions[d] for d in self._data["posIdsNoFlex"]]
-        self.all_positions: list[Position] = [self.league.positions[d] for d in self._data["posIds"]]
-        self.day_to_day: bool = False
-        self.out: bool = False
-        self.injured_reserve: bool = False
-        self.suspended: bool = False
-        if "icons" in self._data:
-            for icon in self._data["icons"]:
-                match icon["typeId"]:
-                    case "1":
-                        self.day_to_day = True
-                    case "2":
-                        self.injured_reserve = True
-                    case "30":
-                        self.out = True
-                    case "6":
-                        self.suspended = True
+        scorer = data if isinstance(data, ScorerData) else ScorerData.parse(data)
+        self.id: str = scorer.id
+        self.name: str = scorer.name
+        self.short_name: str = scorer.short_name
+        self.team_name: str = scorer.team_name
+        self.team_short_name: str = scorer.team_short_name
+        self.pos_short_name: str = scorer.pos_short_names
+        self.positions: list[Position] = [self.league.positions[d] for d in scorer.pos_ids_no_flex]
+        self.all_positions: list[Position] = [self.league.positions[d] for d in scorer.pos_ids]
+        self.day_to_day: bool = "1" in scorer.icon_ids
+        self.out: bool = "30" in scorer.icon_ids
+        self.injured_reserve: bool = "2" in scorer.icon_ids
+        self.suspended: bool = "6" in scorer.icon_ids
 
     @property
     def injured(self) -> bool:
@@ -86,7 +77,7 @@ class LivePlayer(Player):
         points_date (date): date Player scored points.
     """
 
-    def __init__(self, league: "League", data: dict, team_id: str, points: float, points_date: date) -> None:
+    def __init__(self, league: "League", data: dict | ScorerData, team_id: str, points: float, points_date: date) -> None:
         super().__init__(league, data)
         self.team: Team = self.league.team(team_id)
         self.points: float = points
@@ -1,6 +1,10 @@
+import math
+from array import array
 from datetime import date
+from itertools import compress
 from typing import TYPE_CHECKING
 
+from ..schemas import RosterData, RosterRowData
 from .base import FantraxBaseObject
 from .game import Game
 from .player import Player
@@ -26,47 +30,31 @@ class Roster(FantraxBaseObject):
         injured (int): Number of Players in Injured Slots.
         injured_max (int): Max Number of Players that can be in Injured Slots.
         rows (list[RosterRow]): List of RosterRows in the Roster.
+        stats (dict[str, array]): Stat short names to a float array of every row's value in ``rows`` order, NaN when a row has no value.
 
     """
 
-    def __init__(self, league: "League", team_id: str, data: dict) -> None:
-        super().__init__(league, data[0])
+    def __init__(self, league: "League", team_id: str, data: list[dict] | RosterData) -> None:
+        super().__init__(league, data if isinstance(data, RosterData) else data[0])
+        roster = data if isinstance(data, RosterData) else RosterData.parse(data[0], data[1])
         self.team: Team = self.league.team(team_id)
-        self.period_number: int = int(self._data["displayedSelections"]["displayedPeriod"])
+        self.period_number: int = roster.period_number
         self.period_date: date = self.league.scoring_dates[self.period_number]
-        lookup: dict[str, dict] = {d["name"]: d for d in self._data["miscData"]["statusTotals"]}
-        self.active: int = int(lookup["Active"]["total"]) if "Active" in lookup else 0
-        self.active_max: int = int(lookup["Active"]["max"]) if "Active" in lookup else 0
-        self.reserve: int = int(lookup["Reserve"]["total"]) if "Reserve" in lookup else 0
-        self.reserve_max: int = int(lookup["Reserve"]["max"]) if "Reserve" in lookup else 0
-        self.injured: int = int(lookup["Inj Res"]["total"]) if "Inj Res" in lookup else 0
-        self.injured_max: int = int(lookup["Inj Res"]["max"]) if "Inj Res" in lookup else 0
-        self.rows = []
-        for stats_group, schedule_group in zip(self._data["tables"], data[1]["tables"]):
-            stats_header = stats_group["header"]["cells"]
-            schedule_header = schedule_group["header"]["cells"]
-            for stats_row, schedule_row in zip(stats_group["rows"], schedule_group["rows"]):
-                if "posId" not in stats_row:
-                    continue
-                stuff = {"posId": stats_row["posId"], "future_games": {}, "total_fantasy_points": None, "fantasy_points_per_game": None}
-                if "scorer" in stats_row or stats_row["statusId"] == "1":
-                    if "scorer" in stats_row:
-                        stuff["scorer"] = stats_row["scorer"]
-                        for header, cell in zip(schedule_header, schedule_row["cells"]):
-                            if cell["content"] and "eventStr" in header and header["eventStr"]:
-                                key = header["shortName"]
-                                stuff["future_games"][key] = cell
-
-                        for header, cell in zip(stats_header, stats_row["cells"]):
-                            if "sortKey" in header:
-                                match header["sortKey"]:
-                                    case "SCORE":
-                                        stuff["total_fantasy_points"] = float(cell["content"])
-                                    case "FPTS_PER_GAME":
-                                        stuff["fantasy_points_per_game"] = float(cell["content"])
-                            if cell["content"] and "eventStr" in header and header["eventStr"]:
-                                stuff["game_today"] = cell
-                self.rows.append(RosterRow(self, stuff))
+        self.active, self.active_max = roster.status_totals.get("Active", (0, 0))
+        self.reserve, self.reserve_max = roster.status_totals.get("Reserve", (0, 0))
+        self.injured, self.injured_max = roster.status_totals.get("Inj Res", (0, 0))
+        self.stats: dict[str, array] = roster.stats
+        self._label: str = self.period_date.strftime("%a %m/%d")
+        self.rows: list[RosterRow] = [RosterRow(self, row, i) for i, row in enumerate(roster.rows)]
+
+    def stat_totals(self, status_id: str | None = None) -> dict[str, float]:
+        """Returns a Dictionary of stat short names to the sum of that stat over the Roster's Players, NaN values are skipped.
+
+        Args:
+            status_id (str | None): Only sum rows with this Status ID, like ``"1"`` for Active Players.
+        """
+        mask = [r.player is not None and (status_id is None or r.status_id == status_id) for r in self.rows]
+        return {name: math.fsum(v for v in compress(values, mask) if v == v) for name, values in self.stats.items()}
 
     def __str__(self) -> str:
         rows = "\n".join([str(r) for r in self.rows])
@@ -80,23 +68,37 @@ class RosterRow(FantraxBaseObject):
         league (League): The League instance this object belongs to.
         roster (Roster): The Roster instance this RosterRow belongs to.
         position (Position): The Position object associated with the RosterRow.
+        status_id (str | None): The Status ID of the RosterRow.
         player (Player | None): The Player in the RosterRow.
         total_fantasy_points (float | None): The Total Fantasy Points for the Player in the RosterRow.
         fantasy_points_per_game (float | None): The Fantasy Points Per Game for the Player in the RosterRow.
         game_today (Game): Game for the Player in the RosterRow.
         future_games (dict[str, Game]): Dictionary of dates to future Games or the last game of the season if it's over.
+        index (int): Position of the RosterRow in the Roster's rows and stat arrays.
 
     """
 
-    def __init__(self, roster: Roster, data: dict) -> None:
+    def __init__(self, roster: Roster, data: RosterRowData, index: int) -> None:
         super().__init__(roster.league, data)
         self.roster: Roster = roster
-        self.position: Position = self.league.positions[self._data["posId"]]
-        self.player: Player | None = Player(self.league, self._data["scorer"]) if "scorer" in self._data else None
-        self.total_fantasy_points: float | None = self._data["total_fantasy_points"]
-        self.fantasy_points_per_game: float | None = self._data["fantasy_points_per_game"]
-        self.game_today: Game | None = Game(self.league, self.player, roster.period_date.strftime("%a %m/%d"), self._data["game_today"]) if "game_today" in self._data else None
-        self.future_games: dict[str, Game] = {k: Game(self.league, self.player, k, v) for k, v in self._data["future_games"].items()}
+        self.index: int = index
+        self.position: Position = self.league.positions[data.pos_id]
+        self.status_id: str | None = data.status_id
+        self.player: Player | None = Player(self.league, data.scorer) if data.scorer else None
+        self.total_fantasy_points: float | None = data.total_fantasy_points
+        self.fantasy_points_per_game: float | None = data.fantasy_points_per_game
+        self.game_today: Game | None = Game(self.league, self.player, roster._label, data.game_today) if data.game_today else None
+        self.future_games: dict[str, Game] = {k: Game(self.league, self.player, k, v) for k, v in data.future_games.items()}
+
+    def stat(self, name: str) -> float | None:
+        """Returns the value of a stat column for this RosterRow or None when it has no value.
+
+        Args:
+            name (str): Stat short name, like ``"G"`` or ``"FPts"``.
+        """
+        values = self.roster.stats.get(name)
+        value = values[self.index] if values is not None else math.nan
+        return None if math.isnan(value) else value
 
     def __str__(self) -> str:
         return f"{self.position.short_name}: {self.player if self.player else 'Empty'}"
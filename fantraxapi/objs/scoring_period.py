@@ -1,9 +1,9 @@
 import re
 from datetime import date, datetime, timedelta
-from decimal import Decimal
 from typing import TYPE_CHECKING, Self
 
-from fantraxapi import NotTeamInLeague
+from fantraxapi import FantraxException, NotTeamInLeague
+from fantraxapi.dates import parse_date
 
 from .base import FantraxBaseObject
 from .team import Team
@@ -27,8 +27,8 @@ class ScoringPeriod(FantraxBaseObject):
     def __init__(self, league: "League", data: dict) -> None:
         super().__init__(league, data)
         dates = self._data["name"][1:-1].split(" - ")
-        self.start: date = datetime.strptime(dates[0], "%b %d/%y").date()
-        self.end: date = datetime.strptime(dates[1], "%b %d/%y").date()
+        self.start: date = parse_date(dates[0], "%b %d/%y")
+        self.end: date = parse_date(dates[1], "%b %d/%y")
         self.number: int = self._data["value"]
 
     @property
@@ -75,8 +75,8 @@ class ScoringPeriodResult(FantraxBaseObject):
 
         self.playoffs: bool = self.name.startswith("Playoffs")
         dates = self._data["subCaption"][1:-1].split(" - ")
-        self.start: date = datetime.strptime(dates[0], "%a %b %d, %Y").date()
-        self.end: date = datetime.strptime(dates[1], "%a %b %d, %Y").date()
+        self.start: date = parse_date(dates[0], "%a %b %d, %Y")
+        self.end: date = parse_date(dates[1], "%a %b %d, %Y")
 
         if self.playoffs:
             self.period: ScoringPeriod = self.league.scoring_periods_lookup[self.range]
@@ -118,9 +118,29 @@ class ScoringPeriodResult(FantraxBaseObject):
         return output
 
 
+_score_pattern: re.Pattern = re.compile(r"([+-]?)(\d*)(?:\.(\d*))?")
+
+
+def _scaled(content: str | int | float) -> tuple[int, int]:
+    """Returns a score like ``"1,234.56"`` as an integer of its digits and its number of decimal places.
+
+    Raises:
+        FantraxException: When the content isn't a number.
+    """
+    match = _score_pattern.fullmatch(str(content).replace(",", "").strip())
+    if match is None or not (match[2] or match[3]):
+        raise FantraxException(f"Invalid score: {content!r}")
+    sign, whole, fraction = match[1], match[2], match[3] or ""
+    value = int(f"{whole or '0'}{fraction}")
+    return -value if sign == "-" else value, len(fraction)
+
+
 class Matchup(FantraxBaseObject):
     """Represents a single Matchup.
 
+    Scores are parsed once into integers scaled to their decimal places, so the winner and difference are worked out
+    exactly when the Matchup is built and every call after that only returns them.
+
     Attributes:
         league (League): The League instance this object belongs to.
         scoring_period (ScoringPeriodResult): Scoring Period result this instance belongs to.
@@ -140,36 +160,31 @@ class Matchup(FantraxBaseObject):
             self.away: Team | str = self.league.team(self._data[0]["teamId"])
         except NotTeamInLeague:
             self.away: Team | str = self._data[0]["content"]
-        self._away_score: Decimal = Decimal(str(self._data[1]["content"]).replace(",", ""))
         try:
             self.home: Team | str = self.league.team(self._data[2]["teamId"])
         except NotTeamInLeague:
             self.home: Team | str = self._data[2]["content"]
-        self._home_score: Decimal = Decimal(str(self._data[3]["content"]).replace(",", ""))
-
-    @property
-    def away_score(self) -> float:
-        return float(self._away_score)
-
-    @property
-    def home_score(self) -> float:
-        return float(self._home_score)
+        away, away_places = _scaled(self._data[1]["content"])
+        home, home_places = _scaled(self._data[3]["content"])
+        places = max(away_places, home_places)
+        away *= 10 ** (places - away_places)
+        home *= 10 ** (places - home_places)
+        scale = 10**places
+        self.away_score: float = away / scale
+        self.home_score: float = home / scale
+        if away > home:
+            self._winner = (self.away, self.away_score, self.home, self.home_score)
+        elif away < home:
+            self._winner = (self.home, self.home_score, self.away, self.away_score)
+        else:
+            self._winner = (None, None, None, None)
+        self._difference: float = abs(away - home) / scale
 
     def winner(self) -> tuple[Team | str, float, Team | str, float] | tuple[None, None, None, None]:
-        if self.away_score > self.home_score:
-            return self.away, self.away_score, self.home, self.home_score
-        elif self.away_score < self.home_score:
-            return self.home, self.home_score, self.away, self.away_score
-        else:
-            return None, None, None, None
+        return self._winner
 
     def difference(self) -> float:
-        if self.away_score > self.home_score:
-            return float(self._away_score - self._home_score)
-        elif self.away_score < self.home_score:
-            return float(self._home_score - self._away_score)
-        else:
-            return 0.0
+        return self._difference
 
     def __str__(self) -> str:
         if self.away_score or self.home_score:
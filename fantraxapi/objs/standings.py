@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from ..schemas import RecordData, StandingsData
 from .base import FantraxBaseObject
 from .team import Team
 
@@ -13,19 +14,16 @@ class Standings(FantraxBaseObject):
     Attributes:
         league (League): The League instance this object belongs to.
         scoring_period_number (int): Period Number.
+        only_period (bool): Only that specific period's Standings instead of from the season start.
         ranks (dict[int, Record]): Team Ranks and their Records.
 
     """
 
-    def __init__(self, league: "League", data: dict, scoring_period_number: int | None = None) -> None:
+    def __init__(self, league: "League", data: dict, scoring_period_number: int | None = None, only_period: bool = False) -> None:
         super().__init__(league, data)
         self.scoring_period_number: int | None = scoring_period_number
-        self.ranks: dict[int, Record] = {}
-        fields = {c["key"]: i for i, c in enumerate(self._data["header"]["cells"])}
-        for obj in self._data["rows"]:
-            team_id = obj["fixedCells"][1]["teamId"]
-            rank = int(obj["fixedCells"][0]["content"])
-            self.ranks[rank] = Record(self, team_id, rank, fields, obj["cells"])
+        self.only_period: bool = only_period
+        self.ranks: dict[int, Record] = {r.rank: Record(self, r) for r in StandingsData.parse(self._data).records}
 
     def __str__(self) -> str:
         output = "Standings"
@@ -57,22 +55,21 @@ class Record(FantraxBaseObject):
 
     """
 
-    def __init__(self, standings: Standings, team_id: str, rank: int, fields: dict, data: dict) -> None:
+    def __init__(self, standings: Standings, data: RecordData) -> None:
         super().__init__(standings.league, data)
         self.standings: Standings = standings
-        self.team: Team = self.league.team(team_id)
-        self.rank: int = rank
-        self.win: int = int(self._data[fields["win"]]["content"]) if "win" in fields else 0
-        self.loss: int = int(self._data[fields["loss"]]["content"]) if "loss" in fields else 0
-        self.tie: int = int(self._data[fields["tie"]]["content"]) if "tie" in fields else 0
-        self.points: int = int(self._data[fields["points"]]["content"]) if "points" in fields else 0
-        winpc_raw: str = self._data[fields["winpc"]]["content"] if "winpc" in fields else 0
-        self.win_percentage: float = float(winpc_raw) if winpc_raw != "-" else 0.0
-        self.games_back: int = int(self._data[fields["gamesback"]]["content"]) if "gamesback" in fields else 0
-        self.wavier_wire_order: int = int(self._data[fields["wwOrder"]]["content"]) if "wwOrder" in fields else 0
-        self.points_for: float = float(self._data[fields["pointsFor"]]["content"].replace(",", "")) if "pointsFor" in fields else 0.0
-        self.points_against: float = float(self._data[fields["pointsAgainst"]]["content"].replace(",", "")) if "pointsAgainst" in fields else 0.0
-        self.streak: str = self._data[fields["streak"]]["content"] if "streak" in fields else ""
+        self.team: Team = self.league.team(data.team_id)
+        self.rank: int = data.rank
+        self.win: int = data.win
+        self.loss: int = data.loss
+        self.tie: int = data.tie
+        self.points: int = data.points
+        self.win_percentage: float = data.win_percentage
+        self.games_back: int = data.games_back
+        self.wavier_wire_order: int = data.wavier_wire_order
+        self.points_for: float = data.points_for
+        self.points_against: float = data.points_against
+        self.streak: str = data.streak
 
     def __str__(self) -> str:
         return f"{self.rank}: {self.team} ({self.win}-{self.loss}-{self.tie})"
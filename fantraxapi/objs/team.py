@@ -1,6 +1,7 @@
 from datetime import date
 from typing import TYPE_CHECKING
 
+from .. import tracing
 from .base import FantraxBaseObject
 from .player import Player
 from .position import PositionCount
@@ -24,6 +25,10 @@ class Team(FantraxBaseObject):
     def __init__(self, league: "League", team_id: str, data: dict) -> None:
         super().__init__(league, data)
         self.id: str = team_id
+        self._update(data)
+
+    def _update(self, data: dict) -> None:
+        self._data = data
         self.name: str = self._data["name"]
         self.short: str = self._data["shortName"]
         if "logoUrl512" in self._data:
@@ -36,6 +41,7 @@ class Team(FantraxBaseObject):
     def __str__(self) -> str:
         return self.name
 
+    @tracing.traced
     def position_counts(self, scoring_period_number: int | None = None) -> dict[str, PositionCount]:
         """Returns a Dictionary of PositionCount objects that represents the positions used for a specific period or the latest period's standings when scoring_period_number is None.
 
@@ -48,6 +54,7 @@ class Team(FantraxBaseObject):
         """
         return self.league.position_counts(self.id, scoring_period_number=scoring_period_number)
 
+    @tracing.traced
     def live_scores(self, score_date: date) -> list["Player"]:
         """Returns a list of Player objects with scores for that day.
 
@@ -60,6 +67,7 @@ class Team(FantraxBaseObject):
         """
         return self.league.live_scores(score_date)[self.id]
 
+    @tracing.traced
     def roster(self, period_number: int | None = None) -> Roster:
         """Returns a Roster object that represents the Team's roster.
 
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from fantraxapi import dates
 from fantraxapi.exceptions import DateNotInSeason
 
 from .base import FantraxBaseObject
@@ -39,13 +40,10 @@ class Trade(FantraxBaseObject):
             self.moves.append(TradeDraftPick(self, move) if "draftPick" in move else TradePlayer(self, move))
 
     def _parse_datetime(self, data: str) -> datetime:
-        start = datetime.strptime(data.replace("EDT", str(self.league.start_date.year)), "%b %d, %I:%M %p %Y")
-        end = datetime.strptime(data.replace("EDT", str(self.league.end_date.year)), "%b %d, %I:%M %p %Y")
-        if self.league.end_date >= start >= self.league.start_date:
-            return start
-        elif self.league.end_date >= end >= self.league.start_date:
-            return end
-        raise DateNotInSeason(data)
+        try:
+            return dates.season(self.league.start_date.date(), self.league.end_date.date()).datetime(data.removesuffix(" EDT"), "%b %d, %I:%M %p")
+        except ValueError:
+            raise DateNotInSeason(data) from None
 
     def __str__(self) -> str:
         return "\n".join([str(m) for m in self.moves])
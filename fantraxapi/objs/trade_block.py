@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from ..schemas import TradeBlockData
 from .base import FantraxBaseObject
 from .player import Player
 from .position import Position
@@ -27,21 +28,18 @@ class TradeBlock(FantraxBaseObject):
 
     """
 
-    def __init__(self, league: "League", data: dict) -> None:
+    def __init__(self, league: "League", data: dict | TradeBlockData) -> None:
         super().__init__(league, data)
-        self.team: Team = self.league.team(self._data["teamId"])
-        self.update_date: datetime = datetime.fromtimestamp(self._data["lastUpdated"]["date"] / 1e3)
-        self.note: str = self._data["comment"]["body"] if "comment" in self._data else ""
-        self.players_offered: dict[str, list[Player]] = {}
-        if "scorersOffered" in self._data:
-            self.players_offered = {self.league.positions[k].short_name: [Player(self.league, p) for p in ps] for k, ps in self._data["scorersOffered"]["scorers"].items()}
-        self.players_wanted: dict[str, list[Player]] = {}
-        if "scorersWanted" in self._data:
-            self.players_wanted = {self.league.positions[k].short_name: [Player(self.league, p) for p in players] for k, players in self._data["scorersWanted"]["scorers"].items()}
-        self.positions_offered: list[Position] = [self.league.positions[pos] for pos in self._data["positionsOffered"]["positions"]] if "positionsOffered" in self._data else []
-        self.positions_wanted: list[Position] = [self.league.positions[pos] for pos in self._data["positionsWanted"]["positions"]] if "positionsWanted" in self._data else []
-        self.stats_offered: list[str] = [s["shortName"] for s in self._data["statsOffered"]["stats"]] if "statsOffered" in self._data else []
-        self.stats_wanted: list[str] = [s["shortName"] for s in self._data["statsWanted"]["stats"]] if "statsWanted" in self._data else []
+        block = data if isinstance(data, TradeBlockData) else TradeBlockData.parse(data)
+        self.team: Team = self.league.team(block.team_id)
+        self.update_date: datetime = datetime.fromtimestamp(block.last_updated / 1e3)
+        self.note: str = block.note
+        self.players_offered: dict[str, list[Player]] = {self.league.positions[k].short_name: [Player(self.league, p) for p in ps] for k, ps in block.players_offered.items()}
+        self.players_wanted: dict[str, list[Player]] = {self.league.positions[k].short_name: [Player(self.league, p) for p in ps] for k, ps in block.players_wanted.items()}
+        self.positions_offered: list[Position] = [self.league.positions[pos] for pos in block.positions_offered]
+        self.positions_wanted: list[Position] = [self.league.positions[pos] for pos in block.positions_wanted]
+        self.stats_offered: list[str] = list(block.stats_offered)
+        self.stats_wanted: list[str] = list(block.stats_wanted)
 
     def __str__(self) -> str:
         return self.note
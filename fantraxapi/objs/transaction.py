@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from .. import dates
+from ..schemas import ScorerData, TransactionRowData
 from .base import FantraxBaseObject
 from .player import Player
 from .team import Team
@@ -21,13 +23,13 @@ class Transaction(FantraxBaseObject):
 
     """
 
-    def __init__(self, league: "League", data: list[dict]) -> None:
+    def __init__(self, league: "League", data: list[dict] | list[TransactionRowData]) -> None:
         super().__init__(league, data)
-        self.id: str = self._data[0]["txSetId"]
-        self.team: Team = self.league.team(self._data[0]["cells"][0]["teamId"])
-        self.date: datetime = datetime.strptime(self._data[0]["cells"][1]["content"], "%a %b %d, %Y, %I:%M%p")
-        tc = "transactionCode"
-        self.players: list[TransactionPlayer] = [TransactionPlayer(self.league, p["scorer"], p["claimType"] if p[tc] == "CLAIM" else p[tc]) for p in self._data]
+        rows = [r if isinstance(r, TransactionRowData) else TransactionRowData.parse(r) for r in data]
+        self.id: str = rows[0].tx_set_id
+        self.team: Team = self.league.team(rows[0].team_id)
+        self.date: datetime = dates.parse(rows[0].date, "%a %b %d, %Y, %I:%M%p")
+        self.players: list[TransactionPlayer] = [TransactionPlayer(self.league, r.scorer, r.type) for r in rows]
 
     def __str__(self) -> str:
         return str(self.players)
@@ -54,7 +56,7 @@ class TransactionPlayer(Player):
         type (str): Transaction Type.
     """
 
-    def __init__(self, league: "League", data: dict, transaction_type: str) -> None:
+    def __init__(self, league: "League", data: dict | ScorerData, transaction_type: str) -> None:
         super().__init__(league, data)
         self.type: str = transaction_type
 
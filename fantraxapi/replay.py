@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import NamedTuple, ParamSpec
+
+from requests import Response, Session
+
+from fantraxapi.exceptions import FantraxException
+
+Param = ParamSpec("Param")
+
+
+class RecordedResponse(NamedTuple):
+    """Raw ``/fxpa/req`` response captured by a RecordingSession."""
+
+    league_id: str
+    request: dict
+    status_code: int
+    reason: str
+    content: bytes
+
+
+def request_key(json_data: dict) -> str:
+    """Returns the fixture key of a request body, requests with the same Methods and parameters have the same key.
+
+    Args:
+        json_data (dict): Request body sent to ``/fxpa/req``.
+    """
+    methods = "-".join(dict.fromkeys(m["method"] for m in json_data["msgs"]))
+    digest = hashlib.sha1(json.dumps(json_data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()[:16]
+    return f"{methods}-{digest}"
+
+
+class ResponseStore(ABC):
+    """Base class of the stores RecordingSession saves responses to and ReplaySession serves responses from."""
+
+    @abstractmethod
+    def get(self, key: str) -> RecordedResponse | None:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, recorded: RecordedResponse) -> None:
+        pass
+
+    @abstractmethod
+    def keys(self) -> list[str]:
+        pass
+
+
+class MemoryStore(ResponseStore):
+    """Keeps RecordedResponses in memory.
+
+    Args:
+        source (ResponseStore | None): Store to copy every response from.
+    """
+
+    def __init__(self, source: ResponseStore | None = None) -> None:
+        self.responses: dict[str, RecordedResponse] = {}
+        if source is not None:
+            for key in source.keys():
+                self.responses[key] = source.get(key)
+
+    def get(self, key: str) -> RecordedResponse | None:
+        return self.responses.get(key)
+
+    def put(self, key: str, recorded: RecordedResponse) -> None:
+        self.responses[key] = recorded
+
+    def keys(self) -> list[str]:
+        return sorted(self.responses)
+
+
+class DirectoryStore(ResponseStore):
+    """Stores RecordedResponses as a raw ``{key}.json`` response body next to a ``{key}.meta.json`` file.
+
+    Args:
+        path (str): Directory of the fixture files.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+
+    def get(self, key: str) -> RecordedResponse | None:
+        meta_path = os.path.join(self.path, f"{key}.meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(os.path.join(self.path, f"{key}.json"), "rb") as f:
+            content = f.read()
+        return RecordedResponse(meta["league_id"], meta["request"], meta["status_code"], meta["reason"], content)
+
+    def put(self, key: str, recorded: RecordedResponse) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, f"{key}.json"), "wb") as f:
+            f.write(recorded.content)
+        with open(os.path.join(self.path, f"{key}.meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"league_id": recorded.league_id, "request": recorded.request, "status_code": recorded.status_code, "reason": recorded.reason}, f, indent=2)
+
+    def keys(self) -> list[str]:
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(f.removesuffix(".meta.json") for f in os.listdir(self.path) if f.endswith(".meta.json"))
+
+
+def _store(store: str | ResponseStore) -> ResponseStore:
+    return DirectoryStore(store) if isinstance(store, str) else store
+
+
+class RecordingSession(Session):
+    """Session that sends requests normally and saves every ``/fxpa/req`` response to a store.
+
+    Args:
+        store (str | ResponseStore): Fixture directory or store to save responses in.
+    """
+
+    def __init__(self, store: str | ResponseStore) -> None:
+        super().__init__()
+        self.store: ResponseStore = _store(store)
+
+    def post(self, url: str, data: dict | None = None, json: dict | None = None, **kwargs: Param.kwargs) -> Response:
+        response = super().post(url, data=data, json=json, **kwargs)
+        if json is not None and "msgs" in json:
+            league_id = kwargs.get("params", {}).get("leagueId", "")
+            self.store.put(request_key(json), RecordedResponse(league_id, json, response.status_code, response.reason or "", response.content))
+        return response
+
+
+class ReplaySession(Session):
+    """Session that serves ``/fxpa/req`` responses from a store without touching the network.
+
+    Args:
+        store (str | ResponseStore): Fixture directory or store to serve responses from.
+
+    Raises:
+        FantraxException: When a request has no recorded response.
+    """
+
+    def __init__(self, store: str | ResponseStore) -> None:
+        super().__init__()
+        self.store: ResponseStore = _store(store)
+
+    def post(self, url: str, data: dict | None = None, json: dict | None = None, **kwargs: Param.kwargs) -> Response:
+        if json is None or "msgs" not in json:
+            raise FantraxException(f"ReplaySession can only replay /fxpa/req requests not {url}")
+        key = request_key(json)
+        recorded = self.store.get(key)
+        if recorded is None:
+            raise FantraxException(f"No recorded response for {key}: {json}")
+        response = Response()
+        response.url = url
+        response.status_code = recorded.status_code
+        response.reason = recorded.reason
+        response.encoding = "utf-8"
+        response._content = recorded.content
+        return response
@@ -0,0 +1,322 @@
+import json
+import zlib
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import NamedTuple
+
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.objs import Roster
+
+
+class PlayerSlot(NamedTuple):
+    """Where a Player sat on a Roster and their points on that day."""
+
+    position_id: str
+    status_id: str | None
+    total_fantasy_points: float | None
+    fantasy_points_per_game: float | None
+
+
+class RosterSnapshot(NamedTuple):
+    """Compact copy of a Roster without any League references.
+
+    Attributes:
+        period_number (int): Daily Period Number.
+        period_date (date): Daily Period Date.
+        players (dict[str, PlayerSlot]): Player IDs to their PlayerSlot.
+        empty (tuple[str, ...]): Position IDs of the empty roster slots.
+
+    """
+
+    period_number: int
+    period_date: date
+    players: dict[str, PlayerSlot]
+    empty: tuple[str, ...]
+
+    @classmethod
+    def from_roster(cls, roster: Roster) -> "RosterSnapshot":
+        players = {}
+        empty = []
+        for row in roster.rows:
+            if row.player:
+                players[row.player.id] = PlayerSlot(row.position.id, row.status_id, row.total_fantasy_points, row.fantasy_points_per_game)
+            else:
+                empty.append(row.position.id)
+        return cls(roster.period_number, roster.period_date, players, tuple(empty))
+
+    def lineup(self) -> "RosterSnapshot":
+        """Returns a copy of this RosterSnapshot without the points of its Players."""
+        return self._replace(players={p: PlayerSlot(s.position_id, s.status_id, None, None) for p, s in self.players.items()})
+
+
+class RosterDelta(NamedTuple):
+    """Lineup difference between a RosterSnapshot and the one stored before it, points are stored apart from deltas.
+
+    Attributes:
+        period_number (int): Daily Period Number.
+        period_date (date): Daily Period Date.
+        added (dict[str, PlayerSlot]): Player IDs to the PlayerSlot of Players added to the Roster.
+        removed (tuple[str, ...]): Player IDs of Players removed from the Roster.
+        moved (dict[str, PlayerSlot]): Player IDs to the new PlayerSlot of Players whose position or status changed.
+        empty (tuple[str, ...] | None): Position IDs of the empty roster slots or None when they didn't change.
+
+    """
+
+    period_number: int
+    period_date: date
+    added: dict[str, PlayerSlot]
+    removed: tuple[str, ...]
+    moved: dict[str, PlayerSlot]
+    empty: tuple[str, ...] | None
+
+    @classmethod
+    def between(cls, previous: RosterSnapshot, current: RosterSnapshot) -> "RosterDelta":
+        added = {}
+        moved = {}
+        for player_id, slot in current.players.items():
+            old = previous.players.get(player_id)
+            if old is None:
+                added[player_id] = slot
+            elif old[:2] != slot[:2]:
+                moved[player_id] = slot
+        removed = tuple(p for p in previous.players if p not in current.players)
+        return cls(current.period_number, current.period_date, added, removed, moved, None if current.empty == previous.empty else current.empty)
+
+    def apply(self, previous: RosterSnapshot) -> RosterSnapshot:
+        players = {p: s for p, s in previous.players.items() if p not in self.removed}
+        players.update(self.moved)
+        players.update(self.added)
+        return RosterSnapshot(self.period_number, self.period_date, players, previous.empty if self.empty is None else self.empty)
+
+
+class RosterChanges(NamedTuple):
+    """Changes to a Roster between two Daily Periods.
+
+    Attributes:
+        start (int): First Daily Period Number.
+        end (int): Last Daily Period Number.
+        added (list[str]): Player IDs on the end Roster but not the start Roster.
+        removed (list[str]): Player IDs on the start Roster but not the end Roster.
+        moved (dict[str, tuple[str, str]]): Player IDs to their start and end Position IDs for Players whose position changed.
+        points (dict[str, float]): Player IDs to the fantasy points they gained between both days for Players on both Rosters.
+
+    """
+
+    start: int
+    end: int
+    added: list[str]
+    removed: list[str]
+    moved: dict[str, tuple[str, str]]
+    points: dict[str, float]
+
+
+class RosterHistory:
+    """Daily Roster history of one Team stored as keyframe snapshots plus per-day deltas.
+
+    Every ``keyframe_interval`` stored days a lineup RosterSnapshot is kept, every other day only keeps a RosterDelta
+    against the day stored before it, so rebuilding any day applies at most ``keyframe_interval - 1`` deltas.
+
+    Season points change every day a Player plays, so they're kept out of the snapshots and deltas and stored as a
+    separate column per Player. :meth:`to_dict` writes each column as differences in hundredths of a point, which are
+    mostly zeros and small numbers that compress well.
+
+    Args:
+        team_id (str): Team ID.
+        keyframe_interval (int): Number of stored days between full snapshots.
+
+    Attributes:
+        team_id (str): Team ID.
+        players (dict[str, str]): Player IDs to Player Names of every Player ever stored.
+
+    """
+
+    def __init__(self, team_id: str, keyframe_interval: int = 14) -> None:
+        if keyframe_interval < 1:
+            raise FantraxException("keyframe_interval must be at least 1")
+        self.team_id: str = team_id
+        self.keyframe_interval: int = keyframe_interval
+        self.players: dict[str, str] = {}
+        self._periods: list[int] = []
+        self._entries: dict[int, RosterSnapshot | RosterDelta] = {}
+        self._points: dict[int, dict[str, tuple[float | None, float | None]]] = {}
+        self._last: RosterSnapshot | None = None
+
+    @property
+    def periods(self) -> list[int]:
+        """Stored Daily Period Numbers in order."""
+        return list(self._periods)
+
+    def add(self, roster: Roster | RosterSnapshot) -> None:
+        """Stores a Roster, storing a day again replaces it.
+
+        Args:
+            roster (Roster | RosterSnapshot): Roster to store.
+
+        Raises:
+            FantraxException: When the Roster belongs to another Team.
+        """
+        if isinstance(roster, Roster):
+            if roster.team.id != self.team_id:
+                raise FantraxException(f"Roster of Team {roster.team.id} can't be stored in the history of Team {self.team_id}")
+            for row in roster.rows:
+                if row.player:
+                    self.players[row.player.id] = row.player.name
+            roster = RosterSnapshot.from_roster(roster)
+        if self._periods and roster.period_number > self._periods[-1]:
+            self._append(roster)
+            return
+        snapshots = {p: self.snapshot(p) for p in self._periods}
+        snapshots[roster.period_number] = roster
+        self._periods.clear()
+        self._entries.clear()
+        self._points.clear()
+        for period in sorted(snapshots):
+            self._append(snapshots[period])
+
+    def _append(self, snapshot: RosterSnapshot) -> None:
+        lineup = snapshot.lineup()
+        if len(self._periods) % self.keyframe_interval == 0:
+            self._entries[snapshot.period_number] = lineup
+        else:
+            self._entries[snapshot.period_number] = RosterDelta.between(self._last, lineup)
+        self._points[snapshot.period_number] = {p: slot[2:] for p, slot in snapshot.players.items()}
+        self._periods.append(snapshot.period_number)
+        self._last = lineup
+
+    def snapshot(self, period_number: int) -> RosterSnapshot:
+        """Returns the Roster stored for a Daily Period.
+
+        Args:
+            period_number (int): Daily Period Number.
+
+        Raises:
+            FantraxException: When no Roster is stored for that Daily Period.
+        """
+        if period_number not in self._entries:
+            raise FantraxException(f"No Roster stored for Team {self.team_id} period {period_number}")
+        index = bisect_left(self._periods, period_number)
+        keyframe = index - index % self.keyframe_interval
+        snapshot = self._entries[self._periods[keyframe]]
+        for period in self._periods[keyframe + 1 : index + 1]:
+            snapshot = self._entries[period].apply(snapshot)
+        points = self._points[period_number]
+        return snapshot._replace(players={p: slot._replace(total_fantasy_points=points[p][0], fantasy_points_per_game=points[p][1]) for p, slot in snapshot.players.items()})
+
+    def snapshot_on(self, on: date) -> RosterSnapshot:
+        """Returns the latest Roster stored on or before a date.
+
+        Args:
+            on (date): Roster date.
+
+        Raises:
+            FantraxException: When no Roster is stored on or before that date.
+        """
+        dates = [self._entries[p].period_date for p in self._periods]
+        index = bisect_right(dates, on)
+        if index == 0:
+            raise FantraxException(f"No Roster stored for Team {self.team_id} on or before {on}")
+        return self.snapshot(self._periods[index - 1])
+
+    def changes(self, start: int, end: int) -> RosterChanges:
+        """Returns the changes to the Roster between two stored Daily Periods.
+
+        Args:
+            start (int): First Daily Period Number.
+            end (int): Last Daily Period Number.
+        """
+        before, after = self.snapshot(start), self.snapshot(end)
+        moved = {}
+        points = {}
+        for player_id, slot in after.players.items():
+            old = before.players.get(player_id)
+            if old is None:
+                continue
+            if old.position_id != slot.position_id:
+                moved[player_id] = (old.position_id, slot.position_id)
+            points[player_id] = round((slot.total_fantasy_points or 0) - (old.total_fantasy_points or 0), 2)
+        return RosterChanges(
+            start,
+            end,
+            [p for p in after.players if p not in before.players],
+            [p for p in before.players if p not in after.players],
+            moved,
+            points,
+        )
+
+    def to_dict(self) -> dict:
+        entries = []
+        totals = {}
+        per_game = {}
+        for period in self._periods:
+            entry = self._entries[period]
+            if isinstance(entry, RosterSnapshot):
+                entries.append({"p": period, "d": entry.period_date.isoformat(), "s": _lineup(entry.players), "e": entry.empty})
+            else:
+                entries.append({"p": period, "d": entry.period_date.isoformat(), "a": _lineup(entry.added), "r": entry.removed, "m": _lineup(entry.moved), "e": entry.empty})
+            for player_id, (total, fp_per_game) in self._points[period].items():
+                totals.setdefault(player_id, []).append(total)
+                per_game.setdefault(player_id, []).append(fp_per_game)
+        points = {p: [_encode_column(totals[p]), _encode_column(per_game[p])] for p in totals}
+        return {"team_id": self.team_id, "keyframe_interval": self.keyframe_interval, "players": self.players, "entries": entries, "points": points}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RosterHistory":
+        history = cls(data["team_id"], keyframe_interval=data["keyframe_interval"])
+        history.players = data["players"]
+        columns = {p: (iter(_decode_column(totals)), iter(_decode_column(per_game))) for p, (totals, per_game) in data["points"].items()}
+        for entry in data["entries"]:
+            period_date = date.fromisoformat(entry["d"])
+            if "s" in entry:
+                stored = RosterSnapshot(entry["p"], period_date, _slots(entry["s"]), tuple(entry["e"]))
+                history._last = stored
+            else:
+                empty = None if entry["e"] is None else tuple(entry["e"])
+                stored = RosterDelta(entry["p"], period_date, _slots(entry["a"]), tuple(entry["r"]), _slots(entry["m"]), empty)
+                history._last = stored.apply(history._last)
+            history._entries[entry["p"]] = stored
+            history._points[entry["p"]] = {p: (next(columns[p][0]), next(columns[p][1])) for p in history._last.players}
+            history._periods.append(entry["p"])
+        return history
+
+    def to_bytes(self) -> bytes:
+        """Returns the history as zlib compressed JSON."""
+        return zlib.compress(json.dumps(self.to_dict(), separators=(",", ":")).encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RosterHistory":
+        return cls.from_dict(json.loads(zlib.decompress(data)))
+
+
+def _lineup(slots: dict[str, PlayerSlot]) -> dict[str, tuple[str, str | None]]:
+    return {player_id: slot[:2] for player_id, slot in slots.items()}
+
+
+def _slots(data: dict) -> dict[str, PlayerSlot]:
+    return {player_id: PlayerSlot(position_id, status_id, None, None) for player_id, (position_id, status_id) in data.items()}
+
+
+def _encode_column(values: list[float | None]) -> list[int | float | None]:
+    # Values with at most two decimals are stored as an int difference in hundredths from the last such value, any other
+    # value is stored as is and a float in the column always means an absolute value.
+    encoded = []
+    last = 0
+    for value in values:
+        hundredths = None if value is None else round(value * 100)
+        if hundredths is None or hundredths / 100 != value:
+            encoded.append(None if value is None else float(value))
+        else:
+            encoded.append(hundredths - last)
+            last = hundredths
+    return encoded
+
+
+def _decode_column(encoded: list[int | float | None]) -> list[float | None]:
+    values = []
+    last = 0
+    for value in encoded:
+        if isinstance(value, int):
+            last += value
+            values.append(last / 100)
+        else:
+            values.append(value)
+    return values
@@ -0,0 +1,282 @@
+from array import array
+from datetime import date, time
+from typing import NamedTuple, Self
+
+from . import dates
+from .exceptions import FantraxException
+from .tables import Column, TableSchema, integer, nullable, number
+
+
+def _int(value: str | int | None) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _is_event(cell: dict) -> bool:
+    return bool(cell.get("eventStr"))
+
+
+class ScorerData(NamedTuple):
+    """Validated ``scorer`` object used to build a Player."""
+
+    id: str
+    name: str
+    short_name: str
+    team_name: str
+    team_short_name: str
+    pos_short_names: str
+    pos_ids_no_flex: tuple[str, ...]
+    pos_ids: tuple[str, ...]
+    icon_ids: tuple[str, ...]
+
+    @classmethod
+    def parse(cls, data: dict) -> Self:
+        try:
+            team_name = data["teamName"]
+            return cls(
+                data["scorerId"],
+                data["name"],
+                data["shortName"],
+                team_name,
+                data.get("teamShortName", team_name),
+                data["posShortNames"],
+                tuple(data["posIdsNoFlex"]),
+                tuple(data["posIds"]),
+                tuple(i["typeId"] for i in data.get("icons", ())),
+            )
+        except (KeyError, TypeError) as e:
+            raise FantraxException(f"Invalid scorer data, missing {e}")
+
+
+class GameData(NamedTuple):
+    """Validated game cell of a roster table seen from one Player's team."""
+
+    id: str
+    date: date
+    opponent: str
+    time: time | None
+    home: bool
+
+    @classmethod
+    def parse(cls, data: dict, game_date: str, team_short_name: str, season_start: date, season_end: date) -> Self:
+        try:
+            played = dates.season(season_start, season_end).day(game_date)
+            start_time = None
+            parts = data["content"].removesuffix(" F").split("\u003cbr/\u003e")
+            if ":" in parts[1]:
+                opponent = parts[0]
+                if opponent.startswith("@"):
+                    opponent = opponent[1:]
+                    home = team_short_name
+                else:
+                    home = opponent
+                start_time = dates.parse(parts[1].split(" ")[1], "%I:%M%p").time()
+            else:
+                home = "".join(i for i in parts[0] if not i.isdigit() and i not in [" ", "@"])
+                away = "".join(i for i in parts[1] if not i.isdigit() and i not in [" ", "@"])
+                opponent = away if home == team_short_name else home
+            return cls(data["eventId"], played, opponent, start_time, home == team_short_name)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise FantraxException(f"Invalid game data: {e}")
+
+
+class RosterRowData(NamedTuple):
+    """Validated row of a roster STATS table merged with its SCHEDULE_FULL row."""
+
+    pos_id: str
+    status_id: str | None
+    scorer: ScorerData | None
+    total_fantasy_points: float | None
+    fantasy_points_per_game: float | None
+    game_today: dict | GameData | None
+    future_games: dict[str, dict | GameData]
+
+
+roster_points_schema = TableSchema([Column("total_fantasy_points", "SCORE", number), Column("fantasy_points_per_game", "FPTS_PER_GAME", number)], key="sortKey")
+
+
+class RosterData(NamedTuple):
+    """Validated ``getTeamRosterInfo`` STATS and SCHEDULE_FULL responses.
+
+    ``stats`` holds every stat column of the STATS tables by its header ``shortName`` as a float ``array`` aligned to
+    ``rows``, cells that are empty, not numeric or missing from a row's table are NaN.
+    """
+
+    period_number: int
+    status_totals: dict[str, tuple[int, int]]
+    rows: list[RosterRowData]
+    stats: dict[str, array]
+
+    @classmethod
+    def parse(cls, stats: dict, schedule: dict) -> Self:
+        try:
+            status_totals = {d["name"]: (_int(d.get("total")), _int(d.get("max"))) for d in stats["miscData"]["statusTotals"]}
+            rows = []
+            columns = {}
+            for stats_group, schedule_group in zip(stats["tables"], schedule["tables"]):
+                stats_header = stats_group["header"]["cells"]
+                points_plan = roster_points_schema.compile(stats_header)
+                stats_plan = TableSchema.compile_all(stats_header, skip=_is_event)
+                today_indexes = [i for i, h in enumerate(stats_header) if h.get("eventStr")]
+                future_indexes = [(i, h["shortName"]) for i, h in enumerate(schedule_group["header"]["cells"]) if h.get("eventStr")]
+                table_cells = []
+                for stats_row, schedule_row in zip(stats_group["rows"], schedule_group["rows"]):
+                    if "posId" not in stats_row:
+                        continue
+                    if "scorer" not in stats_row:
+                        rows.append(RosterRowData(stats_row["posId"], stats_row.get("statusId"), None, None, None, None, {}))
+                        table_cells.append(())
+                        continue
+                    stats_cells = stats_row["cells"]
+                    schedule_cells = schedule_row["cells"]
+                    game_today = None
+                    for i in today_indexes:
+                        if i < len(stats_cells) and stats_cells[i]["content"]:
+                            game_today = stats_cells[i]
+                    rows.append(
+                        RosterRowData(
+                            stats_row["posId"],
+                            stats_row.get("statusId"),
+                            ScorerData.parse(stats_row["scorer"]),
+                            *points_plan.row(stats_cells),
+                            game_today,
+                            {key: schedule_cells[i] for i, key in future_indexes if i < len(schedule_cells) and schedule_cells[i]["content"]},
+                        )
+                    )
+                    table_cells.append(stats_cells)
+                start = len(rows) - len(table_cells)
+                for name, values in stats_plan.columns(table_cells).items():
+                    if name not in columns:
+                        columns[name] = array("d", [float("nan")]) * start
+                    columns[name].extend(values)
+                for values in columns.values():
+                    values.extend(array("d", [float("nan")]) * (len(rows) - len(values)))
+            return cls(int(stats["displayedSelections"]["displayedPeriod"]), status_totals, rows, columns)
+        except (KeyError, TypeError, ValueError) as e:
+            raise FantraxException(f"Invalid roster data: {e}")
+
+
+class LiveScoresData(NamedTuple):
+    """Validated ``getLiveScoringStats`` response of the Teams playing that day."""
+
+    scorers: dict[str, ScorerData]
+    points: dict[str, list[tuple[str, float]]]
+
+    @classmethod
+    def parse(cls, data: dict) -> Self:
+        try:
+            scorers = {}
+            for teams in data["scorerMap"].values():
+                for statuses in teams.values():
+                    for players in statuses.values():
+                        for player in players:
+                            if player["scorer"]["scorerId"] not in scorers:
+                                scorers[player["scorer"]["scorerId"]] = ScorerData.parse(player["scorer"])
+            active_teams = set()
+            for matchup in data["matchups"]:
+                active_teams.update(matchup.split("_"))
+            points = {}
+            for team_id, team_data in data["statsPerTeam"]["allTeamsStats"].items():
+                if team_id in active_teams:
+                    points[team_id] = [(scorer_id, pts["object1"]) for scorer_id, pts in team_data["ACTIVE"]["statsMap"].items() if not scorer_id.startswith("_")]
+            return cls(scorers, points)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise FantraxException(f"Invalid live scoring data, missing {e}")
+
+
+class RecordData(NamedTuple):
+    """Validated row of a ``getStandings`` table."""
+
+    team_id: str
+    rank: int
+    win: int
+    loss: int
+    tie: int
+    points: int
+    win_percentage: float
+    games_back: int
+    wavier_wire_order: int
+    points_for: float
+    points_against: float
+    streak: str
+
+
+standings_schema = TableSchema(
+    [
+        Column("win", "win", integer, 0),
+        Column("loss", "loss", integer, 0),
+        Column("tie", "tie", integer, 0),
+        Column("points", "points", integer, 0),
+        Column("win_percentage", "winpc", nullable(number, 0.0), 0.0),
+        Column("games_back", "gamesback", integer, 0),
+        Column("wavier_wire_order", "wwOrder", integer, 0),
+        Column("points_for", "pointsFor", number, 0.0),
+        Column("points_against", "pointsAgainst", number, 0.0),
+        Column("streak", "streak", str, ""),
+    ]
+)
+
+
+class StandingsData(NamedTuple):
+    """Validated ``getStandings`` table."""
+
+    records: list[RecordData]
+
+    @classmethod
+    def parse(cls, table: dict) -> Self:
+        try:
+            plan = standings_schema.compile(table["header"]["cells"])
+            return cls([RecordData(row["fixedCells"][1]["teamId"], int(row["fixedCells"][0]["content"]), *plan.row(row["cells"])) for row in table["rows"]])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise FantraxException(f"Invalid standings data: {e}")
+
+
+class TransactionRowData(NamedTuple):
+    """Validated row of a ``getTransactionDetailsHistory`` table."""
+
+    tx_set_id: str
+    team_id: str
+    date: str
+    scorer: ScorerData
+    type: str
+
+    @classmethod
+    def parse(cls, row: dict) -> Self:
+        try:
+            code = row["transactionCode"]
+            return cls(row["txSetId"], row["cells"][0]["teamId"], row["cells"][1]["content"], ScorerData.parse(row["scorer"]), row["claimType"] if code == "CLAIM" else code)
+        except (KeyError, IndexError, TypeError) as e:
+            raise FantraxException(f"Invalid transaction data, missing {e}")
+
+
+class TradeBlockData(NamedTuple):
+    """Validated ``getTradeBlocks`` trade block."""
+
+    team_id: str
+    last_updated: int
+    note: str
+    players_offered: dict[str, list[ScorerData]]
+    players_wanted: dict[str, list[ScorerData]]
+    positions_offered: tuple[str, ...]
+    positions_wanted: tuple[str, ...]
+    stats_offered: tuple[str, ...]
+    stats_wanted: tuple[str, ...]
+
+    @classmethod
+    def parse(cls, data: dict) -> Self:
+        try:
+            return cls(
+                data["teamId"],
+                data["lastUpdated"]["date"],
+                data["comment"]["body"] if "comment" in data else "",
+                {k: [ScorerData.parse(p) for p in ps] for k, ps in data["scorersOffered"]["scorers"].items()} if "scorersOffered" in data else {},
+                {k: [ScorerData.parse(p) for p in ps] for k, ps in data["scorersWanted"]["scorers"].items()} if "scorersWanted" in data else {},
+                tuple(data["positionsOffered"]["positions"]) if "positionsOffered" in data else (),
+                tuple(data["positionsWanted"]["positions"]) if "positionsWanted" in data else (),
+                tuple(s["shortName"] for s in data["statsOffered"]["stats"]) if "statsOffered" in data else (),
+                tuple(s["shortName"] for s in data["statsWanted"]["stats"]) if "statsWanted" in data else (),
+            )
+        except (KeyError, TypeError) as e:
+            raise FantraxException(f"Invalid trade block data, missing {e}")
@@ -0,0 +1,110 @@
+import threading
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+
+
+@lru_cache(maxsize=16384)
+def normalize(text: str) -> str:
+    """Returns text casefolded with its accents removed, so ``Stützle`` and ``stutzle`` compare equal.
+
+    Args:
+        text (str): Text to normalize.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold().strip()
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Accent and case insensitive name index answering exact, prefix and substring queries.
+
+    Names are normalized once when added. Prefix queries bisect a sorted list of every name and every word in a name,
+    substring queries intersect the trigram sets of the query and only check the remaining candidates.
+
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[str, tuple[str, object]] = {}
+        self._order: dict[str, int] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._words: list[tuple[str, str]] = []
+        self._sorted: bool = True
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    def add(self, key: str, name: str, obj: object) -> None:
+        """Adds an object to the index or replaces the object stored under the same key.
+
+        Args:
+            key (str): Unique key of the object, like its ID.
+            name (str): Name to search the object by.
+            obj (object): Object to return from searches.
+        """
+        normalized = normalize(name)
+        current = self._items.get(key)
+        if current is not None and current[0] == normalized:
+            self._items[key] = (normalized, obj)
+            return
+        with self._lock:
+            current = self._items.get(key)
+            self._items[key] = (normalized, obj)
+            if current is not None:
+                if current[0] == normalized:
+                    return
+                for gram in _grams(current[0]):
+                    self._grams[gram].discard(key)
+                self._words = [w for w in self._words if w[1] != key]
+            else:
+                self._order[key] = len(self._order)
+            for gram in _grams(normalized):
+                self._grams.setdefault(gram, set()).add(key)
+            self._words.extend((word, key) for word in {normalized, *normalized.split()})
+            self._sorted = False
+
+    def search(self, query: str, limit: int | None = None) -> list:
+        """Returns the objects whose name matches the query.
+
+        Exact matches come first, then names or words starting with the query, then names containing it, each group in
+        the order the objects were first added.
+
+        Args:
+            query (str): Name or part of a name.
+            limit (int | None): Maximum number of objects to return.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        with self._lock:
+            if not self._sorted:
+                self._words.sort()
+                self._sorted = True
+            words = self._words
+            prefix = set()
+            i = bisect_left(words, (query, ""))
+            while i < len(words) and words[i][0].startswith(query):
+                prefix.add(words[i][1])
+                i += 1
+            if len(query) < 3:
+                contains = {k for k, (normalized, _) in self._items.items() if query in normalized}
+            else:
+                candidates = None
+                for gram in _grams(query):
+                    keys = self._grams.get(gram, set())
+                    candidates = set(keys) if candidates is None else candidates & keys
+                    if not candidates:
+                        break
+                contains = {k for k in candidates or () if query in self._items[k][0]}
+            exact = [k for k in prefix if self._items[k][0] == query]
+            keys = sorted(exact, key=self._order.get)
+            keys += sorted(prefix.difference(exact), key=self._order.get)
+            keys += sorted(contains.difference(prefix), key=self._order.get)
+            return [self._items[k][1] for k in keys[:limit]]
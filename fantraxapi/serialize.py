@@ -0,0 +1,136 @@
+import copyreg
+import io
+import pickle
+from typing import IO
+
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.objs import League, Position, Roster, ScoringPeriod, Status, Team
+from fantraxapi.objs.base import FantraxBaseObject
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: IO[bytes], league: League | None, protocol: int) -> None:
+        super().__init__(file, protocol=protocol)
+        self.league: League | None = league
+
+    def _check(self, league: League) -> None:
+        if self.league is None:
+            self.league = league
+        elif league is not self.league:
+            raise FantraxException(f"Objects of League {league.league_id} and League {self.league.league_id} can't be serialized together")
+
+    def persistent_id(self, obj: object) -> tuple | None:
+        if isinstance(obj, League):
+            self._check(obj)
+            return ("L", obj.league_id)
+        if not isinstance(obj, FantraxBaseObject):
+            return None
+        league = obj.league
+        if isinstance(obj, Team) and league.team_lookup.get(obj.id) is obj:
+            self._check(league)
+            return ("T", obj.id)
+        if isinstance(obj, Position) and league.positions.get(obj.id) is obj:
+            self._check(league)
+            return ("P", obj.id)
+        if isinstance(obj, Status) and league.status.get(obj.id) is obj:
+            self._check(league)
+            return ("S", obj.id)
+        if isinstance(obj, ScoringPeriod) and league.scoring_periods.get(obj.number) is obj:
+            self._check(league)
+            return ("SP", obj.number)
+        return None
+
+    def reducer_override(self, obj: object) -> tuple:
+        if isinstance(obj, FantraxBaseObject) and not isinstance(obj, League):
+            state = obj.__dict__.copy()
+            state["_data"] = None
+            return copyreg.__newobj__, (type(obj),), state
+        return NotImplemented
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], league: League) -> None:
+        super().__init__(file)
+        self.league: League = league
+
+    def persistent_load(self, pid: tuple) -> object:
+        match pid:
+            case ("L", league_id):
+                if league_id != self.league.league_id:
+                    raise FantraxException(f"Objects of League {league_id} can't be loaded into League {self.league.league_id}")
+                return self.league
+            case ("T", team_id):
+                return self.league.team(team_id)
+            case ("P", position_id):
+                return self.league.positions[position_id]
+            case ("S", status_id):
+                return self.league.status[status_id]
+            case ("SP", number):
+                return self.league.scoring_periods[number]
+        raise FantraxException(f"Unknown serialized reference {pid}")
+
+
+def dump(obj: object, file: IO[bytes], protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+    """Writes Fantrax objects to a binary file, see :func:`dumps`.
+
+    Args:
+        obj (object): Object or container of objects to serialize.
+        file (IO[bytes]): Binary file to write to.
+        protocol (int): Pickle protocol.
+    """
+    _Pickler(file, None, protocol).dump(obj)
+
+
+def dumps(obj: object, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+    """Returns a compact serialization of Fantrax objects like a Roster, Standings or a list of Trades.
+
+    The League and the Teams, Positions, Statuses and ScoringPeriods it owns are stored as ids instead of being copied,
+    and the raw response data (``_data``) of every object is dropped. Everything else, including references between the
+    serialized objects, is kept. Use :func:`loads` with the same League to get the objects back.
+
+    Args:
+        obj (object): Object or container of objects to serialize.
+        protocol (int): Pickle protocol.
+
+    Raises:
+        FantraxException: When objects from more than one League are serialized together.
+    """
+    buffer = io.BytesIO()
+    dump(obj, buffer, protocol=protocol)
+    return buffer.getvalue()
+
+
+def load(file: IO[bytes], league: League) -> object:
+    """Reads Fantrax objects from a binary file written by :func:`dump`, see :func:`loads`.
+
+    Args:
+        file (IO[bytes]): Binary file to read from.
+        league (League): League to attach the objects to.
+    """
+    obj = _Unpickler(file, league).load()
+    _index_rosters(league, obj)
+    return obj
+
+
+def _index_rosters(league: League, obj: object) -> None:
+    if isinstance(obj, Roster):
+        league._index_roster(obj)
+    elif isinstance(obj, (list, tuple, set)):
+        for item in obj:
+            _index_rosters(league, item)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            _index_rosters(league, item)
+
+
+def loads(data: bytes, league: League) -> object:
+    """Returns the Fantrax objects serialized by :func:`dumps` attached to a League.
+
+    Args:
+        data (bytes): Serialized objects.
+        league (League): League to attach the objects to, must have the same League ID they were serialized with.
+
+    Raises:
+        FantraxException: When the objects belong to another League.
+    """
+    return load(io.BytesIO(data), league)
@@ -0,0 +1,170 @@
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import NamedTuple
+
+
+def number(content: str) -> float:
+    """Converts cell content like ``"1,204.5"`` to a float."""
+    return float(content.replace(",", ""))
+
+
+def integer(content: str) -> int:
+    """Converts cell content like ``"1,204"`` to an int."""
+    return int(content.replace(",", ""))
+
+
+def nullable(convert: Callable[[str], object], empty: object = None) -> Callable[[str], object]:
+    """Wraps a converter so ``""`` and ``"-"`` cells become ``empty`` instead of raising.
+
+    Args:
+        convert (Callable[[str], object]): Converter to wrap.
+        empty (object): Value of empty cells.
+    """
+
+    def _convert(content: str) -> object:
+        return empty if content in ("", "-") else convert(content)
+
+    return _convert
+
+
+def stat(content: str) -> float:
+    """Converts cell content to a float or NaN when it isn't a number."""
+    try:
+        return float(content.replace(",", ""))
+    except (AttributeError, ValueError):
+        return float("nan")
+
+
+_float_converters = (number, stat)
+
+
+class Column(NamedTuple):
+    """Column of a TableSchema.
+
+    Attributes:
+        name (str): Name of the value in extracted rows.
+        key (str): Header value that identifies the column.
+        convert (Callable[[str], object]): Converts the cell content.
+        default (object): Value when the column isn't in the header or a row is too short.
+
+    """
+
+    name: str
+    key: str
+    convert: Callable[[str], object] = str
+    default: object = None
+
+
+class TablePlan:
+    """Column accessor plan of one table compiled by :meth:`TableSchema.compile` or :meth:`TableSchema.compile_all`.
+
+    Args:
+        names (Sequence[str]): Names of the extracted values.
+        indexes (Sequence[int | None]): Cell index of each value, None when it isn't in the table.
+        converters (Sequence[Callable[[str], object]]): Converter of each value.
+        defaults (Sequence[object]): Default of each value.
+
+    """
+
+    def __init__(self, names: Sequence[str], indexes: Sequence[int | None], converters: Sequence[Callable[[str], object]], defaults: Sequence[object]) -> None:
+        self.names: tuple[str, ...] = tuple(names)
+        self._columns: tuple[tuple[int | None, Callable[[str], object], object], ...] = tuple(zip(indexes, converters, defaults))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def row(self, cells: list[dict]) -> tuple:
+        """Returns the converted values of one row's cells in plan order.
+
+        Args:
+            cells (list[dict]): Cells of the row.
+        """
+        size = len(cells)
+        return tuple(default if i is None or i >= size else convert(cells[i]["content"]) for i, convert, default in self._columns)
+
+    def columns(self, rows: Iterable[list[dict]], typecode: str = "d") -> dict[str, array]:
+        """Returns every value as a numeric ``array`` of all rows, converting one column at a time.
+
+        Args:
+            rows (Iterable[list[dict]]): Cells of every row.
+            typecode (str): ``array`` typecode of the columns.
+        """
+        rows = list(rows)
+        shortest = min(map(len, rows), default=0)
+        output = {}
+        for name, (i, convert, default) in zip(self.names, self._columns):
+            if i is None:
+                output[name] = array(typecode, [default]) * len(rows)
+                continue
+            if i < shortest:
+                contents = [cells[i]["content"] for cells in rows]
+                if convert in _float_converters:
+                    try:
+                        output[name] = array(typecode, map(float, contents))
+                        continue
+                    except ValueError:
+                        pass
+                output[name] = array(typecode, map(convert, contents))
+            else:
+                output[name] = array(typecode, [convert(cells[i]["content"]) if i < len(cells) else default for cells in rows])
+        return output
+
+
+class TableSchema:
+    """Columns to read from Fantrax ``header``/``rows`` tables, compiled into a TablePlan once per table header.
+
+    Args:
+        columns (Sequence[Column]): Columns to read.
+        key (str): Header cell field matched against each Column's key.
+
+    """
+
+    def __init__(self, columns: Sequence[Column], key: str = "key") -> None:
+        self.columns: tuple[Column, ...] = tuple(columns)
+        self.key: str = key
+
+    def compile(self, header: list[dict]) -> TablePlan:
+        """Returns the TablePlan of the schema's columns for a table header.
+
+        Args:
+            header (list[dict]): Header cells of the table.
+        """
+        positions = {}
+        for i, cell in enumerate(header):
+            if self.key in cell:
+                positions.setdefault(cell[self.key], i)
+        return TablePlan(
+            [c.name for c in self.columns],
+            [positions.get(c.key) for c in self.columns],
+            [c.convert for c in self.columns],
+            [c.default for c in self.columns],
+        )
+
+    @staticmethod
+    def compile_all(
+        header: list[dict],
+        keys: Sequence[str] = ("shortName", "sortKey"),
+        convert: Callable[[str], object] = stat,
+        default: object = float("nan"),
+        skip: Callable[[dict], bool] | None = None,
+    ) -> TablePlan:
+        """Returns a TablePlan of every column in a table header named by the first of ``keys`` it has.
+
+        Args:
+            header (list[dict]): Header cells of the table.
+            keys (Sequence[str]): Header cell fields to name columns by in order of preference.
+            convert (Callable[[str], object]): Converter of every column.
+            default (object): Default of every column.
+            skip (Callable[[dict], bool] | None): Header cells to leave out.
+        """
+        indexes = {}
+        for i, cell in enumerate(header):
+            if skip and skip(cell):
+                continue
+            name = next((cell[k] for k in keys if cell.get(k)), None)
+            if name:
+                indexes.setdefault(name, i)
+        return TablePlan(list(indexes), list(indexes.values()), [convert] * len(indexes), [default] * len(indexes))
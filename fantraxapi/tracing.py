@@ -0,0 +1,132 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+Param = ParamSpec("Param")
+Return = TypeVar("Return")
+
+_null_span: nullcontext = nullcontext()
+
+
+class Tracer:
+    """Base Tracer, subclass and override :meth:`span` to send spans to a tracing backend."""
+
+    def span(self, name: str, **attributes: str | int | float | bool) -> AbstractContextManager:
+        return _null_span
+
+
+class RecordedSpan:
+    """Represents a single span recorded by a RecordingTracer.
+
+    Attributes:
+        name (str): Span name.
+        attributes (dict): Span attributes.
+        start (float): ``perf_counter`` value when the span started.
+        duration (float): Seconds the span was open.
+        children (list[RecordedSpan]): Spans opened while this span was open on the same thread.
+
+    """
+
+    __slots__ = ("name", "attributes", "start", "duration", "children")
+
+    def __init__(self, name: str, attributes: dict) -> None:
+        self.name: str = name
+        self.attributes: dict = attributes
+        self.start: float = time.perf_counter()
+        self.duration: float = 0.0
+        self.children: list[RecordedSpan] = []
+
+    def __str__(self) -> str:
+        return f"{self.name} {self.duration * 1e3:.2f}ms"
+
+
+class RecordingTracer(Tracer):
+    """Tracer that keeps a tree of spans in memory, useful for finding where time goes without a tracing backend.
+
+    Attributes:
+        spans (list[RecordedSpan]): Root spans in the order they finished.
+
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[RecordedSpan] = []
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes: str | int | float | bool) -> Iterator[RecordedSpan]:
+        stack = self._local.__dict__.setdefault("stack", [])
+        recorded = RecordedSpan(name, attributes)
+        stack.append(recorded)
+        try:
+            yield recorded
+        finally:
+            recorded.duration = time.perf_counter() - recorded.start
+            stack.pop()
+            if stack:
+                stack[-1].children.append(recorded)
+            else:
+                with self._lock:
+                    self.spans.append(recorded)
+
+    def report(self) -> str:
+        """Returns the recorded span tree as an indented string."""
+        lines = []
+
+        def _add(recorded: RecordedSpan, depth: int) -> None:
+            lines.append(f"{'  ' * depth}{recorded}")
+            for child in recorded.children:
+                _add(child, depth + 1)
+
+        for root in self.spans:
+            _add(root, 0)
+        return "\n".join(lines)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer that creates OpenTelemetry spans, requires the ``opentelemetry-api`` package."""
+
+    def __init__(self, name: str = "fantraxapi") -> None:
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer(name)
+
+    def span(self, name: str, **attributes: str | int | float | bool) -> AbstractContextManager:
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+tracer: Tracer | None = None
+
+
+def set_tracer(new_tracer: Tracer | None) -> None:
+    """Sets the Tracer used for all spans, None turns tracing off.
+
+    Args:
+        new_tracer (Tracer | None): Tracer to use.
+    """
+    global tracer
+    tracer = new_tracer
+
+
+def span(name: str, **attributes: str | int | float | bool) -> AbstractContextManager:
+    """Returns a span context manager from the current Tracer or a shared no-op context when tracing is off."""
+    if tracer is None:
+        return _null_span
+    return tracer.span(name, **attributes)
+
+
+def traced(func: Callable[Param, Return]) -> Callable[Param, Return]:
+    """Decorator that wraps every call to ``func`` in a span named after its qualified name."""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> Return:
+        if tracer is None:
+            return func(*args, **kwargs)
+        with tracer.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,315 @@
+import sqlite3
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import NamedTuple
+
+from fantraxapi.objs import League, LivePlayer, Player, Roster, Standings, Transaction
+
+schema = """
+CREATE TABLE IF NOT EXISTS teams (
+    league_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    short TEXT NOT NULL,
+    PRIMARY KEY (league_id, team_id)
+);
+CREATE TABLE IF NOT EXISTS players (
+    player_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    short_name TEXT NOT NULL,
+    team_short_name TEXT NOT NULL,
+    pos_short_name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roster_rows (
+    league_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    period_number INTEGER NOT NULL,
+    period_date TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    position_id TEXT NOT NULL,
+    status_id TEXT,
+    player_id TEXT,
+    total_fantasy_points REAL,
+    fantasy_points_per_game REAL,
+    PRIMARY KEY (league_id, team_id, period_number, slot)
+);
+CREATE INDEX IF NOT EXISTS roster_rows_player ON roster_rows (player_id, period_date);
+CREATE INDEX IF NOT EXISTS roster_rows_date ON roster_rows (league_id, team_id, period_date);
+CREATE TABLE IF NOT EXISTS standings (
+    league_id TEXT NOT NULL,
+    scoring_period_number INTEGER NOT NULL,
+    only_period INTEGER NOT NULL,
+    team_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    win INTEGER NOT NULL,
+    loss INTEGER NOT NULL,
+    tie INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    win_percentage REAL NOT NULL,
+    games_back INTEGER NOT NULL,
+    points_for REAL NOT NULL,
+    points_against REAL NOT NULL,
+    streak TEXT NOT NULL,
+    PRIMARY KEY (league_id, scoring_period_number, only_period, team_id)
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    league_id TEXT NOT NULL,
+    transaction_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (league_id, transaction_id, player_id, type)
+);
+CREATE INDEX IF NOT EXISTS transactions_player ON transactions (player_id, date);
+CREATE INDEX IF NOT EXISTS transactions_team ON transactions (league_id, team_id, date);
+CREATE TABLE IF NOT EXISTS live_points (
+    league_id TEXT NOT NULL,
+    points_date TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    team_id TEXT NOT NULL,
+    points REAL NOT NULL,
+    PRIMARY KEY (league_id, points_date, player_id)
+);
+CREATE INDEX IF NOT EXISTS live_points_player ON live_points (player_id, points_date);
+CREATE INDEX IF NOT EXISTS live_points_team ON live_points (league_id, team_id, points_date);
+"""
+
+
+class LineupRow(NamedTuple):
+    """Single row of a Team's stored Roster."""
+
+    slot: int
+    position_id: str
+    status_id: str | None
+    player_id: str | None
+    name: str | None
+    total_fantasy_points: float | None
+
+
+class TransactionEntry(NamedTuple):
+    """Single Player move of a stored Transaction."""
+
+    league_id: str
+    transaction_id: str
+    team_id: str
+    date: datetime
+    player_id: str
+    type: str
+
+
+class Warehouse:
+    """Local SQLite store of League history with indexed tables for Rosters, Standings, Transactions and LivePlayers.
+
+    Every ``add_*`` method writes all of its rows with a single ``executemany`` inside one transaction and replaces rows
+    that were already stored, so the same objects can be added again safely. Adding a Team's Roster for a period replaces
+    every row stored for that Team and period, so slots a smaller Roster no longer has are removed.
+
+    Args:
+        path (str): SQLite database file, defaults to an in-memory database.
+
+    Attributes:
+        connection (sqlite3.Connection): Database connection.
+
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.executescript(schema)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _insert(self, table: str, rows: Iterable[tuple], delete: str | None = None, delete_keys: Iterable[tuple] = ()) -> int:
+        rows = list(rows)
+        delete_keys = list(delete_keys)
+        if rows or delete_keys:
+            with self.connection:
+                if delete and delete_keys:
+                    self.connection.executemany(f"DELETE FROM {table} WHERE {delete}", delete_keys)
+                if rows:
+                    self.connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({', '.join('?' * len(rows[0]))})", rows)
+        return len(rows)
+
+    def add_league(self, league: League) -> int:
+        """Stores the Teams of a League and returns the number of rows written.
+
+        Args:
+            league (League): League to store.
+        """
+        return self._insert("teams", ((league.league_id, t.id, t.name, t.short) for t in league.teams))
+
+    def add_players(self, players: Iterable[Player]) -> int:
+        """Stores Players and returns the number of rows written.
+
+        Args:
+            players (Iterable[Player]): Players to store.
+        """
+        unique = {p.id: p for p in players}
+        return self._insert("players", ((p.id, p.name, p.short_name, p.team_short_name, p.pos_short_name) for p in unique.values()))
+
+    def add_rosters(self, rosters: Iterable[Roster]) -> int:
+        """Stores Rosters and their Players and returns the number of roster rows written.
+
+        Args:
+            rosters (Iterable[Roster]): Rosters to store.
+        """
+        rows = []
+        players = []
+        keys = set()
+        for roster in rosters:
+            keys.add((roster.league.league_id, roster.team.id, roster.period_number))
+            for slot, row in enumerate(roster.rows):
+                if row.player:
+                    players.append(row.player)
+                rows.append(
+                    (
+                        roster.league.league_id,
+                        roster.team.id,
+                        roster.period_number,
+                        roster.period_date.isoformat(),
+                        slot,
+                        row.position.id,
+                        row.status_id,
+                        row.player.id if row.player else None,
+                        row.total_fantasy_points,
+                        row.fantasy_points_per_game,
+                    )
+                )
+        self.add_players(players)
+        return self._insert("roster_rows", rows, delete="league_id = ? AND team_id = ? AND period_number = ?", delete_keys=keys)
+
+    def add_standings(self, standings: Standings) -> int:
+        """Stores Standings and returns the number of rows written, season Standings are stored as period ``0``.
+
+        Standings of only one period and Standings from the season start to that period are stored separately.
+
+        Args:
+            standings (Standings): Standings to store.
+        """
+        period = standings.scoring_period_number or 0
+        return self._insert(
+            "standings",
+            (
+                (
+                    standings.league.league_id,
+                    period,
+                    int(standings.only_period),
+                    r.team.id,
+                    r.rank,
+                    r.win,
+                    r.loss,
+                    r.tie,
+                    r.points,
+                    r.win_percentage,
+                    r.games_back,
+                    r.points_for,
+                    r.points_against,
+                    r.streak,
+                )
+                for r in standings.ranks.values()
+            ),
+        )
+
+    def add_transactions(self, transactions: Iterable[Transaction]) -> int:
+        """Stores Transactions and their Players and returns the number of rows written.
+
+        Args:
+            transactions (Iterable[Transaction]): Transactions to store.
+        """
+        rows = []
+        players = []
+        for transaction in transactions:
+            for player in transaction.players:
+                players.append(player)
+                rows.append((transaction.league.league_id, transaction.id, transaction.team.id, transaction.date.isoformat(), player.id, player.type))
+        self.add_players(players)
+        return self._insert("transactions", rows)
+
+    def add_live_scores(self, live_scores: dict[str, list[LivePlayer]] | Iterable[LivePlayer]) -> int:
+        """Stores LivePlayers and returns the number of rows written.
+
+        Args:
+            live_scores (dict[str, list[LivePlayer]] | Iterable[LivePlayer]): Output of :meth:`League.live_scores` or LivePlayers.
+        """
+        if isinstance(live_scores, dict):
+            live_scores = [p for players in live_scores.values() for p in players]
+        live_scores = list(live_scores)
+        self.add_players(live_scores)
+        return self._insert("live_points", ((p.league.league_id, p.points_date.isoformat(), p.id, p.team.id, p.points) for p in live_scores))
+
+    def player_points(self, player_id: str, start: date, end: date) -> dict[date, float]:
+        """Returns a Dictionary of dates to the live points a Player scored between start and end inclusive.
+
+        Args:
+            player_id (str): Player ID.
+            start (date): First date.
+            end (date): Last date.
+        """
+        cursor = self.connection.execute(
+            "SELECT points_date, SUM(points) FROM live_points WHERE player_id = ? AND points_date BETWEEN ? AND ? GROUP BY points_date ORDER BY points_date",
+            (player_id, start.isoformat(), end.isoformat()),
+        )
+        return {date.fromisoformat(d): points for d, points in cursor}
+
+    def team_points(self, league_id: str, team_id: str, start: date, end: date) -> dict[date, float]:
+        """Returns a Dictionary of dates to the live points a Team scored between start and end inclusive.
+
+        Args:
+            league_id (str): Fantrax League ID.
+            team_id (str): Team ID.
+            start (date): First date.
+            end (date): Last date.
+        """
+        cursor = self.connection.execute(
+            "SELECT points_date, SUM(points) FROM live_points WHERE league_id = ? AND team_id = ? AND points_date BETWEEN ? AND ? GROUP BY points_date ORDER BY points_date",
+            (league_id, team_id, start.isoformat(), end.isoformat()),
+        )
+        return {date.fromisoformat(d): points for d, points in cursor}
+
+    def team_lineup(self, league_id: str, team_id: str, on: date) -> list[LineupRow]:
+        """Returns the stored Roster of a Team on a date.
+
+        Args:
+            league_id (str): Fantrax League ID.
+            team_id (str): Team ID.
+            on (date): Roster date.
+        """
+        cursor = self.connection.execute(
+            "SELECT r.slot, r.position_id, r.status_id, r.player_id, p.name, r.total_fantasy_points FROM roster_rows r "
+            "LEFT JOIN players p ON p.player_id = r.player_id WHERE r.league_id = ? AND r.team_id = ? AND r.period_date = ? ORDER BY r.slot",
+            (league_id, team_id, on.isoformat()),
+        )
+        return [LineupRow(*row) for row in cursor]
+
+    def player_transactions(self, player_id: str) -> list[TransactionEntry]:
+        """Returns every stored Transaction move of a Player oldest first.
+
+        Args:
+            player_id (str): Player ID.
+        """
+        cursor = self.connection.execute(
+            "SELECT league_id, transaction_id, team_id, date, player_id, type FROM transactions WHERE player_id = ? ORDER BY date",
+            (player_id,),
+        )
+        return [TransactionEntry(league_id, tx_id, team_id, datetime.fromisoformat(d), pid, tx_type) for league_id, tx_id, team_id, d, pid, tx_type in cursor]
+
+    def standings_history(self, league_id: str, team_id: str, only_period: bool = False) -> dict[int, tuple[int, int, int, int]]:
+        """Returns a Dictionary of scoring period numbers to a Team's ``(rank, win, loss, tie)``, ``0`` is the season Standings.
+
+        Args:
+            league_id (str): Fantrax League ID.
+            team_id (str): Team ID.
+            only_period (bool): Return the Standings of only each period instead of from the season start, defaults to False.
+        """
+        cursor = self.connection.execute(
+            "SELECT scoring_period_number, rank, win, loss, tie FROM standings WHERE league_id = ? AND team_id = ? AND only_period = ? ORDER BY scoring_period_number",
+            (league_id, team_id, int(only_period)),
+        )
+        return {period: (rank, win, loss, tie) for period, rank, win, loss, tie in cursor}
@@ -30,6 +30,7 @@ setup(
     python_requires=">=3.11",
     keywords=["fantraxapi", "fantrax", "fantasy", "wrapper", "api"],
     install_requires=["requests", "setuptools"],
+    extras_require={"fast": ["orjson"], "numpy": ["numpy"], "arrow": ["pyarrow"]},
     project_urls={
         "Documentation": "https://fantraxapi.kometa.wiki",
         "Funding": "https://github.com/sponsors/meisnate12",
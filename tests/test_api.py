@@ -1,6 +1,6 @@
 import os
-import pickle
 import sys
+import tempfile
 import time
 import unittest
 from datetime import date
@@ -17,6 +17,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
 from fantraxapi import League, NotLoggedIn, NotTeamInLeague
+from fantraxapi.cookies import CookieStore
 from fantraxapi.exceptions import DateNotInSeason, FantraxException, NotMemberOfLeague, PeriodNotInSeason
 from fantraxapi.objs import Trade
 
@@ -30,10 +31,11 @@ logger.addHandler(logging.StreamHandler())
 load_dotenv()
 
 league_id = os.environ["LEAGUE_ID"]
-local = os.environ["LOCAL"] == "True"
 username = os.environ["FANTRAX_USERNAME"]
 password = os.environ["FANTRAX_PASSWORD"]
-cookie_filepath = "fantraxloggedin.cookie"
+local = os.environ["LOCAL"] == "True"
+# Only local runs keep the logged in cookies between runs.
+cookie_filepath = "fantraxloggedin.json" if local else os.path.join(tempfile.mkdtemp(), "fantraxloggedin.json")
 py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
 
 team_names = [
@@ -52,35 +54,30 @@ team_names = [
 ]
 
 
+def selenium_login() -> list[dict]:
+    service = Service(ChromeDriverManager().install())
+
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--window-size=1920,1600")
+    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/97.0.4692.71 Safari/537.36")
+
+    with webdriver.Chrome(service=service, options=options) as driver:
+        driver.get("https://www.fantrax.com/login")
+        username_box = WebDriverWait(driver, 10).until(expected_conditions.presence_of_element_located((By.XPATH, "//input[@formcontrolname='email']")))
+        username_box.send_keys(username)
+        password_box = WebDriverWait(driver, 10).until(expected_conditions.presence_of_element_located((By.XPATH, "//input[@formcontrolname='password']")))
+        password_box.send_keys(password)
+        password_box.send_keys(Keys.ENTER)
+        time.sleep(5)
+        return driver.get_cookies()
+
+
+cookie_store = CookieStore(cookie_filepath, login=selenium_login)
+
+
 def add_cookie_to_session(session: Session) -> None:
-    if local and os.path.exists(cookie_filepath):
-        with open(cookie_filepath, "rb") as f:
-            for cookie in pickle.load(f):
-                session.cookies.set(cookie["name"], cookie["value"])
-    else:
-        service = Service(ChromeDriverManager().install())
-
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--window-size=1920,1600")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/97.0.4692.71 Safari/537.36")
-
-        with webdriver.Chrome(service=service, options=options) as driver:
-            driver.get("https://www.fantrax.com/login")
-            username_box = WebDriverWait(driver, 10).until(expected_conditions.presence_of_element_located((By.XPATH, "//input[@formcontrolname='email']")))
-            username_box.send_keys(username)
-            password_box = WebDriverWait(driver, 10).until(expected_conditions.presence_of_element_located((By.XPATH, "//input[@formcontrolname='password']")))
-            password_box.send_keys(password)
-            password_box.send_keys(Keys.ENTER)
-            time.sleep(5)
-
-            cookies = driver.get_cookies()
-            if local:
-                with open(cookie_filepath, "wb") as cookie_file:
-                    pickle.dump(driver.get_cookies(), cookie_file)
-
-            for cookie in cookies:
-                session.cookies.set(cookie["name"], cookie["value"])
+    cookie_store.apply(session)
 
 
 class APITests(unittest.TestCase):
@@ -0,0 +1,889 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from fantraxapi import League, NotLoggedIn, api, columns, dates, instrumentation, serialize, tracing
+from fantraxapi.archive import Archive
+from fantraxapi.bulk import build, bulk_parse
+from fantraxapi.cookies import CookieStore
+from fantraxapi.exceptions import DateNotInSeason, FantraxException
+from fantraxapi.manager import LeagueManager, RateLimiter
+from fantraxapi.mock import LeagueGenerator, MockServer, SyntheticSession
+from fantraxapi.objs import Matchup, Roster, Standings, Team
+from fantraxapi.replay import DirectoryStore, MemoryStore, RecordedResponse, RecordingSession, ReplaySession, request_key
+from fantraxapi.roster_history import RosterHistory, RosterSnapshot
+from fantraxapi.search import SearchIndex
+from fantraxapi.tables import Column, TableSchema, integer, nullable, number
+from fantraxapi.warehouse import Warehouse
+
+
+class OfflineLeagueTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.generator = LeagueGenerator(teams=14, roster_size=22, periods=20, transactions=150, seed=7)
+        cls.store = MemoryStore()
+        cls.league = League(cls.generator.league_id, session=SyntheticSession(cls.generator, store=cls.store))
+
+    def test_league(self) -> None:
+        self.assertEqual(len(self.league.teams), 14)
+        self.assertEqual(len(self.league.scoring_periods), 20)
+        self.assertTrue(all(isinstance(t, Team) for t in self.league.teams))
+
+    def test_deterministic(self) -> None:
+        generator = LeagueGenerator(teams=14, roster_size=22, periods=20, transactions=150, seed=7)
+        data = {"msgs": [{"method": "getFantasyLeagueInfo", "data": {"leagueId": generator.league_id}}]}
+        self.assertEqual(generator.response(data), self.generator.response(data))
+
+    def test_scoring_period_results(self) -> None:
+        results = self.league.scoring_period_results()
+        self.assertTrue(results)
+        for result in results.values():
+            if not result.playoffs:
+                self.assertEqual(len(result.matchups), 7)
+            for matchup in result.matchups:
+                winner, winner_score, loser, loser_score = matchup.winner()
+                if winner is not None:
+                    self.assertGreater(winner_score, loser_score)
+                    self.assertAlmostEqual(matchup.difference(), winner_score - loser_score)
+
+    def test_standings(self) -> None:
+        standings = self.league.standings()
+        self.assertIsInstance(standings, Standings)
+        self.assertEqual(len(standings.ranks), 14)
+
+    def test_transactions(self) -> None:
+        self.assertTrue(self.league.transactions(count=50))
+
+    def test_roster(self) -> None:
+        team = self.league.teams[0]
+        roster = self.league.team_roster(team.id)
+        self.assertIsInstance(roster, Roster)
+        self.assertEqual(len([r for r in roster.rows if r.player]), 22)
+
+    def test_roster_stats(self) -> None:
+        roster = self.league.team_roster(self.league.teams[0].id, period_number=10)
+        self.assertTrue({"GP", "G", "A", "FPts", "FP/G"} <= set(roster.stats))
+        self.assertTrue(all(len(values) == len(roster.rows) for values in roster.stats.values()))
+        for row in roster.rows:
+            if row.player:
+                self.assertEqual(row.stat("FPts"), row.total_fantasy_points)
+            else:
+                self.assertIsNone(row.stat("G"))
+        totals = roster.stat_totals()
+        self.assertAlmostEqual(totals["FPts"], sum(r.total_fantasy_points for r in roster.rows if r.player))
+        active = roster.stat_totals(status_id="1")
+        self.assertEqual(active["GP"], sum(r.stat("GP") for r in roster.rows if r.player and r.status_id == "1"))
+
+    def test_team_refresh(self) -> None:
+        teams = list(self.league.teams)
+        lookup = self.league.team_lookup
+        roster = self.league.team_roster(teams[0].id)
+        self.league.standings()
+        self.assertEqual([id(t) for t in self.league.teams], [id(t) for t in teams])
+        self.assertIs(roster.team, self.league.team(teams[0].id))
+        self.assertIs(self.league.team_lookup, lookup)
+
+        data = {t.id: dict(t._data) for t in teams}
+        data[teams[1].id]["name"] = "Renamed"
+        threads = [threading.Thread(target=self.league._update_teams, args=(data,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIs(self.league.team(teams[1].id), teams[1])
+        self.assertEqual(teams[1].name, "Renamed")
+        self.league.reset_info()
+        self.assertIs(self.league.team(teams[1].id), teams[1])
+        self.assertNotEqual(teams[1].name, "Renamed")
+
+    def test_shared_between_threads(self) -> None:
+        teams = {t.id: t for t in self.league.teams}
+        days = len(self.league.scoring_dates)
+        positions = dict(self.league.positions)
+
+        def work(i: int) -> None:
+            match i % 3:
+                case 0:
+                    self.league.reset_info()
+                case 1:
+                    self.league.standings()
+                case _:
+                    self.league.team_roster(self.league.teams[i % 14].id, period_number=i % days + 1)
+            self.assertEqual(len(self.league.scoring_dates), days)
+            self.assertEqual(len(self.league.scoring_periods_lookup), len(self.league.scoring_periods))
+            self.assertTrue(all(self.league.team(t) is team for t, team in teams.items()))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(48)))
+        self.assertTrue(all(self.league.positions[k] is v for k, v in positions.items()))
+
+    def test_find_player(self) -> None:
+        roster = self.league.team_roster(self.league.teams[2].id)
+        player = next(r.player for r in roster.rows if r.player)
+        self.assertEqual(self.league.find_player(player.name.upper())[0].id, player.id)
+        last_name = player.name.split()[1]
+        self.assertIn(player.id, [p.id for p in self.league.find_player(last_name[:3])])
+        self.assertEqual(self.league.find_player("no such player"), [])
+        team = self.league.teams[5]
+        self.assertIs(self.league.team(team.name[1:].lower()), team)
+
+    def test_find_player_sources(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4, transactions=20)
+        store = MemoryStore()
+        league = League(generator.league_id, session=SyntheticSession(generator, store=store))
+        league.live_scores(league.scoring_dates[2])
+        league.transactions(count=20)
+        self.assertEqual(len(league._players), 0)
+        roster = league.team_roster(league.teams[1].id)
+        player = next(r.player for r in roster.rows if r.player)
+        loaded = League(generator.league_id, session=ReplaySession(MemoryStore(store)))
+        serialize.loads(serialize.dumps([roster]), loaded)
+        self.assertEqual([p.id for p in loaded.find_player(player.name)], [player.id])
+        built = League(generator.league_id, session=ReplaySession(MemoryStore(store)))
+        for result in bulk_parse(store, leagues=built, max_workers=1):
+            if result.kind == "roster":
+                build(built, result)
+        self.assertEqual([p.id for p in built.find_player(player.name)], [player.id])
+
+    def test_logged_out(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4, logged_in=False)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        with self.assertRaises(NotLoggedIn):
+            league.pending_trades()
+
+    def test_replay(self) -> None:
+        self.league.standings()
+        league = League(self.generator.league_id, session=ReplaySession(MemoryStore(self.store)))
+        self.assertEqual(len(league.standings().ranks), 14)
+        with self.assertRaises(FantraxException):
+            league.live_scores(self.league.scoring_dates[1])
+
+
+class MockServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.generator = LeagueGenerator(teams=6, roster_size=14, periods=6, transactions=20)
+
+    def test_league(self) -> None:
+        with MockServer(self.generator) as server:
+            league = League(self.generator.league_id, session=server.session())
+            self.assertEqual(len(league.standings().ranks), 6)
+            self.assertGreater(server.stats.messages, server.stats.requests)
+
+    def test_pending_trades(self) -> None:
+        with MockServer(self.generator) as server:
+            league = League(self.generator.league_id, session=server.session())
+            requests, messages = server.stats.requests, server.stats.messages
+            self.assertEqual(len(league.pending_trades()), 3)
+            league.pending_trades()
+            self.assertEqual(server.stats.requests - requests, 2)
+            self.assertEqual(server.stats.messages - messages, 3)
+            self.assertTrue(league.logged_in)
+
+    def test_no_pending_trades(self) -> None:
+        self.generator.pending_trades = list
+        with MockServer(self.generator) as server:
+            league = League(self.generator.league_id, session=server.session())
+            self.assertEqual(league.pending_trades(), [])
+            self.assertEqual(league.pending_trades(), [])
+            self.assertTrue(league.logged_in)
+
+    def test_pending_trades_expired(self) -> None:
+        self.addCleanup(setattr, api, "login_check_interval", api.login_check_interval)
+        with MockServer(self.generator, cache=False) as server:
+            league = League(self.generator.league_id, session=server.session())
+            league.pending_trades()
+            self.assertTrue(api.logged_in(league.session))
+            self.generator.logged_in = False
+            api.login_check_interval = 0
+            self.assertFalse(api.logged_in(league.session))
+            with self.assertRaises(NotLoggedIn):
+                league.pending_trades()
+            self.assertFalse(league.logged_in)
+            self.assertNotIn(league.session, api._logged_in)
+
+    def test_error_injection(self) -> None:
+        with MockServer(self.generator, error_rate=1.0) as server:
+            with self.assertRaises(FantraxException):
+                League(self.generator.league_id, session=server.session())
+            self.assertEqual(server.stats.errors, 1)
+
+    def test_throttling(self) -> None:
+        with MockServer(self.generator, rate_limit=0.01, burst=1) as server:
+            league = League(self.generator.league_id, session=server.session())
+            with self.assertRaises(FantraxException):
+                league.standings()
+            self.assertEqual(server.stats.throttled, 1)
+
+
+class WarehouseTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = LeagueGenerator(teams=6, roster_size=14, periods=6, transactions=40)
+        cls.league = League(generator.league_id, session=SyntheticSession(generator))
+        cls.warehouse = Warehouse()
+        cls.warehouse.add_league(cls.league)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.warehouse.close()
+
+    def test_live_points(self) -> None:
+        days = sorted(self.league.scoring_dates.values())[:3]
+        for day in days:
+            self.warehouse.add_live_scores(self.league.live_scores(day))
+        player = self.league.live_scores(days[0])[self.league.teams[0].id][0]
+        points = self.warehouse.player_points(player.id, days[0], days[-1])
+        self.assertEqual(points[days[0]], player.points)
+        team_points = self.warehouse.team_points(self.league.league_id, self.league.teams[0].id, days[0], days[-1])
+        self.assertEqual(list(team_points), days)
+
+    def test_lineup(self) -> None:
+        team = self.league.teams[1]
+        roster = self.league.team_roster(team.id, period_number=5)
+        self.assertEqual(self.warehouse.add_rosters([roster]), len(roster.rows))
+        self.warehouse.add_rosters([roster])
+        lineup = self.warehouse.team_lineup(self.league.league_id, team.id, roster.period_date)
+        self.assertEqual([r.player_id for r in lineup], [r.player.id if r.player else None for r in roster.rows])
+        self.assertEqual(lineup[0].name, roster.rows[0].player.name)
+        roster.rows = roster.rows[:5]
+        self.warehouse.add_rosters([roster])
+        self.assertEqual(len(self.warehouse.team_lineup(self.league.league_id, team.id, roster.period_date)), 5)
+
+    def test_transactions(self) -> None:
+        transactions = self.league.transactions(count=40)
+        self.warehouse.add_transactions(transactions)
+        player = transactions[0].players[0]
+        entries = self.warehouse.player_transactions(player.id)
+        self.assertIn((transactions[0].id, player.type), [(e.transaction_id, e.type) for e in entries])
+
+    def test_standings(self) -> None:
+        self.warehouse.add_standings(self.league.standings())
+        self.warehouse.add_standings(self.league.standings(scoring_period_number=2))
+        team = self.league.teams[0]
+        period = self.league.standings(scoring_period_number=3, only_period=True)
+        self.warehouse.add_standings(period)
+        self.warehouse.add_standings(self.league.standings(scoring_period_number=3))
+        history = self.warehouse.standings_history(self.league.league_id, team.id)
+        self.assertEqual(sorted(history), [0, 2, 3])
+        only_period = self.warehouse.standings_history(self.league.league_id, team.id, only_period=True)
+        record = next(r for r in period.ranks.values() if r.team is team)
+        self.assertEqual(only_period, {3: (record.rank, record.win, record.loss, record.tie)})
+
+
+class _ServerAdapter(HTTPAdapter):
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url: str = url
+
+    def send(self, request: PreparedRequest, **kwargs: object) -> Response:
+        request.url = request.url.replace("https://www.fantrax.com", self.url, 1)
+        return super().send(request, **kwargs)
+
+
+class ReplayTest(unittest.TestCase):
+    def test_record_and_replay(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        with tempfile.TemporaryDirectory() as directory, MockServer(generator) as server:
+            session = RecordingSession(DirectoryStore(directory))
+            session.mount("https://www.fantrax.com", _ServerAdapter(server.url))
+            standings = League(generator.league_id, session=session).standings()
+            self.assertTrue(DirectoryStore(directory).keys())
+
+            league = League(generator.league_id, session=ReplaySession(directory))
+            self.assertEqual([r.team.id for r in league.standings().ranks.values()], [r.team.id for r in standings.ranks.values()])
+            with self.assertRaises(FantraxException):
+                league.transactions()
+
+
+class BatchTest(unittest.TestCase):
+    def test_plan_batches(self) -> None:
+        methods = [api.Method("getLiveScoringStats", date=f"2024-10-{d:02d}") for d in range(10, 15)] + [api.Method("getTradeBlocks") for _ in range(3)]
+        batches = api.plan_batches(methods, max_messages=2, max_response_bytes=900_000)
+        self.assertEqual(sorted(m for b in batches for m in map(id, b)), sorted(map(id, methods)))
+        self.assertTrue(all(len(b) <= 2 and sum(m.expected_bytes for m in b) <= 900_000 for b in batches))
+        self.assertEqual(len(api.plan_batches(methods, max_messages=10, max_response_bytes=10_000_000)), 1)
+        oversized = api.Method("getLiveScoringStats")
+        batches = api.plan_batches([oversized, api.Method("getTradeBlocks")], max_response_bytes=100_000)
+        self.assertIn([oversized], batches)
+        self.assertEqual(len(batches), 2)
+
+    def test_request_batched(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        session = SyntheticSession(generator)
+        league = League(generator.league_id, session=session)
+        posts = []
+        post = session.post
+        session.post = lambda url, **kwargs: posts.append(kwargs["json"]) or post(url, **kwargs)
+        days = [generator.days[i] for i in (3, 1, 2, 1)]
+        methods = [api.Method("getLiveScoringStats", date=day, newView=True) for day in days]
+        responses = api.request_batched(league, methods, max_messages=1, max_workers=2)
+        self.assertEqual(sum(len(p["msgs"]) for p in posts), 3)
+        self.assertEqual(len(posts), 3)
+        for day, response in zip(days, responses):
+            self.assertEqual(response, api.request(league, api.Method("getLiveScoringStats", date=day, newView=True)))
+        self.assertIs(responses[1], responses[3])
+        self.assertNotEqual(responses[0], responses[2])
+        self.assertEqual(api.request_batched(league, []), [])
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = []
+        self.addCleanup(instrumentation.remove_hook, self.events.append)
+
+    def test_hooks(self) -> None:
+        instrumentation.add_hook(self.events.append)
+        instrumentation.add_hook(self.events.append)
+        self.assertEqual(instrumentation.hooks.count(self.events.append), 1)
+        instrumentation.emit(instrumentation.BuildEvent("league", "Team"))
+        instrumentation.remove_hook(self.events.append)
+        instrumentation.remove_hook(self.events.append)
+        instrumentation.emit(instrumentation.BuildEvent("league", "Team"))
+        self.assertEqual(len(self.events), 1)
+
+    def test_failing_hook(self) -> None:
+        def failing(event: instrumentation.BuildEvent) -> None:
+            raise ValueError("hook failed")
+
+        instrumentation.add_hook(failing)
+        self.addCleanup(instrumentation.remove_hook, failing)
+        instrumentation.add_hook(self.events.append)
+        with self.assertLogs("fantraxapi.instrumentation", level="ERROR"):
+            instrumentation.emit(instrumentation.BuildEvent("league", "Team"))
+        self.assertEqual(len(self.events), 1)
+
+    def test_events(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4, transactions=30)
+        with MockServer(generator) as server:
+            league = League(generator.league_id, session=server.session())
+            instrumentation.add_hook(self.events.append)
+            transactions = league.transactions(count=30)
+        request, build = self.events
+        self.assertIsInstance(request, instrumentation.RequestEvent)
+        self.assertEqual(request.league_id, generator.league_id)
+        self.assertEqual(request.methods, ["getTransactionDetailsHistory"])
+        self.assertEqual(request.batch_size, 1)
+        self.assertEqual(request.status_code, 200)
+        self.assertGreater(request.request_bytes, 0)
+        self.assertGreater(request.response_bytes, request.request_bytes)
+        self.assertGreater(request.network_time, 0)
+        self.assertGreater(request.decode_time, 0)
+        self.assertEqual(request.decoder, api.decoder_name())
+        self.assertIsNone(request.error)
+        self.assertIsInstance(build, instrumentation.BuildEvent)
+        self.assertEqual(build.name, "Transaction")
+        self.assertEqual(build.count, len(transactions))
+        self.assertGreater(build.build_time, 0)
+        self.assertEqual(build.request_id, request.request_id)
+        self.assertEqual(build.methods, request.methods)
+
+    def test_build_linked_per_thread(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        instrumentation.add_hook(self.events.append)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda i: league.team_roster(league.teams[i % 4].id) if i % 2 else league.standings(), range(16)))
+        requests = {e.request_id: e for e in self.events if isinstance(e, instrumentation.RequestEvent)}
+        builds = [e for e in self.events if isinstance(e, instrumentation.BuildEvent)]
+        self.assertEqual(len(requests), 16)
+        self.assertEqual(sorted(b.request_id for b in builds), sorted(requests))
+        for event in builds:
+            self.assertEqual(set(requests[event.request_id].methods), {"getTeamRosterInfo"} if event.name == "Roster" else {"getStandings"})
+
+    def test_debug_deprecated(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        with self.assertLogs("fantraxapi.api", level="DEBUG") as logs:
+            league.standings()
+        self.assertTrue(any("Response JSON" in line for line in logs.output))
+        self.addCleanup(setattr, api, "debug", False)
+        api.debug = True
+        with self.assertWarns(DeprecationWarning):
+            league.standings()
+
+
+class TracingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.addCleanup(tracing.set_tracer, tracing.tracer)
+
+    def test_recording(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        tracer = tracing.RecordingTracer()
+        tracing.set_tracer(tracer)
+        league.standings()
+        root = tracer.spans[-1]
+        self.assertEqual(root.name, "League.standings")
+        self.assertEqual([child.name for child in root.children], ["api._request", "build Standings"])
+        self.assertEqual(root.children[0].attributes["methods"], "getStandings")
+        self.assertGreaterEqual(root.duration, sum(child.duration for child in root.children))
+        self.assertIn("  build Standings", tracer.report())
+
+    def test_traced(self) -> None:
+        @tracing.traced
+        def outer() -> int:
+            with tracing.span("inner", value=1):
+                return 1
+
+        tracer = tracing.RecordingTracer()
+        tracing.set_tracer(tracer)
+        self.assertEqual(outer(), 1)
+        self.assertEqual(tracer.spans[0].name, outer.__qualname__)
+        self.assertEqual(tracer.spans[0].children[0].attributes, {"value": 1})
+
+    def test_no_tracer(self) -> None:
+        tracing.set_tracer(None)
+        self.assertIs(tracing.span("a"), tracing.span("b"))
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        self.assertEqual(len(league.standings().ranks), 4)
+        with tracing.Tracer().span("base") as recorded:
+            self.assertIsNone(recorded)
+
+
+class JSONDecodeTest(unittest.TestCase):
+    content = b'{"responses":[{"data":{"name":"St\xc3\xbctzle","points":[1.5,2]}}]}'
+
+    def setUp(self) -> None:
+        self.addCleanup(setattr, api, "orjson", api.orjson)
+        self.addCleanup(setattr, api, "fast_json", api.fast_json)
+
+    def _invalid_body(self) -> None:
+        method = api.Method("getStandings")
+        request = {"msgs": [method.msg_block("league")]}
+        store = MemoryStore()
+        store.put(request_key(request), RecordedResponse("league", request, 200, "OK", b"<html>Service Unavailable</html>"))
+        with self.assertRaises(FantraxException):
+            api._request("league", method, session=ReplaySession(store))
+
+    def test_json_fallback(self) -> None:
+        api.orjson = None
+        self.assertEqual(api.decoder_name(), "json")
+        self.assertEqual(api.loads(self.content)["responses"][0]["data"]["name"], "Stützle")
+        self._invalid_body()
+
+    @unittest.skipIf(api.orjson is None, "orjson is not installed")
+    def test_orjson(self) -> None:
+        api.fast_json = True
+        self.assertEqual(api.decoder_name(), "orjson")
+        self.assertEqual(api.loads(self.content), json.loads(self.content))
+        self._invalid_body()
+        api.fast_json = False
+        self.assertEqual(api.decoder_name(), "json")
+        self.assertEqual(api.loads(self.content), json.loads(self.content))
+
+
+class MatchupTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=12, periods=4)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        cls.result = next(iter(league.scoring_period_results().values()))
+        cls.away, cls.home = league.teams[0], league.teams[1]
+
+    def matchup(self, away_score: str, home_score: str) -> Matchup:
+        data = [{"teamId": self.away.id}, {"content": away_score}, {"teamId": self.home.id}, {"content": home_score}]
+        return Matchup(self.result, 0, data)
+
+    def test_tie(self) -> None:
+        matchup = self.matchup("10.5", "10.50")
+        self.assertEqual(matchup.winner(), (None, None, None, None))
+        self.assertEqual(matchup.difference(), 0.0)
+
+    def test_scores(self) -> None:
+        matchup = self.matchup("1,234.5", "1,230.25")
+        self.assertEqual(matchup.away_score, 1234.5)
+        self.assertEqual(matchup.winner(), (self.away, 1234.5, self.home, 1230.25))
+        self.assertEqual(matchup.difference(), 4.25)
+        matchup = self.matchup("0.1", "0.3")
+        self.assertEqual(matchup.winner()[0], self.home)
+        self.assertEqual(matchup.difference(), 0.2)
+
+    def test_negative(self) -> None:
+        matchup = self.matchup("-2.5", "-10")
+        self.assertEqual((matchup.away_score, matchup.home_score), (-2.5, -10.0))
+        self.assertEqual(matchup.winner()[0], self.away)
+        self.assertEqual(matchup.difference(), 7.5)
+
+    def test_invalid(self) -> None:
+        for content in ("-", "", "abc", "1.2.3"):
+            with self.assertRaises(FantraxException):
+                self.matchup(content, "10")
+
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.generator = LeagueGenerator(teams=6, roster_size=14, periods=6, transactions=20)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_record_and_replay(self) -> None:
+        with Archive(self.directory.name, segment_size=5_000) as archive:
+            league = League(self.generator.league_id, session=SyntheticSession(self.generator, store=archive))
+            standings = league.standings()
+            league.transactions()
+        with Archive(self.directory.name) as archive:
+            self.assertGreater(len({e.segment for e in archive.entries}), 1)
+            self.assertTrue(archive.find(method="getStandings"))
+            self.assertEqual(len(archive.find(league_id="other")), 0)
+            self.assertEqual(len(list(archive.stream())), len(archive))
+            offline = League(self.generator.league_id, session=ReplaySession(archive))
+            self.assertEqual(len(offline.standings().ranks), len(standings.ranks))
+
+    def test_latest_and_history(self) -> None:
+        with Archive(self.directory.name) as archive:
+            archive.append("getStandings-0", RecordedResponse("a", {}, 200, "OK", b"new"), fetched_at=2.0)
+            archive.append("getStandings-0", RecordedResponse("a", {}, 200, "OK", b"old"), fetched_at=1.0)
+            self.assertEqual([e.fetched_at for e in archive.history("getStandings-0")], [1.0, 2.0])
+            self.assertEqual(archive.get("getStandings-0").content, b"new")
+
+    def test_torn_index(self) -> None:
+        with Archive(self.directory.name) as archive:
+            archive.append("getStandings-0", RecordedResponse("a", {}, 200, "OK", b"{}"))
+            archive.append("getStandings-1", RecordedResponse("a", {}, 200, "OK", b"{}"))
+        index = os.path.join(self.directory.name, "index.bin")
+        with open(index, "r+b") as f:
+            f.truncate(os.path.getsize(index) - 3)
+        with Archive(self.directory.name) as archive:
+            self.assertEqual(archive.keys(), ["getStandings-0"])
+
+
+class RosterHistoryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=16, periods=3, days_per_period=7)
+        cls.league = League(generator.league_id, session=SyntheticSession(generator))
+        cls.team = cls.league.teams[0]
+        cls.snapshots = {}
+        cls.history = RosterHistory(cls.team.id, keyframe_interval=5)
+        for day in sorted(cls.league.scoring_dates):
+            roster = cls.league.team_roster(cls.team.id, period_number=day)
+            cls.snapshots[day] = RosterSnapshot.from_roster(roster)
+            cls.history.add(roster)
+
+    def test_reconstruct(self) -> None:
+        for day, snapshot in self.snapshots.items():
+            self.assertEqual(self.history.snapshot(day), snapshot)
+        self.assertEqual(self.history.snapshot_on(self.snapshots[3].period_date), self.snapshots[3])
+
+    def test_serialize(self) -> None:
+        history = RosterHistory.from_bytes(self.history.to_bytes())
+        for day, snapshot in self.snapshots.items():
+            self.assertEqual(history.snapshot(day), snapshot)
+
+    def test_out_of_order(self) -> None:
+        history = RosterHistory(self.team.id, keyframe_interval=3)
+        for day in reversed(list(self.snapshots)):
+            history.add(self.snapshots[day])
+        self.assertEqual(history.periods, sorted(self.snapshots))
+        self.assertEqual(history.snapshot(10), self.snapshots[10])
+
+    def test_encoded_size(self) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=16, periods=10, days_per_period=7, seed=3)
+        league = League(generator.league_id, session=SyntheticSession(generator))
+        history = RosterHistory(league.teams[0].id)
+        snapshots = []
+        for day in sorted(league.scoring_dates):
+            roster = league.team_roster(league.teams[0].id, period_number=day)
+            history.add(roster)
+            snapshots.append(RosterSnapshot.from_roster(roster))
+        data = history.to_dict()
+        self.assertTrue(all(len(slot) == 2 for entry in data["entries"] for key in ("s", "a", "m") for slot in entry.get(key, {}).values()))
+        full = json.dumps([{"p": s.period_number, "d": s.period_date.isoformat(), "s": s.players, "e": s.empty} for s in snapshots], separators=(",", ":")).encode()
+        encoded = history.to_bytes()
+        self.assertLess(len(encoded) * 8, len(full))
+        self.assertLess(len(encoded), len(zlib.compress(full)) * 0.75)
+        self.assertEqual(RosterHistory.from_bytes(encoded).snapshot(snapshots[40].period_number), snapshots[40])
+
+    def test_changes(self) -> None:
+        first, last = min(self.snapshots), max(self.snapshots)
+        changes = self.history.changes(first, last)
+        self.assertEqual(set(changes.points), set(self.snapshots[first].players) & set(self.snapshots[last].players))
+        self.assertTrue(all(points >= 0 for points in changes.points.values()))
+
+
+class BulkParseTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=14, periods=3, transactions=30)
+        cls.store = MemoryStore()
+        cls.league = League(generator.league_id, session=SyntheticSession(generator, store=cls.store))
+        cls.rosters = {day: cls.league.team_roster(cls.league.teams[0].id, period_number=day) for day in (2, 9)}
+        cls.live = cls.league.live_scores(cls.league.scoring_dates[3])
+        cls.transactions = cls.league.transactions(count=30)
+        cls.league.standings()
+
+    def test_in_process(self) -> None:
+        self._check(bulk_parse(self.store, leagues=self.league, max_workers=1))
+
+    def test_process_pool(self) -> None:
+        self._check(bulk_parse(self.store, leagues=self.league, max_workers=2, chunksize=1))
+
+    def _check(self, parsed: list) -> None:
+        self.assertFalse([p.error for p in parsed if p.error])
+        kinds = {p.kind for p in parsed}
+        self.assertTrue({"roster", "live_scores", "standings", "transactions"} <= kinds)
+        for result in parsed:
+            built = build(self.league, result)
+            if result.kind == "roster":
+                expected = self.rosters[built.period_number]
+                self.assertEqual([str(r) for r in built.rows], [str(r) for r in expected.rows])
+                self.assertEqual([r.future_games for r in built.rows], [r.future_games for r in expected.rows])
+            elif result.kind == "live_scores":
+                self.assertEqual({t: [(p.id, p.points) for p in ps] for t, ps in built.items()}, {t: [(p.id, p.points) for p in ps] for t, ps in self.live.items()})
+            elif result.kind == "transactions":
+                self.assertEqual([t.id for t in built], [t.id for t in self.transactions])
+
+
+class SerializeTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.generator = LeagueGenerator(teams=6, roster_size=14, periods=6, transactions=20)
+        cls.league = League(cls.generator.league_id, session=SyntheticSession(cls.generator))
+
+    def test_roster(self) -> None:
+        roster = self.league.team_roster(self.league.teams[0].id)
+        data = serialize.dumps(roster)
+        loaded = serialize.loads(data, self.league)
+        self.assertIs(loaded.league, self.league)
+        self.assertIs(loaded.team, self.league.teams[0])
+        self.assertIs(loaded.rows[0].roster, loaded)
+        self.assertIs(loaded.rows[0].position, roster.rows[0].position)
+        self.assertEqual([str(r) for r in loaded.rows], [str(r) for r in roster.rows])
+        self.assertEqual([r.future_games for r in loaded.rows], [r.future_games for r in roster.rows])
+
+    def test_collections(self) -> None:
+        objs = {"standings": self.league.standings(), "results": self.league.scoring_period_results(), "transactions": self.league.transactions()}
+        loaded = serialize.loads(serialize.dumps(objs), self.league)
+        self.assertEqual(str(loaded["standings"]), str(objs["standings"]))
+        self.assertEqual([str(r) for r in loaded["results"].values()], [str(r) for r in objs["results"].values()])
+        self.assertIs(loaded["results"][1].period, self.league.scoring_periods[1])
+        self.assertEqual([t.id for t in loaded["transactions"]], [t.id for t in objs["transactions"]])
+
+    def test_other_league(self) -> None:
+        data = serialize.dumps(self.league.standings())
+        generator = LeagueGenerator(teams=6, roster_size=14, periods=6, league_id="other")
+        with self.assertRaises(FantraxException):
+            serialize.loads(data, League(generator.league_id, session=SyntheticSession(generator)))
+
+
+class ColumnsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = LeagueGenerator(teams=4, roster_size=14, periods=3)
+        cls.store = MemoryStore()
+        cls.league = League(generator.league_id, session=SyntheticSession(generator, store=cls.store))
+
+    def test_rosters(self) -> None:
+        table = columns.rosters(self.league, period_numbers=[2, 5])
+        expected = [self.league.team_roster(t.id, period_number=d) for d in (2, 5) for t in self.league.teams]
+        rows = [row for roster in expected for row in roster.rows]
+        self.assertEqual(len(table), len(rows))
+        self.assertEqual(table["player_id"], [r.player.id if r.player else None for r in rows])
+        self.assertEqual(table["position_id"], [r.position.id for r in rows])
+        self.assertEqual(set(table["date"]), {self.league.scoring_dates[2], self.league.scoring_dates[5]})
+
+    def test_live_scores_and_standings(self) -> None:
+        scoring_date = self.league.scoring_dates[3]
+        table = columns.live_scores(self.league, [scoring_date])
+        live = self.league.live_scores(scoring_date)
+        self.assertEqual(sorted(zip(table["player_id"], table["points"])), sorted((p.id, p.points) for ps in live.values() for p in ps))
+
+        standings = columns.standings(self.league)
+        self.assertEqual(list(standings["rank"]), [r.rank for r in self.league.standings().ranks.values()])
+        self.assertEqual(set(standings["scoring_period_number"]), {0})
+
+    def test_from_parsed(self) -> None:
+        columns.rosters(self.league, period_numbers=[4])
+        tables = columns.from_parsed(self.league, bulk_parse(self.store, leagues=self.league, max_workers=1))
+        self.assertIn("roster", tables)
+        self.assertIn(self.league.scoring_dates[4], set(tables["roster"]["date"]))
+
+    def test_concat(self) -> None:
+        table = columns.ColumnTable.concat([columns.standings(self.league), columns.standings(self.league)])
+        self.assertEqual(len(table), 2 * len(self.league.teams))
+        self.assertEqual(len(table.rows()), len(table))
+        with self.assertRaises(FantraxException):
+            columns.ColumnTable({"a": [1, 2], "b": [1]})
+
+
+class TableSchemaTest(unittest.TestCase):
+    def test_compile(self) -> None:
+        schema = TableSchema([Column("win", "win", integer, 0), Column("pct", "winpc", nullable(number, 0.0), 0.0), Column("streak", "streak", str, "")])
+        plan = schema.compile([{"key": "winpc"}, {"key": "win"}])
+        self.assertEqual(plan.row([{"content": "-"}, {"content": "1,024"}]), (1024, 0.0, ""))
+        self.assertEqual(plan.row([{"content": ".5"}]), (0, 0.5, ""))
+
+    def test_compile_all(self) -> None:
+        header = [{"shortName": "Opp", "eventStr": "Mon"}, {"shortName": "G"}, {"sortKey": "SCORE"}, {"shortName": "G"}]
+        plan = TableSchema.compile_all(header, skip=lambda h: bool(h.get("eventStr")))
+        self.assertEqual(plan.names, ("G", "SCORE"))
+        columns = plan.columns([[{"content": ""}, {"content": "2"}, {"content": "1,000.5"}], [{"content": ""}, {"content": "-"}]])
+        self.assertEqual(list(columns["G"])[0], 2.0)
+        self.assertNotEqual(columns["G"][1], columns["G"][1])
+        self.assertEqual(columns["SCORE"][0], 1000.5)
+        self.assertNotEqual(columns["SCORE"][1], columns["SCORE"][1])
+
+
+class SeasonCalendarTest(unittest.TestCase):
+    def test_resolve(self) -> None:
+        calendar = dates.season(date(2023, 10, 10), date(2024, 4, 18))
+        self.assertIs(calendar, dates.season(date(2023, 10, 10), date(2024, 4, 18)))
+        self.assertEqual(calendar.day("Mon 10/16"), date(2023, 10, 16))
+        self.assertEqual(calendar.day("Thu 2/29"), date(2024, 2, 29))
+        self.assertEqual(calendar.datetime("Jan 5, 8:30 PM", "%b %d, %I:%M %p"), datetime(2024, 1, 5, 20, 30))
+        with self.assertRaises(DateNotInSeason):
+            calendar.day("Mon 7/01")
+        with self.assertRaises(DateNotInSeason):
+            calendar.day("Today")
+
+
+class SearchIndexTest(unittest.TestCase):
+    def test_search(self) -> None:
+        index = SearchIndex()
+        index.add("1", "Tim Stützle", 1)
+        index.add("2", "Tim Stutzman", 2)
+        index.add("3", "Connor McDavid", 3)
+        index.add("4", "Tim", 4)
+        self.assertEqual(index.search("stutzle"), [1])
+        self.assertEqual(index.search("TIM"), [4, 1, 2])
+        self.assertEqual(index.search("stu"), [1, 2])
+        self.assertEqual(index.search("avi"), [3])
+        self.assertEqual(index.search("tim", limit=1), [4])
+        index.add("3", "Connor Bedard", 5)
+        self.assertEqual(index.search("mcdavid"), [])
+        self.assertEqual(index.search("bed"), [5])
+
+
+class LeagueManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.generators = [LeagueGenerator(teams=4, roster_size=12, periods=4, seed=i, league_id=f"league{i}") for i in range(4)]
+        self.server = MockServer(self.generators).start()
+        self.addCleanup(self.server.stop)
+
+    def test_fan_out(self) -> None:
+        league_ids = [g.league_id for g in self.generators]
+        with LeagueManager(league_ids + ["missing"], session=self.server.session(), max_workers=4) as manager:
+            self.assertEqual(sorted(manager.leagues), sorted(league_ids))
+            standings = manager.standings()
+            self.assertTrue(all(isinstance(s, Standings) for s in standings.values()))
+            league = manager[league_ids[0]]
+            days = [league.scoring_dates[d] for d in (1, 2, 3)]
+            live = manager.live_scores(days)
+            self.assertEqual(set(live), set(league_ids))
+            self.assertTrue(all(set(by_date) == set(days) for by_date in live.values()))
+            self.assertEqual(len(manager.transactions(count=10)), 4)
+
+    def test_fairness(self) -> None:
+        league_ids = [g.league_id for g in self.generators[:3]]
+        order = []
+        with LeagueManager(league_ids, session=self.server.session(), max_workers=1) as manager:
+            manager.map_each(lambda league, i: order.append(league.league_id), range(3))
+        self.assertEqual(order, league_ids * 3)
+
+    def test_connection_error(self) -> None:
+        server_session = self.server.session()
+        failing = set()
+
+        def request(method: str, url: str, *args: object, **kwargs: object) -> Response:
+            if kwargs.get("params", {}).get("leagueId") in failing:
+                raise RequestsConnectionError("connection reset")
+            return server_session.request(method, url, *args, **kwargs)
+
+        session = Session()
+        session.request = request
+        league_ids = [g.league_id for g in self.generators]
+        failing.add(league_ids[0])
+        with LeagueManager(league_ids, session=session, max_workers=2) as manager:
+            self.assertEqual(sorted(manager.leagues), league_ids[1:])
+            failing.clear()
+            manager.add(league_ids[0])
+            failing.add(league_ids[1])
+            standings = manager.standings()
+        self.assertIsInstance(standings[league_ids[1]], FantraxException)
+        self.assertIsInstance(standings[league_ids[1]].__cause__, RequestsConnectionError)
+        self.assertTrue(all(isinstance(standings[league_id], Standings) for league_id in league_ids if league_id != league_ids[1]))
+
+    def test_rate_limiter(self) -> None:
+        limiter = RateLimiter(rate=50, burst=2)
+        start = time.monotonic()
+        for _ in range(7):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class CookieStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "fantrax.cookies")
+        self.logins = 0
+
+    def login(self) -> list[dict]:
+        self.logins += 1
+        return [{"name": "FX_RM", "value": f"token{self.logins}", "domain": ".fantrax.com", "path": "/", "expiry": time.time() + 3600}]
+
+    def test_shared(self) -> None:
+        CookieStore(self.path, login=self.login).apply(Session())
+        session = Session()
+        self.assertTrue(CookieStore(self.path, login=self.login).apply(session))
+        self.assertEqual(session.cookies.get("FX_RM"), "token1")
+        self.assertEqual(self.logins, 1)
+
+    def test_expiry(self) -> None:
+        store = CookieStore(self.path)
+        store.save([{"name": "FX_RM", "value": "old", "expiry": time.time() - 1}])
+        self.assertEqual(store.load(), [])
+        with self.assertRaises(FantraxException):
+            store.apply(Session())
+        store.save([{"name": "FX_RM", "value": "new"}])
+        self.assertEqual(len(store.load()), 1)
+        self.assertEqual(CookieStore(self.path, max_age=0).load(), [])
+
+    def test_refresh(self) -> None:
+        first, second = CookieStore(self.path, login=self.login), CookieStore(self.path, login=self.login)
+        session = Session()
+        first.apply(session)
+        second.apply(Session())
+        calls = []
+
+        def pending_trades() -> str:
+            calls.append(session.cookies.get("FX_RM"))
+            if len(calls) == 1:
+                raise NotLoggedIn("Not Logged in")
+            return "trades"
+
+        self.assertEqual(first.call(session, pending_trades), "trades")
+        self.assertEqual(calls, ["token1", "token2"])
+        second.apply(Session(), refresh=True)
+        self.assertEqual(self.logins, 2)
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_import(self) -> None:
+        code = (
+            "import sys, fantraxapi\n"
+            "assert 'requests' not in sys.modules and 'fantraxapi.objs' not in sys.modules\n"
+            "from fantraxapi import League, FantraxAPI, api\n"
+            "assert League is FantraxAPI and 'default_session' not in vars(api)\n"
+            "assert api.default_session is api.get_default_session()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()